@@ -1,12 +1,97 @@
+from collections import deque
+
+
 class Node:
-    def __init__(self, value, next_node):
+    __slots__ = ("value", "prev_node", "next_node")
+
+    def __init__(self, value, prev_node, next_node):
         self.value = value
+        self.prev_node = prev_node
         self.next_node = next_node
 
 
 class CyclicalLinkedList:
-    def __init__(self):
+    def __init__(self, capacity: int = None, aggregates: bool = False):
+        """
+        The nodes of the list are linked in a cycle in both directions, so the last node is the node before the head.
+        Pushing and popping at either end of the list take constant time, and rotating the list only moves the head.
+
+        If the list has a capacity, it is a bounded ring: appending to a full list overwrites its oldest (first) value in
+        place, and prepending to a full list drops its last value, like a deque with a maxlen.
+
+        If aggregates is set, the list keeps the sum, minimum and maximum of its values up to date as values are
+        appended and the oldest values are dropped, with a running sum and a monotonic deque of the candidates for the
+        minimum and the maximum. Used as a bounded ring, the list then gives the aggregates of a sliding window in
+        constant amortized time per value. Any other change to the list makes the aggregates be recomputed from the
+        values on their next use.
+        :param capacity: the maximum number of values in the list, or None for an unbounded list
+        :param aggregates: whether to keep window aggregates of the values
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("The capacity must be at least 1")
         self.head = None
+        self.size = 0
+        self.capacity = capacity
+
+        # the running sum and the monotonic deques of the window aggregates
+        self.aggregates = aggregates
+        self.aggregates_valid = True
+        self.total = 0
+        self.min_values = deque()
+        self.max_values = deque()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def locate(self, index: int) -> Node:
+        """
+        Finds the node at an index by walking from the head in whichever direction is shorter.
+        :param index: a valid, non-negative index of the list
+        :return: the node at the index
+        """
+        curr_node = self.head
+        if index <= self.size // 2:
+            for _ in range(index):
+                curr_node = curr_node.next_node
+        else:
+            for _ in range(self.size - index):
+                curr_node = curr_node.prev_node
+        return curr_node
+
+    def link(self, value: any, next_node: Node) -> Node:
+        """
+        Links a new node into the cycle before a node, or as the only node of an empty list.
+        :param value: the value of the new node
+        :param next_node: the node after the new node, or None if the list is empty
+        :return: the new node
+        """
+        if next_node is None:
+            new_node = Node(value, None, None)
+            new_node.prev_node = new_node
+            new_node.next_node = new_node
+            self.head = new_node
+        else:
+            new_node = Node(value, next_node.prev_node, next_node)
+            next_node.prev_node.next_node = new_node
+            next_node.prev_node = new_node
+        self.size += 1
+        return new_node
+
+    def unlink(self, node: Node) -> any:
+        """
+        Removes a node from the cycle.
+        :param node: the removed node
+        :return: the value of the node
+        """
+        if self.size == 1:
+            self.head = None
+        else:
+            node.prev_node.next_node = node.next_node
+            node.next_node.prev_node = node.prev_node
+            if node is self.head:
+                self.head = node.next_node
+        self.size -= 1
+        return node.value
 
     def insert(self, index: int, value: any) -> None:
         """
@@ -17,53 +102,89 @@ class CyclicalLinkedList:
         """
         if index < 0:
             raise IndexError("The index cannot be negative")
+        if index > self.size:
+            raise IndexError(f"The index exceeds {self.size}, the maximum possible insertion index")
+        if self.capacity is not None and self.size == self.capacity:
+            raise IndexError("Cannot insert into a full list")
 
-        if index == 0:
-            self.head = Node(value, self.head)
-
-        if index > 0:
-            prev_node = None
-            curr_node = self.head
-            curr_index = 0
-            while (curr_node is not None) and (curr_index < index):
-                prev_node = curr_node
-                curr_node = curr_node.next_node
-                curr_index += 1
-
-            if curr_index < index:
-                raise IndexError(f"The index exceeds {curr_index}, the maximum possible insertion index")
-            else:
-                new_node = Node(value, curr_node)
-                prev_node.next_node = new_node
+        if index == self.size:
+            self.link(value, self.head)
+        else:
+            new_node = self.link(value, self.locate(index))
+            if index == 0:
+                self.head = new_node
+        self.aggregates_valid = False
 
     def prepend(self, value: any) -> None:
         """
-        Inserts a value at the beginning of the list.
+        Inserts a value at the beginning of the list. If the list is full, its last value is dropped.
         :param value: the value to be inserted
         :return: None
         """
-        self.head = Node(value, self.head)
-        if self.head.next_node is None:
-            self.head.next_node = self.head
+        if self.capacity is not None and self.size == self.capacity:
+            self.head = self.head.prev_node
+            self.head.value = value
         else:
-            curr_node = self.head
-            while curr_node.next_node is not self.head.next_node:
-                curr_node = curr_node.next_node
-            curr_node.next_node = self.head
+            self.head = self.link(value, self.head)
+        self.aggregates_valid = False
 
     def append(self, value: any) -> None:
         """
-        Inserts a value at the end of the list.
+        Inserts a value at the end of the list. If the list is full, its oldest (first) value is overwritten instead, by
+        moving the head forward.
         :param value: the value to be inserted
         :return: None
         """
+        if self.capacity is not None and self.size == self.capacity:
+            if self.aggregates and self.aggregates_valid:
+                self.drop_aggregate(self.head.value)
+            self.head.value = value
+            self.head = self.head.next_node
+        else:
+            self.link(value, self.head)
+        if self.aggregates and self.aggregates_valid:
+            self.add_aggregate(value)
+
+    def pop(self) -> any:
+        """
+        Removes the value at the end of the list and returns it.
+        :return: the removed value
+        """
+        if self.head is None:
+            raise RuntimeError("Cannot pop from an empty list")
+        self.aggregates_valid = False
+        return self.unlink(self.head.prev_node)
+
+    def popleft(self) -> any:
+        """
+        Removes the value at the beginning of the list and returns it.
+        :return: the removed value
+        """
         if self.head is None:
-            self.head = Node(value, None)
+            raise RuntimeError("Cannot pop from an empty list")
+        value = self.unlink(self.head)
+        if self.aggregates and self.aggregates_valid:
+            self.drop_aggregate(value)
+        return value
+
+    def rotate(self, steps: int = 1) -> None:
+        """
+        Rotates the list to the right by a number of steps, so that the last value becomes the first for each step, or
+        to the left for a negative number of steps. Only the head moves: a rotation by one step takes constant time, and
+        a longer rotation walks in whichever direction is shorter.
+        :param steps: the number of steps
+        :return: None
+        """
+        if self.size == 0:
+            return
+        steps = steps % self.size
+        if steps <= self.size // 2:
+            for _ in range(steps):
+                self.head = self.head.prev_node
         else:
-            curr_node = self.head
-            while curr_node.next_node is not self.head:
-                curr_node = curr_node.next_node
-            curr_node.next_node = Node(value, self.head)
+            for _ in range(self.size - steps):
+                self.head = self.head.next_node
+        self.aggregates_valid = False
 
     def get(self, index: int) -> any:
         """
@@ -71,20 +192,17 @@ class CyclicalLinkedList:
         :param index: The index of node whose value will be returned.
         :return: None
         """
+        if self.head is None:
+            raise RuntimeError("Cannot get value from an empty list")
         if index < 0:
             raise IndexError("The index cannot be negative")
-        else:
-            curr_node = self.head
-            curr_index = 0
-            while curr_index < index:
-                curr_node = curr_node.next_node
-                curr_index += 1
-
-            return curr_node.value
+        if index >= self.size:
+            raise IndexError(f"The index exceeds {self.size - 1}, the maximum index in the list")
+        return self.locate(index).value
 
     def index(self, value: any) -> int:
         """
-        Returns the index of the first instance of the value in the interval of [start, end)
+        Returns the index of the first instance of the value in the list
         :param value: the value of a list node
         :return: the index of the first instance of value, or ValueError if none is found
         """
@@ -92,44 +210,113 @@ class CyclicalLinkedList:
             raise RuntimeError("Cannot find value in an empty list")
 
         curr_node = self.head
-        curr_index = 0
-        while curr_node is not None:
+        for curr_index in range(self.size):
             if curr_node.value == value:
                 return curr_index
-            else:
-                curr_node = curr_node.next_node
-                curr_index += 1
+            curr_node = curr_node.next_node
 
         raise ValueError(f"{value} is not in the list")
 
     def remove(self, index) -> None:
         """
-        Removes the node at a particular index of the list and returns its value.
+        Removes the node at a particular index of the list.
         :param index: The index of the node to be removes.
         :return: None
         """
         if self.head is None:
             raise RuntimeError("Cannot remove from an empty list")
-
         if index < 0:
             raise IndexError("The index cannot be negative")
-
+        if index >= self.size:
+            raise IndexError(f"The index exceeds {self.size - 1}, the maximum index in the list")
         if index == 0:
-            self.head = self.head.next_node
+            self.popleft()
+        else:
+            self.unlink(self.locate(index))
+            self.aggregates_valid = False
 
-        if index > 0:
-            prev_node = None
+    def add_aggregate(self, value: any) -> None:
+        """
+        Updates the window aggregates with a value appended to the list. The values in the monotonic deques which can
+        no longer be the minimum or the maximum, because the new value is newer and better, are dropped from their ends.
+        :param value: the appended value
+        :return: None
+        """
+        self.total += value
+        while self.min_values and self.min_values[-1] > value:
+            self.min_values.pop()
+        self.min_values.append(value)
+        while self.max_values and self.max_values[-1] < value:
+            self.max_values.pop()
+        self.max_values.append(value)
+
+    def drop_aggregate(self, value: any) -> None:
+        """
+        Updates the window aggregates with the oldest value of the list being dropped.
+        :param value: the dropped value
+        :return: None
+        """
+        self.total -= value
+        if self.min_values[0] == value:
+            self.min_values.popleft()
+        if self.max_values[0] == value:
+            self.max_values.popleft()
+
+    def rebuild_aggregates(self) -> None:
+        """
+        Recomputes the window aggregates from the values of the list, after a change other than appending a value or
+        dropping the oldest one.
+        :return: None
+        """
+        if not self.aggregates:
+            raise RuntimeError("The list does not keep window aggregates")
+        if not self.aggregates_valid:
+            self.total = 0
+            self.min_values.clear()
+            self.max_values.clear()
             curr_node = self.head
-            curr_index = 0
-            while (curr_node is not None) and (curr_index < index):
-                prev_node = curr_node
+            for _ in range(self.size):
+                self.add_aggregate(curr_node.value)
                 curr_node = curr_node.next_node
-                curr_index += 1
+            self.aggregates_valid = True
 
-            if curr_node is None:
-                raise IndexError(f"The index exceeds {curr_index - 1}, the maximum index in the list")
-            else:
-                prev_node.next_node = curr_node.next_node
+    def window_sum(self) -> any:
+        """
+        Gets the sum of the values in the list.
+        :return: the sum
+        """
+        self.rebuild_aggregates()
+        return self.total
+
+    def window_mean(self) -> float:
+        """
+        Gets the mean of the values in the list.
+        :return: the mean
+        """
+        self.rebuild_aggregates()
+        if self.size == 0:
+            raise RuntimeError("Cannot aggregate an empty list")
+        return self.total / self.size
+
+    def window_min(self) -> any:
+        """
+        Gets the minimum of the values in the list.
+        :return: the minimum
+        """
+        self.rebuild_aggregates()
+        if self.size == 0:
+            raise RuntimeError("Cannot aggregate an empty list")
+        return self.min_values[0]
+
+    def window_max(self) -> any:
+        """
+        Gets the maximum of the values in the list.
+        :return: the maximum
+        """
+        self.rebuild_aggregates()
+        if self.size == 0:
+            raise RuntimeError("Cannot aggregate an empty list")
+        return self.max_values[0]
 
     def stringify(self) -> str:
         """
@@ -138,15 +325,16 @@ class CyclicalLinkedList:
         """
         s = "HEAD\n V\n"
         curr_node = self.head
-        while curr_node is not None:
+        for _ in range(self.size):
             s = s + f"[{curr_node.value}] -> "
             curr_node = curr_node.next_node
-        s = s + "None"
+        s = s + "HEAD"
         return s
 
 
 if __name__ == "__main__":
-    sll = SinglyLinkedList()
+    cll = CyclicalLinkedList(capacity=3, aggregates=True)
     for i in range(5):
-        sll.insert(0, i)
-    print(sll.stringify())
+        cll.append(i)
+    print(cll.stringify())
+    print(cll.window_sum(), cll.window_mean(), cll.window_min(), cll.window_max())
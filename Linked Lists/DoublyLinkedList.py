@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("value", "prev_node", "next_node")
+
     def __init__(self, value, prev_node, next_node):
         self.value = value
         self.prev_node = prev_node
@@ -9,61 +11,58 @@ class DoublyLinkedList:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.size = 0
+
+        # the last accessed (index, node), or None
+        # the nodes are searched for from whichever of the head, the tail or the finger is closest
+        self.finger = None
+
+    def locate(self, index: int) -> Node:
+        """
+        Finds the node at an index by walking from whichever of the head, the tail or the finger is closest to it, and
+        moves the finger to the node.
+        :param index: a valid, non-negative index of the list
+        :return: the node at the index
+        """
+        curr_index, curr_node = 0, self.head
+        if self.size - 1 - index < index:
+            curr_index, curr_node = self.size - 1, self.tail
+        if self.finger is not None and abs(self.finger[0] - index) < abs(curr_index - index):
+            curr_index, curr_node = self.finger
+        while curr_index < index:
+            curr_node = curr_node.next_node
+            curr_index += 1
+        while curr_index > index:
+            curr_node = curr_node.prev_node
+            curr_index -= 1
+        self.finger = (index, curr_node)
+        return curr_node
 
     def insert(self, index: int, value: any) -> None:
         """
-        Inserts a value at a particular index of the list.
+        Inserts a value at a particular index of the list. A negative index counts from the end of the list, so an
+        index of -1 inserts the value at the end.
         :param index: the index where the value will be inserted
         :param value: the value of the new list node
         :return: None
         """
-        if index == 0:
-            self.head = Node(value, None, self.head)
-            if self.head.next_node is None:
-                self.tail = self.head
-            else:
-                self.head.next_node.prev_node = self.head
-
-        if index > 0:
-            curr_node = self.head
-            curr_index = 0
-            while (curr_node is not None) and (curr_index < index):
-                curr_node = curr_node.next_node
-                curr_index += 1
-
-            if curr_index < index:
-                raise IndexError(f"The index exceeds {curr_index}, the maximum possible insertion index")
-            else:
-                new_node = Node(value, curr_node.prev_node, curr_node)
-                new_node.prev_node.next_node = new_node
-                if curr_node is None:
-                    self.tail = new_node
-                else:
-                    curr_node.prev_node = new_node
-
-        if index == -1:
-            self.tail = Node(value, self.tail.prev_node, None)
-            if self.tail.prev_node is None:
-                self.head = self.tail
-            else:
-                self.tail.prev_node.next_node = self.tail
-
-        if index < -1:
-            curr_node = self.tail
-            curr_index = -1
-            while (curr_node is not None) and (curr_index > index):
-                curr_node = curr_node.prev_node
-                curr_index -= 1
+        if index > self.size:
+            raise IndexError(f"The index exceeds {self.size}, the maximum possible insertion index")
+        if index < -(self.size + 1):
+            raise IndexError(f"The index exceeds {-(self.size + 1)}, the minimum possible insertion index")
+        index = (index + self.size + 1) if index < 0 else index
 
-            if curr_index > index:
-                raise IndexError(f"The index exceeds {curr_index}, the minimum possible insertion index")
-            else:
-                new_node = Node(value, curr_node, curr_node.next_node)
-                new_node.next_node.prev_node = new_node
-                if curr_node is None:
-                    self.head = new_node
-                else:
-                    curr_node.next_node = new_node
+        if index == 0:
+            self.prepend(value)
+        elif index == self.size:
+            self.append(value)
+        else:
+            curr_node = self.locate(index)
+            new_node = Node(value, curr_node.prev_node, curr_node)
+            new_node.prev_node.next_node = new_node
+            curr_node.prev_node = new_node
+            self.size += 1
+            self.finger = (index, new_node)
 
     def prepend(self, value: any) -> None:
         """
@@ -76,6 +75,9 @@ class DoublyLinkedList:
             self.tail = self.head
         else:
             self.head.next_node.prev_node = self.head
+        self.size += 1
+        if self.finger is not None:
+            self.finger = (self.finger[0] + 1, self.finger[1])
 
     def append(self, value: any) -> None:
         """
@@ -88,6 +90,7 @@ class DoublyLinkedList:
             self.head = self.tail
         else:
             self.tail.prev_node.next_node = self.tail
+        self.size += 1
 
     def get(self, index: int) -> any:
         """
@@ -95,36 +98,13 @@ class DoublyLinkedList:
         :param index: The index of node whose value will be returned.
         :return: None
         """
-
         if self.head is None:
             raise RuntimeError("Cannot get value from an empty list")
-
-        if index < 0:
-            curr_node = self.tail
-            curr_index = -1
-            while (curr_node is not None) and (curr_index > index):
-                curr_node = curr_node.prev_node
-                curr_index -= 1
-
-            if curr_node is None:
-                raise IndexError(f"The index exceeds {curr_index + 1}, the minimum index in the list")
-            else:
-                return curr_node.value
-
-        if self.tail is None:
-            raise RuntimeError("Cannot get value from an empty list")
-
-        if index >= 0:
-            curr_node = self.head
-            curr_index = 0
-            while (curr_node is not None) and (curr_index < index):
-                curr_node = curr_node.next_node
-                curr_index += 1
-
-            if curr_node is None:
-                raise IndexError(f"The index exceeds {curr_index - 1}, the maximum index in the list")
-            else:
-                return curr_node.value
+        if index >= self.size:
+            raise IndexError(f"The index exceeds {self.size - 1}, the maximum index in the list")
+        if index < -self.size:
+            raise IndexError(f"The index exceeds {-self.size}, the minimum index in the list")
+        return self.locate(index % self.size).value
 
     def index(self, value: any) -> int:
         """
@@ -145,73 +125,36 @@ class DoublyLinkedList:
 
     def remove(self, index) -> None:
         """
-        Removes the node at a particular index of the list and returns its value.
+        Removes the node at a particular index of the list.
         :param index: The index of the node to be removes.
         :return: None
         """
         if self.head is None:
             raise RuntimeError("Cannot remove from an empty list")
-
-        if index == 0:
-            self.head = self.head.next_node
-            if self.head is None:
-                self.tail = None
-            else:
-                self.head.prev_node = None
-
-        if index > 0:
-            curr_node = self.head
-            curr_index = 0
-            while (curr_node is not None) and (curr_index < index):
-                curr_node = curr_node.next_node
-                curr_index += 1
-
-            if curr_node is None:
-                raise IndexError(f"The index exceeds {curr_index - 1}, the maximum index in the list")
-            else:
-                if curr_node.prev_node is None:
-                    self.head = curr_node.next_node
-                    self.head.prev_node = None
-                else:
-                    curr_node.prev_node.next_node = curr_node.next_node
-
-                if curr_node.next_node is None:
-                    self.tail = curr_node.prev_node
-                    self.tail.next_node = None
-                else:
-                    curr_node.next_node.prev_node = curr_node.prev_node
-
-        if self.tail is None:
-            raise RuntimeError("Cannot remove from an empty list")
-
-        if index == -1:
-            self.tail = self.tail.prev_node
-            if self.tail is None:
-                self.head = None
-            else:
-                self.tail.next_node = None
-
-        if index < -1:
-            curr_node = self.tail
-            curr_index = 0
-            while (curr_node is not None) and (curr_index > index):
-                curr_node = curr_node.prev_node
-                curr_index -= 1
-
-            if curr_node is None:
-                raise IndexError(f"The index exceeds {curr_index + 1}, the minimum index in the list")
-            else:
-                if curr_node.prev_node is None:
-                    self.head = curr_node.next_node
-                    self.head.prev_node = None
-                else:
-                    curr_node.prev_node.next_node = curr_node.next_node
-
-                if curr_node.next_node is None:
-                    self.tail = curr_node.prev_node
-                    self.tail.next_node = None
-                else:
-                    curr_node.next_node.prev_node = curr_node.prev_node
+        if index >= self.size:
+            raise IndexError(f"The index exceeds {self.size - 1}, the maximum index in the list")
+        if index < -self.size:
+            raise IndexError(f"The index exceeds {-self.size}, the minimum index in the list")
+        index = index % self.size
+
+        curr_node = self.locate(index)
+        if curr_node.prev_node is None:
+            self.head = curr_node.next_node
+        else:
+            curr_node.prev_node.next_node = curr_node.next_node
+        if curr_node.next_node is None:
+            self.tail = curr_node.prev_node
+        else:
+            curr_node.next_node.prev_node = curr_node.prev_node
+        self.size -= 1
+
+        # the finger is moved to a neighbour of the removed node
+        if curr_node.prev_node is not None:
+            self.finger = (index - 1, curr_node.prev_node)
+        elif curr_node.next_node is not None:
+            self.finger = (0, curr_node.next_node)
+        else:
+            self.finger = None
 
     def print_list(self) -> None:
         """
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("value", "next_node")
+
     def __init__(self, value, next_node):
         self.value = value
         self.next_node = next_node
@@ -0,0 +1,89 @@
+"""
+Measures the memory used per element by the linked lists, with the nodes stored in an instance dictionary (as they were
+before the nodes used __slots__) and with __slots__ nodes, and the effect of a NodePool on a list which repeatedly
+inserts and removes nodes.
+
+Usage: python benchmarks/linked_list_memory.py [number of elements]
+"""
+from library.singly_linked_list import SinglyLinkedList
+from library.doubly_linked_list import DoublyLinkedList, DoublyLinkedListNode
+from library.node_pool import NodePool
+from time import perf_counter
+import sys
+import tracemalloc
+
+
+class DictSinglyLinkedListNode:
+    def __init__(self, val, nxt):
+        self.val = val
+        self.nxt = nxt
+
+
+class DictDoublyLinkedListNode:
+    def __init__(self, val, prv, nxt):
+        self.val = val
+        self.prv = prv
+        self.nxt = nxt
+
+
+class DictSinglyLinkedList(SinglyLinkedList):
+    def new_node(self, val, nxt):
+        return DictSinglyLinkedListNode(val, nxt)
+
+
+class DictDoublyLinkedList(DoublyLinkedList):
+    def new_node(self, val, prv, nxt):
+        return DictDoublyLinkedListNode(val, prv, nxt)
+
+
+def bytes_per_element(build, n: int) -> float:
+    """
+    Measures the memory allocated per element while building a list of n elements.
+
+    :param build: a function (or class) building the list from an iterable
+    :param n: the number of elements
+    :return: the number of bytes per element
+    """
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    built = build(range(n))
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del built
+    return used / n
+
+
+def churn(pool, n: int) -> tuple:
+    """
+    Keeps a DoublyLinkedList at 1000 elements while appending and popping n elements at the ends.
+
+    :param pool: the NodePool of the list, or None
+    :param n: the number of appended and popped elements
+    :return: the elapsed time and the number of nodes allocated by the pool
+    """
+    test_list = DoublyLinkedList(range(1000), pool)
+    start = perf_counter()
+    for i in range(n):
+        test_list.append(i)
+        test_list.pop(0)
+    return perf_counter() - start, (n + 1000 if pool is None else pool.allocated)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"bytes per element ({n} elements):")
+    print(f"{'':24}{'__dict__ nodes':>16}{'__slots__ nodes':>18}")
+    for name, dict_list, slots_list in [("SinglyLinkedList", DictSinglyLinkedList, SinglyLinkedList),
+                                        ("DoublyLinkedList", DictDoublyLinkedList, DoublyLinkedList)]:
+        before = bytes_per_element(dict_list, n)
+        after = bytes_per_element(slots_list, n)
+        print(f"{name:24}{before:16.1f}{after:18.1f}")
+
+    print(f"\nDoublyLinkedList append/pop churn ({n} operations):")
+    for name, pool in [("no pool", None), ("NodePool", NodePool(DoublyLinkedListNode))]:
+        elapsed, allocated = churn(pool, n)
+        print(f"{name:24}{elapsed:8.3f} s {allocated:10} nodes allocated")
+
+
+if __name__ == "__main__":
+    main()
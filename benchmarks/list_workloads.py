@@ -0,0 +1,72 @@
+"""
+Compares the UnrolledLinkedList with the SinglyLinkedList, the DoublyLinkedList and the ArrayList on three workloads:
+iterating over the list, appending to the list, and inserting into the middle of the list.
+
+Usage: python benchmarks/list_workloads.py [number of elements]
+"""
+from library.array_list import ArrayList
+from library.doubly_linked_list import DoublyLinkedList
+from library.singly_linked_list import SinglyLinkedList
+from library.unrolled_linked_list import UnrolledLinkedList
+from time import perf_counter
+import sys
+
+LIST_CLASSES: list = [SinglyLinkedList, DoublyLinkedList, ArrayList, UnrolledLinkedList]
+
+
+def iteration(list_class: type, n: int) -> float:
+    """
+    Times a full iteration over a list of n elements.
+
+    :param list_class: the class of the list
+    :param n: the number of elements
+    :return: the elapsed time
+    """
+    test_list = list_class(range(n))
+    start = perf_counter()
+    for _ in test_list:
+        pass
+    return perf_counter() - start
+
+
+def append(list_class: type, n: int) -> float:
+    """
+    Times appending n elements to an empty list one at a time.
+
+    :param list_class: the class of the list
+    :param n: the number of elements
+    :return: the elapsed time
+    """
+    test_list = list_class()
+    start = perf_counter()
+    for i in range(n):
+        test_list.append(i)
+    return perf_counter() - start
+
+
+def middle_insert(list_class: type, n: int) -> float:
+    """
+    Times inserting n / 10 elements into the middle of a list of n elements.
+
+    :param list_class: the class of the list
+    :param n: the number of elements
+    :return: the elapsed time
+    """
+    test_list = list_class(range(n))
+    start = perf_counter()
+    for i in range(n // 10):
+        test_list.insert(len(test_list) // 2, i)
+    return perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"seconds per workload ({n} elements):")
+    print(f"{'':20}" + "".join(f"{list_class.__name__:>22}" for list_class in LIST_CLASSES))
+    for workload in [iteration, append, middle_insert]:
+        times = [workload(list_class, n) for list_class in LIST_CLASSES]
+        print(f"{workload.__name__:20}" + "".join(f"{elapsed:22.4f}" for elapsed in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,237 @@
-from collections.abc import Sequence, Iterable
-from typing import Union, Any
-from math import ceil
+from array import array as typed_array, typecodes
+from collections.abc import Sequence, Iterable, Iterator, Sized
+from itertools import islice
+from mmap import mmap, ACCESS_READ, ACCESS_WRITE
+from operator import countOf, indexOf
+from pickle import PickleBuffer
+from struct import Struct, error as struct_error
+from typing import Union, Any, Optional
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# the header of a file-backed or serialized Array: a magic number, the typecode, and the number of elements
+# the header is 16 bytes long so that the elements after it stay aligned
+MAPPED_MAGIC: bytes = b"ARRY"
+MAPPED_HEADER: Struct = Struct("<4sc3xQ")
+
+
+def allocate(size: int, typecode: Optional[str] = None, dtype: Any = None) -> Union[list, typed_array, Any]:
+    """
+    Allocates the storage for an Array. Untyped storage is a python list filled with None. Typed storage is a
+    contiguous array.array of the given typecode, or a numpy ndarray of the given dtype, filled with zeros.
+
+    :param size: the number of elements in the storage
+    :param typecode: the array.array typecode of the elements, or None
+    :param dtype: the numpy dtype of the elements, or None
+    :return: the storage container
+    """
+    if dtype is not None:
+        if numpy is None:
+            raise ImportError("numpy is required for an array with a dtype")
+        return numpy.zeros(size, dtype=dtype)
+    if typecode is None:
+        return [None] * size
+    return typed_array(typecode, bytes(size * typed_array(typecode).itemsize))
+
+
+def copy_slice(elements: Union[list, typed_array, Any], index: slice) -> Union[list, typed_array, Any]:
+    """
+    Copies a slice of the storage of an Array. Slicing a list or an array.array already copies, but slicing buffer-backed
+    storage such as an ndarray only creates a view, so it is copied explicitly.
+
+    :param elements: the storage container
+    :param index: the slice
+    :return: a copy of the elements in the slice
+    """
+    if isinstance(elements, (list, typed_array)):
+        return elements[index]
+    if isinstance(elements, memoryview):
+        elements_slice = typed_array(elements.format)
+        elements_slice.frombytes(elements[index].tobytes())
+        return elements_slice
+    return elements[index].copy()
+
+
+def rebuild_array(typecode: Optional[str], dtype: Any, elements: Any) -> "Array":
+    """
+    Rebuilds a pickled Array from its storage. Typed elements may arrive as an out-of-band buffer.
+
+    :param typecode: the array.array typecode of the elements, or None
+    :param dtype: the numpy dtype of the elements, or None
+    :param elements: a list of the elements, an ndarray of the elements, or a buffer of the typed elements
+    :return: the Array
+    """
+    array = Array(0, typecode, dtype)
+    if typecode is not None:
+        array.elements.frombytes(memoryview(elements).cast("B"))
+    else:
+        array.elements = elements
+    array.size = len(array.elements)
+    return array
+
+
+def storage_typecode(typecode: Optional[str], dtype: Any) -> str:
+    """
+    Finds the array.array typecode describing the typed storage of an Array.
+
+    :param typecode: the array.array typecode of the elements, or None
+    :param dtype: the numpy dtype of the elements, or None
+    :return: the typecode
+    """
+    if typecode is not None:
+        return typecode
+    if dtype is not None and dtype.char in typecodes:
+        return dtype.char
+    raise TypeError("only a typed array can be converted to bytes")
 
 
 class Array(Sequence):
-    def __init__(self, size: int) -> None:
+    def __init__(self, size: int = 0, typecode: Optional[str] = None, dtype: Any = None) -> None:
         """
         This array implementation uses a python list as the container of the elements. It is not a "real" array, but
         behaves like one. The primary characteristic being that the length is fixed.
 
+        If a typecode is given (any typecode accepted by the array module, e.g. "d" for doubles or "q" for signed
+        64-bit integers), the elements are instead stored unboxed in a contiguous array.array buffer. Typed elements
+        are initialized to zero rather than None, and buffer() exposes the storage as a memoryview so that it can be
+        shared with other code without copying (bytes() copies it). On Python 3.12+ the Array also implements the
+        buffer protocol itself, so memoryview(array) works as well. If a numpy dtype is given instead, the elements are
+        stored in a numpy ndarray in the same way.
+
+        A typed Array can also be mapped onto a file with from_file() or open(), in which case the elements are read from
+        and written to the pages of the file on demand (see from_file).
+
         Implements abstract methods from Sequence:
         __getitem__, __setitem__, __delitem__, __len__
 
-        Includes mixin methods from Sequence:
+        Overrides mixin methods from Sequence:
         __contains__, __iter__, __reversed__, index, count
 
         Overrides methods from object:
         __repr__
 
         :param size: the size of the array
+        :param typecode: the array.array typecode of the elements, or None to store arbitrary objects
+        :param dtype: the numpy dtype of the elements, or None to store arbitrary objects
         """
         self.size: int = size
-        self.elements: list = [None for _ in range(size)]
+        self.typecode: Optional[str] = typecode
+        self.elements: Union[list, typed_array, Any] = allocate(size, typecode, dtype)
+        self.dtype: Any = None if dtype is None else self.elements.dtype
+        self.mapping: Optional[mmap] = None
+
+        # the number of lists sharing the array (see ArrayList.copy)
+        self.owners: int = 1
+
+    @classmethod
+    def from_file(cls, path: str, typecode: str, size: int) -> "Array":
+        """
+        Maps a typed Array of a fixed size onto a file. If the file does not exist, it is created with zeroed elements.
+        If it does exist, it must hold an Array with the same typecode and size. The elements are paged in from the file
+        as they are accessed, and writes to the Array are written to the file without an explicit save, so the Array
+        may be larger than the available memory. Slices of a mapped Array are copied into memory.
+
+        :param path: the path of the file
+        :param typecode: the array.array typecode of the elements
+        :param size: the size of the array
+        :return: the Array mapped onto the file
+        """
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                file.write(MAPPED_HEADER.pack(MAPPED_MAGIC, typecode.encode(), size))
+                file.truncate(MAPPED_HEADER.size + size * typed_array(typecode).itemsize)
+        array = cls.open(path)
+        if array.typecode != typecode or array.size != size:
+            message = f"{path} holds an array of typecode {array.typecode!r} and size {array.size}"
+            array.close()
+            raise ValueError(message)
+        return array
+
+    @classmethod
+    def open(cls, path: str, readonly: bool = False) -> "Array":
+        """
+        Maps an existing file created by from_file() onto a typed Array. A read-only mapping can be shared by several
+        processes mapping the same file, and raises a TypeError on any write.
+
+        :param path: the path of the file
+        :param readonly: whether to map the file read-only
+        :return: the Array mapped onto the file
+        """
+        error = ValueError(f"{path} does not hold a mapped array")
+        with open(path, "rb" if readonly else "r+b") as file:
+            try:
+                mapping = mmap(file.fileno(), 0, access=ACCESS_READ if readonly else ACCESS_WRITE)
+            except ValueError:
+                # an empty file cannot be mapped
+                raise error from None
+
+        # the header is validated field by field before it is used, and the mapping is closed on any failure
+        try:
+            if len(mapping) < MAPPED_HEADER.size:
+                raise error
+            magic, typecode, size = MAPPED_HEADER.unpack_from(mapping)
+            if magic != MAPPED_MAGIC:
+                raise error
+            typecode = typecode.decode("ascii")
+            if typecode not in typecodes:
+                raise error
+            end = MAPPED_HEADER.size + size * typed_array(typecode).itemsize
+            if len(mapping) < end:
+                raise error
+        except (ValueError, struct_error) as exception:
+            mapping.close()
+            if exception is error:
+                raise
+            raise error from exception
+        array = cls(0, typecode)
+        array.elements = memoryview(mapping)[MAPPED_HEADER.size:end].cast(typecode)
+        array.size = size
+        array.mapping = mapping
+        return array
+
+    def flush(self) -> None:
+        """
+        Writes any modified pages of a file-backed Array to the file.
+
+        :return: None
+        """
+        if self.mapping is not None:
+            self.mapping.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps a file-backed Array, which becomes empty. Any views or buffers of the Array must be released
+        before it can be closed.
+
+        :return: None
+        """
+        if self.mapping is not None:
+            self.flush()
+            self.elements.release()
+            self.mapping.close()
+            self.mapping = None
+            self.elements = allocate(0, self.typecode)
+            self.size = 0
+
+    def __enter__(self) -> "Array":
+        """
+        Allows a file-backed Array to be used as a context manager which closes it on exit.
+
+        :return: the Array
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Closes the Array when leaving the context.
+
+        :return: None
+        """
+        self.close()
 
     def __repr__(self) -> str:
         """
@@ -48,6 +258,74 @@ class Array(Sequence):
         """
         return self.size
 
+    # Overrides Sequence mixin methods for efficiency:
+    # The mixin implementations of __iter__(), __reversed__(), __contains__(),
+    # index() and count() read the elements one at a time through
+    # __getitem__(), paying for its type and bounds checks on every element.
+    # Instead, they iterate over the storage container directly, and the
+    # searches run over a numpy ndarray as a single vectorized comparison.
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which reads the storage of the Array directly.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the Array
+        """
+        return iter(self.elements)
+
+    def __reversed__(self) -> Iterator:
+        """
+        Creates a reverse iterator which reads the storage of the Array directly.
+        Overrides mixin method in Sequence.
+
+        :return: a reverse iterator for the Array
+        """
+        return reversed(self.elements)
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks whether a value is in the Array.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: whether the value is in the Array
+        """
+        return value in self.elements
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the index of the first instance of a value in the interval [start, stop) of the Array.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :param start: the start (inclusive) of the searched interval
+        :param stop: the end (exclusive) of the searched interval
+        :return: the index of the first instance of the value
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if self.dtype is not None:
+            matches = numpy.flatnonzero(self.elements[start:stop] == value)
+            if len(matches) > 0:
+                return start + int(matches[0])
+        elif start < stop:
+            try:
+                return start + indexOf(islice(self.elements, start, stop), value)
+            except ValueError:
+                pass
+        raise ValueError(f"{value} is not in array")
+
+    def count(self, value: Any) -> int:
+        """
+        Counts the instances of a value in the Array.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        if self.dtype is not None:
+            return int(numpy.count_nonzero(self.elements == value))
+        return countOf(self.elements, value)
+
     def __getitem__(self, index: Union[int, slice]) -> Union[Any, Sequence]:
         """
         Retrieves the element in an index or the Array of elements in a slice of the current Array.
@@ -65,14 +343,11 @@ class Array(Sequence):
             raise IndexError("array index out of range")
 
         # if the index is a slice, return a new Array with the elements in the slice
+        # the storage containers copy the slice in a single bulk operation
         if isinstance(index, slice):
-            start, stop, step = index.indices(self.size)
-            slice_size = max(0, ceil((stop - start) / step))
-            array_slice = Array(slice_size)
-            index = 0
-            while index < slice_size:
-                array_slice[index] = self.elements[start + (index * step)]
-                index += 1
+            array_slice = Array(0, self.typecode, self.dtype)
+            array_slice.elements = copy_slice(self.elements, index)
+            array_slice.size = len(array_slice.elements)
             return array_slice
 
         # if the index is neither type, return an error
@@ -81,6 +356,7 @@ class Array(Sequence):
     def __setitem__(self, index: Union[int, slice], item: Union[Any, Iterable]) -> None:
         """
         Sets the element in an index or the elements in a slice with a value or iterable of values.
+        The length of an Array is fixed, so a slice can only be assigned an iterable of the same length.
 
         :param index: the index or slice
         :param item: the value or iterable of values
@@ -99,13 +375,281 @@ class Array(Sequence):
         if isinstance(index, slice):
             start, stop, step = index.indices(self.size)
             if isinstance(item, Iterable):
-                for i, value in enumerate(item):
-                    if i >= ((stop - start) / step):
-                        break
-                    else:
-                        self.elements[start + (i * step)] = value
+                slice_size = len(range(start, stop, step))
+                if isinstance(item, Array):
+                    values = item.elements
+                elif isinstance(item, ArrayView):
+                    values = item.array.elements[item.slice]
+                else:
+                    values = item
+                if self.dtype is not None:
+                    values = numpy.asarray(values if isinstance(values, Sized) else list(values), dtype=self.dtype)
+                elif self.typecode is None:
+                    values = values if isinstance(values, list) else list(values)
+                elif not (isinstance(values, typed_array) and values.typecode == self.typecode):
+                    values = typed_array(self.typecode, values)
+                if len(values) != slice_size:
+                    raise ValueError(
+                        f"attempt to assign sequence of size {len(values)} to slice of size {slice_size}")
+                self.elements[index] = values
                 return
             raise TypeError("can only assign an iterable")
 
         # if the index is neither type, return an error
         raise TypeError("index must be an int or a slice")
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """
+        Pickles only the elements of the Array, without the state of a file mapping. With pickle protocol 5, typed
+        elements are passed as a PickleBuffer, so they can be sent out-of-band without being copied. A file-backed Array
+        is unpickled as an in-memory Array.
+
+        :param protocol: the pickle protocol
+        :return: the function and arguments which rebuild the Array
+        """
+        if self.typecode is None:
+            return rebuild_array, (None, self.dtype, self.elements)
+        if protocol >= 5:
+            return rebuild_array, (self.typecode, None, PickleBuffer(self.elements))
+        return rebuild_array, (self.typecode, None, bytes(self.elements))
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes a typed Array into a compact binary format: the same 16 byte header as a file-backed Array, followed
+        by the raw elements. Writing the bytes to a file creates a file which Array.open can map.
+
+        :return: the serialized Array
+        """
+        return self.view().to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview], dtype: Any = None) -> "Array":
+        """
+        Deserializes an Array created by to_bytes.
+
+        :param data: the serialized Array
+        :param dtype: a numpy dtype to store the elements with, or None to store them in an array.array
+        :return: the Array
+        """
+        data = memoryview(data)
+        magic, typecode, size = MAPPED_HEADER.unpack_from(data)
+        typecode = typecode.decode()
+        end = MAPPED_HEADER.size + size * typed_array(typecode).itemsize
+        if magic != MAPPED_MAGIC or len(data) < end:
+            raise ValueError("data does not hold a serialized array")
+        if dtype is not None:
+            array = cls(0, dtype=dtype)
+            array.elements = numpy.frombuffer(data[MAPPED_HEADER.size:end], dtype=typecode).astype(array.dtype)
+        else:
+            array = cls(0, typecode)
+            array.elements.frombytes(data[MAPPED_HEADER.size:end])
+        array.size = size
+        return array
+
+    def view(self, index: slice = slice(None)) -> "ArrayView":
+        """
+        Creates a view of a slice of the Array. Unlike slicing, the view shares the elements of the Array rather than
+        copying them.
+
+        :param index: the slice
+        :return: the ArrayView of the slice
+        """
+        return ArrayView(self, index)
+
+    def buffer(self) -> memoryview:
+        """
+        Exposes the typed storage of the Array without copying it.
+
+        :return: a memoryview of the elements
+        """
+        if self.typecode is None and self.dtype is None:
+            raise TypeError("only a typed array exposes a buffer")
+        return memoryview(self.elements)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Implements the buffer protocol (PEP 688) so that memoryview() and other buffer consumers can read the typed
+        storage of the Array directly. The hook is only used by Python 3.12+; on older versions, use buffer().
+
+        :param flags: the buffer request flags
+        :return: a memoryview of the elements
+        """
+        return self.buffer()
+
+    def __bytes__(self) -> bytes:
+        """
+        Copies the typed storage of the Array into a bytes object, on every Python version.
+
+        :return: the bytes of the elements
+        """
+        return self.buffer().tobytes()
+
+
+class ArrayView(Sequence):
+    def __init__(self, array: Union[Array, "ArrayView"], index: slice = slice(None)) -> None:
+        """
+        The ArrayView is a window onto a slice of an Array. It does not store any elements of its own, only the range
+        of indices it covers in the underlying Array, so creating a view takes constant time regardless of the size of
+        the slice. Reads and writes through the view go directly to the underlying Array. Slicing a view creates a
+        nested view onto the same underlying Array.
+
+        Implements abstract methods from Sequence:
+        __getitem__, __setitem__, __len__
+
+        Includes mixin methods from Sequence:
+        __contains__, __reversed__, index, count
+
+        Overrides mixin methods from Sequence:
+        __iter__
+
+        Overrides methods from object:
+        __repr__
+
+        :param array: the Array or ArrayView being viewed
+        :param index: the slice of the array covered by the view
+        """
+        if isinstance(array, ArrayView):
+            self.array: Array = array.array
+            self.indices: range = array.indices[index]
+        else:
+            self.array: Array = array
+            self.indices: range = range(array.size)[index]
+        self.size: int = len(self.indices)
+        self.typecode: Optional[str] = self.array.typecode
+        self.dtype: Any = self.array.dtype
+
+        # the slice of the underlying storage covered by the view
+        if self.size == 0:
+            self.slice: slice = slice(0, 0)
+        else:
+            stop = self.indices.stop if self.indices.stop >= 0 else None
+            self.slice: slice = slice(self.indices.start, stop, self.indices.step)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the current ArrayView.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        return repr(self.copy())
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the current ArrayView.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator over the viewed elements that reads the underlying storage directly.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the view
+        """
+        return map(self.array.elements.__getitem__, self.indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, Sequence]:
+        """
+        Retrieves the element in an index or a nested ArrayView of a slice of the current ArrayView.
+        Overrides abstract method in Sequence.
+
+        :param index: the index or slice
+        :return: the element or ArrayView of elements
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                return self.array.elements[self.indices[index]]
+            raise IndexError("array index out of range")
+
+        # if the index is a slice, return a nested view of the slice
+        if isinstance(index, slice):
+            return ArrayView(self, index)
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], item: Union[Any, Iterable]) -> None:
+        """
+        Sets the element in an index or the elements in a slice of the underlying Array with a value or iterable of
+        values.
+
+        :param index: the index or slice
+        :param item: the value or iterable of values
+        :return: None
+        """
+
+        # if the index is an integer, set the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                self.array.elements[self.indices[index]] = item
+                return
+            raise IndexError("array index out of range")
+
+        # if the index is a slice, write the elements through to the underlying Array
+        if isinstance(index, slice):
+            self.array[ArrayView(self, index).slice] = item
+            return
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def view(self, index: slice = slice(None)) -> "ArrayView":
+        """
+        Creates a nested view of a slice of the ArrayView.
+
+        :param index: the slice
+        :return: the ArrayView of the slice
+        """
+        return ArrayView(self, index)
+
+    def copy(self) -> Array:
+        """
+        Materializes the viewed elements into a new Array.
+
+        :return: an Array of the viewed elements
+        """
+        array_copy = Array(0, self.typecode, self.dtype)
+        array_copy.elements = copy_slice(self.array.elements, self.slice)
+        array_copy.size = self.size
+        return array_copy
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the viewed elements into the compact binary format of Array.to_bytes.
+
+        :return: the serialized elements
+        """
+        typecode = storage_typecode(self.typecode, self.dtype)
+        return MAPPED_HEADER.pack(MAPPED_MAGIC, typecode.encode(), self.size) + self.buffer().tobytes()
+
+    def buffer(self) -> memoryview:
+        """
+        Exposes the viewed slice of the typed storage of the underlying Array without copying it.
+
+        :return: a memoryview of the viewed elements
+        """
+        return self.array.buffer()[self.slice]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Implements the buffer protocol (PEP 688) for the viewed slice of the typed storage. The hook is only used by
+        Python 3.12+; on older versions, use buffer().
+
+        :param flags: the buffer request flags
+        :return: a memoryview of the viewed elements
+        """
+        return self.buffer()
+
+    def __bytes__(self) -> bytes:
+        """
+        Copies the viewed slice of the typed storage into a bytes object, on every Python version.
+
+        :return: the bytes of the viewed elements
+        """
+        return self.buffer().tobytes()
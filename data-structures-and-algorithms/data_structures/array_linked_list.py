@@ -0,0 +1,434 @@
+from collections.abc import MutableSequence, Iterable, Iterator
+from typing import Union, Any, Optional
+from library.array import Array
+from library.array_list import DEFAULT_CAPACITY, EXPAND_FACTOR
+
+# the index which stands for a missing node
+NIL: int = -1
+
+
+class ArrayLinkedList(MutableSequence):
+    def __init__(self, items: Iterable = ()) -> None:
+        """
+        The ArrayLinkedList is a doubly-linked list which stores its nodes as a struct of arrays rather than as one
+        object per node. A node is a slot index into three parallel Arrays: the values, the index of the next node, and
+        the index of the previous node, with NIL (-1) standing for a missing node. The link columns are typed Arrays of
+        C longs. The slots which are not in the list form a free list, linked through the next column, from which new
+        nodes are taken. When the free list is empty, the columns are expanded by the EXPAND_FACTOR.
+
+        Since the list is made of three objects rather than one per node, it puts no pressure on the garbage collector,
+        and copying or pickling it copies three arrays, rather than recursing through a chain of nodes. compact()
+        renumbers the slots in the order of the list, so that a traversal reads the columns sequentially.
+
+        The ArrayLinkedList has the same interface as the DoublyLinkedList, with a node searched for from whichever of
+        the head, the tail or the finger (the last accessed index and slot) is closest to it.
+
+        Implements abstract methods from MutableSequence:
+        __getitem__, __setitem__, __delitem__, __len__, insert
+
+        Includes mixin methods from MutableSequence:
+        append, __iadd__
+
+        Overrides mixin methods from MutableSequence:
+        __contains__, __iter__, __reversed__, index, count, pop, remove, clear, reverse, extend
+
+        Implements methods from list:
+        copy
+
+        Overrides methods from object:
+        __repr__
+
+        :param items: the initial elements of the list
+        """
+        self.size: int = 0
+        self.head: int = NIL
+        self.tail: int = NIL
+        self.free: int = NIL
+        self.values: Array = Array(0)
+        self.nxt: Array = Array(0, typecode="l")
+        self.prv: Array = Array(0, typecode="l")
+
+        # the last accessed (index, slot), or None
+        self.finger: Optional[tuple] = None
+
+        # initialize the list
+        self.rebuild(list(items))
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the list.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for element in self:
+                s = s + f"{element}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the list.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which follows the next column from the head.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the list
+        """
+        values, nxt = self.values.elements, self.nxt.elements
+        slot = self.head
+        while slot != NIL:
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __reversed__(self) -> Iterator:
+        """
+        Creates an iterator which follows the previous column from the tail.
+        Overrides mixin method in Sequence.
+
+        :return: a reverse iterator for the list
+        """
+        values, prv = self.values.elements, self.prv.elements
+        slot = self.tail
+        while slot != NIL:
+            yield values[slot]
+            slot = prv[slot]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
+        """
+        Retrieves the element in an index or elements in a slice of the list.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: the value or values
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                return self.values.elements[self.locate(index % self.size)]
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, return a new list with the elements in the slice
+        if isinstance(index, slice):
+            return ArrayLinkedList(list(self)[index])
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        """
+        Sets the element in an index of the list.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the value
+        :return: None
+        """
+        if -self.size <= index < self.size:
+            self.values.elements[self.locate(index % self.size)] = value
+        else:
+            raise IndexError("list assignment index out of range")
+
+    def __delitem__(self, index: int) -> None:
+        """
+        Deletes the element in an index of the list.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :return: None
+        """
+        if -self.size <= index < self.size:
+            index = index % self.size
+            self.unlink(self.locate(index), index)
+        else:
+            raise IndexError("list assignment index out of range")
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a new value into the list at a given index, in a slot taken from the free list.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the new value
+        :return: None
+        """
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+            if self.free == NIL:
+                self.reallocate(max(DEFAULT_CAPACITY, int(len(self.values) * EXPAND_FACTOR)))
+            values, nxt, prv = self.values.elements, self.nxt.elements, self.prv.elements
+            slot = self.free
+            self.free = nxt[slot]
+
+            # the new slot is linked in before the slot at the index, or after the tail
+            next_slot = NIL if index == self.size else self.locate(index)
+            prev_slot = self.tail if next_slot == NIL else prv[next_slot]
+            values[slot] = value
+            nxt[slot] = next_slot
+            prv[slot] = prev_slot
+            if prev_slot == NIL:
+                self.head = slot
+            else:
+                nxt[prev_slot] = slot
+            if next_slot == NIL:
+                self.tail = slot
+            else:
+                prv[next_slot] = slot
+            self.size += 1
+            self.finger = (index, slot)
+            return
+        raise IndexError("index out of range")
+
+    def locate(self, index: int) -> int:
+        """
+        Finds the slot at an index by walking from whichever of the head, the tail or the finger is closest to it, and
+        moves the finger to the slot.
+
+        :param index: a valid, non-negative index of the list
+        :return: the slot at the index
+        """
+        nxt, prv = self.nxt.elements, self.prv.elements
+        curr_index, slot = 0, self.head
+        if self.size - 1 - index < index:
+            curr_index, slot = self.size - 1, self.tail
+        if self.finger is not None and abs(self.finger[0] - index) < abs(curr_index - index):
+            curr_index, slot = self.finger
+        while curr_index < index:
+            slot = nxt[slot]
+            curr_index += 1
+        while curr_index > index:
+            slot = prv[slot]
+            curr_index -= 1
+        self.finger = (index, slot)
+        return slot
+
+    def unlink(self, slot: int, index: Optional[int] = None) -> None:
+        """
+        Removes the node in a slot from the list and puts the slot on the free list. If the index of the node is known,
+        the finger is moved to the node before it, and otherwise the finger is dropped.
+
+        :param slot: the slot of the removed node
+        :param index: the index of the removed node, if it is known
+        :return: None
+        """
+        values, nxt, prv = self.values.elements, self.nxt.elements, self.prv.elements
+        prev_slot, next_slot = prv[slot], nxt[slot]
+        if prev_slot == NIL:
+            self.head = next_slot
+        else:
+            nxt[prev_slot] = next_slot
+        if next_slot == NIL:
+            self.tail = prev_slot
+        else:
+            prv[next_slot] = prev_slot
+        self.finger = (index - 1, prev_slot) if index is not None and prev_slot != NIL else None
+        values[slot] = None
+        nxt[slot] = self.free
+        prv[slot] = NIL
+        self.free = slot
+        self.size -= 1
+
+    def reallocate(self, capacity: int) -> None:
+        """
+        Expands the columns to a given capacity, keeping every slot in place, and puts the new slots on the free list.
+
+        :param capacity: the capacity of the new columns
+        :return: None
+        """
+        old_capacity = len(self.values)
+        values, nxt, prv = Array(capacity), Array(capacity, typecode="l"), Array(capacity, typecode="l")
+        values[:old_capacity] = self.values
+        nxt[:old_capacity] = self.nxt
+        prv[:old_capacity] = self.prv
+        nxt[old_capacity:] = range(old_capacity + 1, capacity + 1)
+        nxt[capacity - 1] = self.free
+        prv[old_capacity:] = [NIL] * (capacity - old_capacity)
+        self.values, self.nxt, self.prv = values, nxt, prv
+        self.free = old_capacity
+
+    def rebuild(self, elements: list) -> None:
+        """
+        Replaces the contents of the list with the given elements, stored in consecutive slots from the start of new
+        columns, with the remaining slots on the free list.
+
+        :param elements: the new elements
+        :return: None
+        """
+        n = len(elements)
+        capacity = max(DEFAULT_CAPACITY, n)
+        self.values = Array(capacity)
+        self.values[:n] = elements
+        self.nxt = Array(capacity, typecode="l")
+        self.nxt[:] = range(1, capacity + 1)
+        self.nxt[capacity - 1] = NIL
+        self.prv = Array(capacity, typecode="l")
+        self.prv[:] = range(-1, capacity - 1)
+        self.prv[n:] = [NIL] * (capacity - n)
+        if n > 0:
+            self.nxt[n - 1] = NIL
+        self.size = n
+        self.head = 0 if n > 0 else NIL
+        self.tail = n - 1 if n > 0 else NIL
+        self.free = n if n < capacity else NIL
+        self.finger = None
+
+    def compact(self) -> None:
+        """
+        Renumbers the slots in the order of the list and shrinks the columns to fit, so that a traversal of the list
+        reads the columns sequentially.
+
+        :return: None
+        """
+        self.rebuild(list(self))
+
+    # Overrides MutableSequence mixin methods for efficiency:
+    # The mixin implementations of __contains__(), index() and count() read
+    # the values by index. Instead, the next column is followed from the head.
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks whether a value is in the list.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: whether the value is in the list
+        """
+        for element in self:
+            if element is value or element == value:
+                return True
+        return False
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the index of the first instance of a value in the interval [start, stop) of the list.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :param start: the start (inclusive) of the searched interval
+        :param stop: the end (exclusive) of the searched interval
+        :return: the index of the first instance of the value
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        for i, element in enumerate(self):
+            if i >= stop:
+                break
+            if i >= start and (element is value or element == value):
+                return i
+        raise ValueError(f"{value} is not in list")
+
+    def count(self, value: Any) -> int:
+        """
+        Counts the instances of a value in the list.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        return sum(1 for element in self if element is value or element == value)
+
+    # Overrides MutableSequence mixin methods for efficiency:
+    # The mixin implementations of pop() and remove() find the value and then
+    # delete it by index, which searches for it a second time. Instead, the
+    # slot is unlinked as soon as it is found.
+    def pop(self, index: int = -1) -> Any:
+        """
+        Removes and returns the value at an index of the list, the last value by default.
+        Overrides mixin method in MutableSequence.
+
+        :param index: the index
+        :return: the removed value
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        if not -self.size <= index < self.size:
+            raise IndexError("pop index out of range")
+        index = index % self.size
+        slot = self.locate(index)
+        value = self.values.elements[slot]
+        self.unlink(slot, index)
+        return value
+
+    def remove(self, value: Any) -> None:
+        """
+        Removes the first instance of a value from the list.
+        Overrides mixin method in MutableSequence.
+
+        :param value: the value
+        :return: None
+        """
+        values, nxt = self.values.elements, self.nxt.elements
+        slot, index = self.head, 0
+        while slot != NIL:
+            if values[slot] is value or values[slot] == value:
+                self.unlink(slot, index)
+                return
+            slot = nxt[slot]
+            index += 1
+        raise ValueError(f"{value} is not in list")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of extend() appends the values one at a time.
+    # An empty list is instead rebuilt from the values in bulk.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of the list.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: None
+        """
+        if self.size == 0:
+            self.rebuild(list(values))
+            return
+        for value in list(values):
+            self.insert(self.size, value)
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of reverse() swaps the values by index.
+    # Instead, the links of every node are swapped in place.
+    def reverse(self) -> None:
+        """
+        Reverses the list in place by swapping the next and previous links of every node.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        nxt, prv = self.nxt.elements, self.prv.elements
+        slot = self.head
+        while slot != NIL:
+            nxt[slot], prv[slot] = prv[slot], nxt[slot]
+            slot = prv[slot]
+        self.head, self.tail = self.tail, self.head
+        self.finger = None
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin method implements the clear() method by repeatedly removing
+    # single values. A more efficient method is to reset the list all at once.
+    def clear(self) -> None:
+        """
+        Removes all the elements in the list.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        self.rebuild([])
+
+    def copy(self) -> MutableSequence:
+        """
+        Creates a shallow, compacted copy of the list.
+        Implements copy to fulfill the list interface.
+
+        :return: a copy of the list
+        """
+        return ArrayLinkedList(self)
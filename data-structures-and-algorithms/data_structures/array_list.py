@@ -1,50 +1,277 @@
-from collections.abc import MutableSequence, Iterable
-from math import ceil
-from typing import Union, Any
-from library.array import Array
+from bisect import bisect_left, bisect_right
+from collections.abc import MutableSequence, Iterable, Iterator, Sized
+from operator import countOf, indexOf
+from typing import Union, Any, Optional, Callable
+from library.array import Array, ArrayView, numpy
 
 DEFAULT_CAPACITY: int = 8
 EXPAND_FACTOR: float = 2
 SHRINK_FACTOR: float = 4
+MIN_RUN: int = 32
+MIN_GALLOP: int = 7
+
+
+class GrowthPolicy:
+    def __init__(self, min_capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        A growth policy decides the capacity of the array of an ArrayList when it has to grow or may shrink. The base
+        policy grows the array to exactly the required capacity and never shrinks it. Subclasses override grow and
+        shrink.
+
+        :param min_capacity: the smallest capacity of the array
+        """
+        self.min_capacity: int = min_capacity
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the policy and its parameters.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        parameters = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"{type(self).__name__}({parameters})"
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Computes the new capacity of a full array.
+
+        :param capacity: the current capacity
+        :param required: the capacity that is required
+        :return: the new capacity, at least the required capacity
+        """
+        return max(required, self.min_capacity)
+
+    def shrink(self, capacity: int, size: int) -> Optional[int]:
+        """
+        Computes the new capacity of an array after elements have been removed.
+
+        :param capacity: the current capacity
+        :param size: the number of elements
+        :return: the new capacity, or None if the array should not be shrunk
+        """
+        return None
+
+
+class GeometricGrowth(GrowthPolicy):
+    def __init__(self, expand_factor: float = EXPAND_FACTOR, shrink_factor: float = SHRINK_FACTOR,
+                 min_capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Multiplies the capacity by the expand factor when the array is full, and divides the capacity by the shrink
+        factor once the array is no more than 1 / shrink_factor full. This is the default policy.
+
+        :param expand_factor: the factor by which the array grows
+        :param shrink_factor: the factor by which the array shrinks
+        :param min_capacity: the smallest capacity of the array
+        """
+        super().__init__(min_capacity)
+        self.expand_factor: float = expand_factor
+        self.shrink_factor: float = shrink_factor
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Multiplies the capacity by the expand factor, or grows it to the required capacity if that is larger.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param required: the capacity that is required
+        :return: the new capacity
+        """
+        return max(required, self.min_capacity, int(capacity * self.expand_factor))
+
+    def shrink(self, capacity: int, size: int) -> Optional[int]:
+        """
+        Divides the capacity by the shrink factor once the array is no more than 1 / shrink_factor full.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param size: the number of elements
+        :return: the new capacity, or None if the array should not be shrunk
+        """
+        if size <= int(capacity / self.shrink_factor) and capacity > self.min_capacity:
+            return max(size, self.min_capacity, int(capacity / self.shrink_factor))
+        return None
+
+
+class FixedStepGrowth(GrowthPolicy):
+    def __init__(self, step: int = DEFAULT_CAPACITY, min_capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Adds a fixed number of slots to the array when it is full, and removes slots once two steps are unused.
+        This bounds the wasted memory at the cost of copying the list more often as it grows.
+
+        :param step: the number of slots added or removed
+        :param min_capacity: the smallest capacity of the array
+        """
+        super().__init__(min_capacity)
+        self.step: int = step
+
+    def grow(self, capacity: int, required: int) -> int:
+        """
+        Adds a step to the capacity, or grows it to the required capacity if that is larger.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param required: the capacity that is required
+        :return: the new capacity
+        """
+        return max(required, self.min_capacity, capacity + self.step)
+
+    def shrink(self, capacity: int, size: int) -> Optional[int]:
+        """
+        Leaves a single step of unused slots once two steps are unused.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param size: the number of elements
+        :return: the new capacity, or None if the array should not be shrunk
+        """
+        if capacity - size >= 2 * self.step and capacity > self.min_capacity:
+            return max(self.min_capacity, size + self.step)
+        return None
+
+
+class HysteresisShrink(GeometricGrowth):
+    def __init__(self, expand_factor: float = EXPAND_FACTOR, shrink_factor: float = SHRINK_FACTOR,
+                 min_capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Grows the array like the GeometricGrowth policy, but when the array is no more than 1 / shrink_factor full it is
+        shrunk to leave expand_factor times the number of elements. The headroom keeps a list whose size oscillates
+        around a threshold from being reallocated on every insertion and deletion.
+
+        :param expand_factor: the factor by which the array grows
+        :param shrink_factor: how empty the array must be before it shrinks
+        :param min_capacity: the smallest capacity of the array
+        """
+        super().__init__(expand_factor, shrink_factor, min_capacity)
+
+    def shrink(self, capacity: int, size: int) -> Optional[int]:
+        """
+        Leaves expand_factor times the number of elements once the array is no more than 1 / shrink_factor full.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param size: the number of elements
+        :return: the new capacity, or None if the array should not be shrunk
+        """
+        if size <= int(capacity / self.shrink_factor) and capacity > self.min_capacity:
+            new_capacity = max(self.min_capacity, int(size * self.expand_factor))
+            return new_capacity if new_capacity < capacity else None
+        return None
+
+
+class NeverShrink(GeometricGrowth):
+    def __init__(self, expand_factor: float = EXPAND_FACTOR, min_capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Grows the array like the GeometricGrowth policy, but never shrinks it. Use shrink_to_fit to release the memory.
+
+        :param expand_factor: the factor by which the array grows
+        :param min_capacity: the smallest capacity of the array
+        """
+        super().__init__(expand_factor, SHRINK_FACTOR, min_capacity)
+
+    def shrink(self, capacity: int, size: int) -> Optional[int]:
+        """
+        Never shrinks the array.
+        Overrides method in GrowthPolicy.
+
+        :param capacity: the current capacity
+        :param size: the number of elements
+        :return: the new capacity, or None if the array should not be shrunk
+        """
+        return None
+
+
+DEFAULT_POLICY: GrowthPolicy = GeometricGrowth()
+
+
+def rebuild_array_list(elements: Any, dtype: Any, policy: GrowthPolicy) -> "ArrayList":
+    """
+    Rebuilds a pickled ArrayList from its elements.
+
+    :param elements: a list or ndarray of the elements
+    :param dtype: the numpy dtype of the elements, or None
+    :param policy: the GrowthPolicy of the ArrayList
+    :return: the ArrayList
+    """
+    return ArrayList(elements, dtype=dtype, policy=policy)
 
 
 class ArrayList(MutableSequence):
-    def __init__(self, elements: Iterable = ()) -> None:
+    def __init__(self, elements: Iterable = (), dtype: Any = None, policy: Optional[GrowthPolicy] = None) -> None:
         """
         The ArrayList uses an array in order to store the values of the list. During insertion, all elements in front
         of the inserted element will be shifted forward. When the size of the list reaches the size of the array, a new
         and larger array is created and the elements are copied over. If the number of elements becomes small enough in
         the process of deletion, then a new smaller array is created and the elements are copied over.
 
+        Elements are always shifted and copied as whole blocks rather than one at a time, and bulk insertions resize the
+        array at most once.
+
+        If a numpy dtype is given, the elements are stored in a growable numpy ndarray instead, with the same expansion
+        and shrinking policy. In this numeric mode, map, filter, sum, min, max, searchsorted, argsort and sort are
+        vectorized over the whole ndarray rather than looping over the elements in python.
+
+        How much the array grows or shrinks is decided by a GrowthPolicy, which can be chosen per list. The list counts
+        its reallocations, the elements copied by them, and the peak capacity of its array in the reallocations,
+        elements_copied and peak_capacity attributes.
+
+        Copies and slices of an ArrayList are copy-on-write: they share the array of the original list (a slice through
+        an ArrayView of it), and the array counts the lists sharing it. The first list to mutate a shared array copies
+        it first, so copies which are never mutated cost nothing beyond the new list object.
+
         Implements abstract methods from MutableSequence:
         __getitem__, __setitem__, __delitem__, __len__, insert
 
         Includes mixin methods from MutableSequence:
-        __contains__, __iter__, __reversed__, index, count, append, reverse, extend, pop, remove, __iadd__
+        append, reverse, remove
 
         Overrides mixin methods from MutableSequence:
-        clear
+        __contains__, __iter__, __reversed__, index, count, pop, clear, extend, __iadd__
 
         Implements methods from list:
         copy, sort
 
+        Implements bulk methods:
+        map, filter, sum, min, max, searchsorted, argsort
+
+        Implements capacity methods:
+        reserve, shrink_to_fit
+
         Overrides methods from object:
-        __repr__
+        __repr__, __del__
 
         :param elements: the initial elements of the ArrayList
+        :param dtype: the numpy dtype of the elements, or None to store arbitrary objects
+        :param policy: the GrowthPolicy of the array, or None for the default GeometricGrowth
         """
         self.size: int = 0
-        self.array: Array = Array(DEFAULT_CAPACITY)
+        self.dtype: Any = dtype
+        self.policy: GrowthPolicy = DEFAULT_POLICY if policy is None else policy
+
+        # if the number of elements is known, the array can be allocated at its final size right away
+        if isinstance(elements, Sized):
+            self.array: Array = Array(max(self.policy.min_capacity, len(elements)), dtype=dtype)
+        else:
+            self.array: Array = Array(self.policy.min_capacity, dtype=dtype)
+
+        # reallocation counters
+        self.reallocations: int = 0
+        self.elements_copied: int = 0
+        self.peak_capacity: int = len(self.array)
 
         # initialize the ArrayList
-        for element in elements:
-            if len(self.array) == self.size:
-                new_size = max(self.size + 1, int(self.size * EXPAND_FACTOR))
-                new_array = Array(new_size)
-                new_array[0:self.size] = self.array
-                self.array = new_array
-            self.array[self.size] = element
-            self.size += 1
+        self.extend(elements)
+
+    def __del__(self) -> None:
+        """
+        Releases the share of the array when the ArrayList is garbage collected, so the remaining lists sharing it do not
+        copy it needlessly.
+        Overrides method in object.
+
+        :return: None
+        """
+        if hasattr(self, "array"):
+            self.release()
 
     def __repr__(self) -> str:
         """
@@ -71,6 +298,117 @@ class ArrayList(MutableSequence):
         """
         return self.size
 
+    def storage(self) -> tuple:
+        """
+        Finds where the elements of the ArrayList are kept: the storage container of the underlying Array, and the
+        range of indices of the elements in the container.
+
+        :return: the storage container and the range of indices
+        """
+        if isinstance(self.array, ArrayView):
+            return self.array.array.elements, self.array.indices
+        return self.array.elements, range(self.size)
+
+    # Overrides MutableSequence mixin methods for efficiency:
+    # The mixin implementations of __iter__(), __reversed__(), __contains__(),
+    # index() and count() read the elements one at a time through
+    # __getitem__(), paying for its type and bounds checks on every element.
+    # Instead, they read the storage container of the array directly, and the
+    # searches run over a numpy ndarray as a single vectorized comparison.
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which reads the storage of the array directly.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the ArrayList
+        """
+        elements, indices = self.storage()
+        return map(elements.__getitem__, indices)
+
+    def __reversed__(self) -> Iterator:
+        """
+        Creates a reverse iterator which reads the storage of the array directly.
+        Overrides mixin method in Sequence.
+
+        :return: a reverse iterator for the ArrayList
+        """
+        elements, indices = self.storage()
+        return map(elements.__getitem__, reversed(indices))
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks whether a value is in the ArrayList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: whether the value is in the ArrayList
+        """
+        if self.dtype is not None:
+            return value in self.live()
+        return value in iter(self)
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the index of the first instance of a value in the interval [start, stop) of the ArrayList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :param start: the start (inclusive) of the searched interval
+        :param stop: the end (exclusive) of the searched interval
+        :return: the index of the first instance of the value
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if self.dtype is not None:
+            matches = numpy.flatnonzero(self.live()[start:stop] == value)
+            if len(matches) > 0:
+                return start + int(matches[0])
+        elif start < stop:
+            elements, indices = self.storage()
+            try:
+                return start + indexOf(map(elements.__getitem__, indices[start:stop]), value)
+            except ValueError:
+                pass
+        raise ValueError(f"{value} is not in list")
+
+    def count(self, value: Any) -> int:
+        """
+        Counts the instances of a value in the ArrayList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        if self.dtype is not None:
+            return int(numpy.count_nonzero(self.live() == value))
+        return countOf(iter(self), value)
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of pop() reads the element and then deletes it
+    # through the general slice-aware __delitem__(). Popping the last element
+    # only needs to shrink the size of the list.
+    def pop(self, index: int = -1) -> Any:
+        """
+        Removes and returns the element at an index of the ArrayList, the last element by default.
+        Overrides mixin method in MutableSequence.
+
+        :param index: the index
+        :return: the removed element
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        if not -self.size <= index < self.size:
+            raise IndexError("pop index out of range")
+        index = index % self.size
+        self.own()
+        value = self.array[index]
+        if index < self.size - 1:
+            self.array[index:self.size - 1] = self.array.view(slice(index + 1, self.size))
+        if self.dtype is None:
+            self.array[self.size - 1] = None
+        self.size -= 1
+        self.shrink()
+        return value
+
     def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
         """
         Retrieves the element in an index or elements in a slice of the ArrayList.
@@ -87,19 +425,9 @@ class ArrayList(MutableSequence):
                 return self.array[index]
             raise IndexError("list index out of range")
 
-        # if the index is a slice, return a new ArrayList with the elements in the slice
+        # if the index is a slice, return a new ArrayList sharing a view of the slice
         if isinstance(index, slice):
-            start, stop, step = index.indices(self.size)
-            slice_size = max(0, ceil((stop - start) / step))
-            slice_array = Array(max(DEFAULT_CAPACITY, slice_size))
-            index = 0
-            while index < slice_size:
-                slice_array[index] = self.array[start + (index * step)]
-                index += 1
-            list_slice = ArrayList()
-            list_slice.array = slice_array
-            list_slice.size = slice_size
-            return list_slice
+            return self.share(self.array.view(slice(0, self.size))[index])
 
         # if the index is neither type, return an error
         raise TypeError("index must be an int or a slice")
@@ -118,6 +446,7 @@ class ArrayList(MutableSequence):
         if isinstance(index, int):
             if -self.size <= index < self.size:
                 index = index % self.size
+                self.own()
                 self.array[index] = value
                 return
             raise IndexError("array index out of range")
@@ -126,27 +455,18 @@ class ArrayList(MutableSequence):
         if isinstance(index, slice):
             start, stop, step = index.indices(self.size)
             if isinstance(value, Iterable):
-                insertion = ArrayList(value)
-
-                slice_size = max(0, ceil((stop - start) / step))
+                insertion = list(value)
+                self.own()
 
                 # if the step size is 1, then the insertion can have a different length from the slice
                 if step == 1:
-                    new_list = ArrayList()
-                    for i in range(0, start):
-                        new_list.append(self.array[i])
-                    for element in value:
-                        new_list.append(element)
-                    for i in range(max(start, stop), self.size):
-                        new_list.append(self.array[i])
-                    self.array = new_list.array
-                    self.size = new_list.size
+                    self.replace(start, max(start, stop), insertion)
                 else:
+                    slice_size = len(range(start, stop, step))
                     if len(insertion) != slice_size:
-                        ValueError(
+                        raise ValueError(
                             f"attempt to assign sequence of size {len(insertion)} to extended slice of size {slice_size}")
-                    for i, element in enumerate(insertion):
-                        self.array[start + (i * step)] = element
+                    self.array.view(slice(0, self.size))[index] = insertion
                 return
             raise TypeError("can only assign an iterable")
 
@@ -166,43 +486,33 @@ class ArrayList(MutableSequence):
         if isinstance(index, int):
             if -self.size <= index < self.size:
                 index = index % self.size
-                for i in range(index, self.size - 1):
-                    self.array[i] = self.array[i + 1]
-                self.size -= 1
-                if self.size <= int(len(self.array) / SHRINK_FACTOR):
-                    new_capacity = max(self.size, DEFAULT_CAPACITY, int(len(self.array) / SHRINK_FACTOR))
-                    new_array = Array(new_capacity)
-                    for i, element in enumerate(self):
-                        new_array[i] = element
-                    self.array = new_array
+                self.replace(index, index + 1, ())
                 return
             raise IndexError("list index out of range")
 
         # if the index is a slice, delete the elements in the slice of the ArrayList
         if isinstance(index, slice):
-            start, stop, step = index.indices(self.size)
-            slice_size = max(0, ceil((stop - start) / step))
-            new_size = self.size - slice_size
-            new_array = Array(max(DEFAULT_CAPACITY, new_size))
-            if step > 0:
-                index = 0
-                for i, element in enumerate(self):
-                    if (i == start) and (i < stop):
-                        start = start + step
-                    else:
-                        new_array[index] = element
-                        index += 1
-            else:
-                index = new_size - 1
-                for i, element in enumerate(reversed(self)):
-                    i = (self.size - 1) - i
-                    if (i == start) and (i > stop):
-                        start = start + step
-                    else:
-                        new_array[index] = element
-                        index -= 1
-            self.array = new_array
+            deleted = range(*index.indices(self.size))
+            if len(deleted) == 0:
+                return
+            self.own()
+            if deleted.step < 0:
+                deleted = deleted[::-1]
+
+            # if the slice is contiguous, the elements behind it are moved forward as one block
+            if deleted.step == 1:
+                self.replace(deleted.start, deleted.stop, ())
+                return
+
+            # otherwise, each run of elements between two deleted positions is moved forward as one block
+            new_size = self.size - len(deleted)
+            for i, position in enumerate(deleted):
+                run_stop = deleted[i + 1] if i + 1 < len(deleted) else self.size
+                self.array[position - i:run_stop - i - 1] = self.array.view(slice(position + 1, run_stop))
+            if self.dtype is None:
+                self.array[new_size:self.size] = [None] * (self.size - new_size)
             self.size = new_size
+            self.shrink()
             return
 
         # if the index is neither type, return an error
@@ -219,18 +529,214 @@ class ArrayList(MutableSequence):
         """
         if -self.size <= index <= self.size:
             index = (index + self.size) if index < 0 else index
-            if self.size == len(self.array):
-                new_size = max(self.size + 1, int(self.size * EXPAND_FACTOR))
-                new_array = Array(new_size)
-                new_array[:self.size] = self.array[:self.size]
-                self.array = new_array
-            for i in range(self.size, index, -1):
-                self.array[i] = self.array[i - 1]
+            self.own(self.size + 1)
+            self.reserve(self.size + 1)
+            if index < self.size:
+                self.array[index + 1:self.size + 1] = self.array.view(slice(index, self.size))
             self.array[index] = value
             self.size += 1
             return
         raise IndexError("index out of range")
 
+    def insert_many(self, index: int, values: Iterable) -> None:
+        """
+        Inserts an iterable of values into the ArrayList at a given index. The array is resized at most once and the
+        elements behind the index are shifted as a single block.
+
+        :param index: the index of the first new value
+        :param values: the new values
+        :return: None
+        """
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+            self.replace(index, index, values)
+            return
+        raise IndexError("index out of range")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of extend() appends the values one at a time,
+    # which may resize the array several times. Instead, the array is resized
+    # once and the values are copied in as a single block.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of the ArrayList.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: None
+        """
+        self.replace(self.size, self.size, values)
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of __iadd__() calls the mixin extend().
+    def __iadd__(self, values: Iterable) -> MutableSequence:
+        """
+        Appends an iterable of values to the end of the ArrayList.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: the ArrayList
+        """
+        self.extend(values)
+        return self
+
+    def replace(self, start: int, stop: int, values: Iterable) -> None:
+        """
+        Replaces the elements in the interval [start, stop) with an iterable of values, which may have a different
+        length than the interval. The elements behind the interval are shifted as a single block, and the array is
+        resized at most once.
+
+        :param start: the start (inclusive) of the replaced interval
+        :param stop: the end (exclusive) of the replaced interval
+        :param values: the new values
+        :return: None
+        """
+        if not isinstance(values, Sized) or values is self:
+            values = list(values)
+        old_size = self.size
+        new_size = old_size - (stop - start) + len(values)
+        self.own(new_size)
+        self.reserve(new_size)
+        if stop < old_size:
+            self.array[start + len(values):new_size] = self.array.view(slice(stop, old_size))
+        self.array[start:start + len(values)] = values
+        if new_size < old_size and self.dtype is None:
+            self.array[new_size:old_size] = [None] * (old_size - new_size)
+        self.size = new_size
+        self.shrink()
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """
+        Pickles only the elements of the ArrayList, not the unused capacity of its array. In numeric mode, the elements
+        are passed as an ndarray view, which numpy sends out-of-band without copying under pickle protocol 5.
+
+        :param protocol: the pickle protocol
+        :return: the function and arguments which rebuild the ArrayList
+        """
+        return rebuild_array_list, (self.live(), self.dtype, self.policy)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes a numeric ArrayList into the compact binary format of Array.to_bytes, without its unused capacity.
+
+        :return: the serialized ArrayList
+        """
+        return self.array.view(slice(0, self.size)).to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview], dtype: Any = None) -> "ArrayList":
+        """
+        Deserializes an ArrayList (or Array) created by to_bytes.
+
+        :param data: the serialized ArrayList
+        :param dtype: the numpy dtype of the new ArrayList, or None to store the elements as objects
+        :return: the ArrayList
+        """
+        array = Array.from_bytes(data, dtype)
+        return cls(array.elements, dtype=dtype)
+
+    def live(self) -> Any:
+        """
+        Retrieves the elements of the ArrayList, without the unused capacity, in the form of its storage: a copied list of
+        objects, or an ndarray view in numeric mode.
+
+        :return: the elements
+        """
+        if isinstance(self.array, ArrayView):
+            return self.array.array.elements[self.array.slice]
+        return self.array.elements[:self.size]
+
+    def share(self, array: Union[Array, ArrayView]) -> MutableSequence:
+        """
+        Creates a new ArrayList which shares the array (or a view of the array) of this ArrayList until one of them is
+        mutated.
+
+        :param array: the Array or ArrayView holding the elements of the new ArrayList
+        :return: the new ArrayList
+        """
+        new_list = ArrayList(dtype=self.dtype, policy=self.policy)
+        new_list.release()
+        new_list.array = array
+        new_list.size = len(array) if isinstance(array, ArrayView) else self.size
+        (array.array if isinstance(array, ArrayView) else array).owners += 1
+        return new_list
+
+    def own(self, capacity: int = 0) -> None:
+        """
+        Ensures the array of the ArrayList is not shared with another list before it is mutated, by copying the elements
+        into an array of its own. The new array is made large enough to hold the given capacity.
+
+        :param capacity: the capacity required for the upcoming mutation
+        :return: None
+        """
+        if isinstance(self.array, ArrayView) or self.array.owners > 1:
+            if capacity > len(self.array):
+                self.reallocate(self.policy.grow(len(self.array), capacity))
+            else:
+                self.reallocate(max(self.policy.min_capacity, len(self.array)))
+
+    def release(self) -> None:
+        """
+        Gives up the share of the ArrayList in its array.
+
+        :return: None
+        """
+        (self.array.array if isinstance(self.array, ArrayView) else self.array).owners -= 1
+
+    def capacity(self) -> int:
+        """
+        Counts the number of elements the array can hold before it has to grow.
+
+        :return: the capacity of the array
+        """
+        return len(self.array)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Ensures that the array can hold at least a given number of elements. If it cannot, the array is expanded as
+        decided by the growth policy.
+
+        :param capacity: the required capacity
+        :return: None
+        """
+        if capacity > len(self.array):
+            self.reallocate(self.policy.grow(len(self.array), capacity))
+
+    def shrink(self) -> None:
+        """
+        Shrinks the array if the growth policy decides that the number of elements has become small compared to its
+        capacity.
+
+        :return: None
+        """
+        new_capacity = self.policy.shrink(len(self.array), self.size)
+        if new_capacity is not None and new_capacity != len(self.array):
+            self.reallocate(new_capacity)
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrinks the array to hold exactly the elements of the ArrayList, regardless of the growth policy.
+
+        :return: None
+        """
+        if len(self.array) != self.size:
+            self.reallocate(self.size)
+
+    def reallocate(self, capacity: int) -> None:
+        """
+        Moves the elements of the ArrayList into a new array with the given capacity.
+
+        :param capacity: the capacity of the new array
+        :return: None
+        """
+        new_array = Array(capacity, dtype=self.dtype)
+        new_array[:self.size] = self.array.view(slice(0, self.size))
+        self.release()
+        self.array = new_array
+        self.reallocations += 1
+        self.elements_copied += self.size
+        self.peak_capacity = max(self.peak_capacity, capacity)
+
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin method implements the clear() method by repeatedly removing
     # single values. A more efficient method is to reset the list all at once.
@@ -242,72 +748,319 @@ class ArrayList(MutableSequence):
         :return:
         """
         self.size = 0
-        self.array = Array(DEFAULT_CAPACITY)
+        self.release()
+        self.array = Array(self.policy.min_capacity, dtype=self.dtype)
 
     def copy(self) -> MutableSequence:
         """
-        Creates a shallow copy of the ArrayList.
+        Creates a shallow, copy-on-write copy of the ArrayList, which shares the array of the ArrayList until either of
+        them is mutated.
         Implements copy to fulfill the list interface.
 
         :return: a copy of the ArrayList
         """
-        new_list = ArrayList()
-        for element in self:
-            new_list.append(element)
-        return new_list
+        return self.share(self.array)
 
-    def sort(self) -> None:
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
         """
-        Sorts the ArrayList with mergesort.
+        Sorts the ArrayList in place with an adaptive, stable mergesort. The list is divided into natural runs of
+        ascending or strictly descending elements (descending runs are reversed in place), short runs are extended with
+        binary insertion sort, and runs are merged through a single scratch buffer that is allocated once. While one run
+        keeps winning the comparisons, the merge gallops by binary search and moves whole blocks at a time.
         Implements sort to fulfill the list interface.
 
+        In numeric mode, the ndarray is sorted with a stable numpy sort, and the key function is applied once to the whole
+        ndarray rather than to each element.
+
+        :param key: a function computing the comparison key of an element, called once per element
+        :param reverse: whether to sort in descending order
         :return: None
         """
+        n = self.size
+        if n < 2:
+            return
+        self.own()
+
+        # in numeric mode, the live part of the ndarray is sorted by numpy
+        if self.dtype is not None:
+            live = self.array.elements[:n]
+            if reverse:
+                live[:] = live[::-1]
+            if key is None:
+                live.sort(kind="stable")
+            else:
+                live[:] = live[numpy.argsort(numpy.asarray(key(live)), kind="stable")]
+            if reverse:
+                live[:] = live[::-1]
+            return
+
+        # the elements are sorted directly in the storage of the array
+        # if there is a key function, the keys are sorted and the elements are carried along with them
+        values = self.array.elements
+        if key is None:
+            keys, values = values, None
+        else:
+            keys = [key(values[i]) for i in range(n)]
+
+        # sorting the reversed list in ascending order and reversing the result keeps equal elements stable
+        if reverse:
+            reverse_block(keys, values, 0, n)
+
+        scratch_keys = [None] * n
+        scratch_values = None if values is None else [None] * n
+        min_run = min_run_length(n)
+
+        # runs are pushed on a stack as (start, length) and merged while the lengths are unbalanced
+        runs = []
+        lo = 0
+        while lo < n:
+            hi = lo + 1
+            if hi < n:
+                if keys[hi] < keys[lo]:
+                    while hi < n and keys[hi] < keys[hi - 1]:
+                        hi += 1
+                    reverse_block(keys, values, lo, hi)
+                else:
+                    while hi < n and not keys[hi] < keys[hi - 1]:
+                        hi += 1
+            if hi - lo < min_run:
+                forced_hi = min(lo + min_run, n)
+                binary_insertion_sort(keys, values, lo, hi, forced_hi)
+                hi = forced_hi
+            runs.append((lo, hi - lo))
+            while len(runs) > 1:
+                i = len(runs) - 2
+                if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                        (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                    if runs[i - 1][1] < runs[i + 1][1]:
+                        i -= 1
+                elif runs[i][1] > runs[i + 1][1]:
+                    break
+                merge_runs(keys, values, scratch_keys, scratch_values, runs[i][0], runs[i + 1][0],
+                           runs[i + 1][0] + runs[i + 1][1])
+                runs[i:i + 2] = [(runs[i][0], runs[i][1] + runs[i + 1][1])]
+            lo = hi
+
+        # merge the remaining runs from the top of the stack
+        while len(runs) > 1:
+            (start, _), (mid, length) = runs[-2], runs[-1]
+            merge_runs(keys, values, scratch_keys, scratch_values, start, mid, mid + length)
+            runs[-2:] = [(start, mid + length - start)]
+
+        if reverse:
+            reverse_block(keys, values, 0, n)
+
+    def map(self, function: Callable[[Any], Any]) -> MutableSequence:
+        """
+        Creates a new ArrayList with a function applied to each element of the ArrayList.
+        In numeric mode, the function is applied once to the whole ndarray and must be vectorized (such as a numpy ufunc
+        or arithmetic on its argument).
+
+        :param function: the function to apply
+        :return: an ArrayList of the results
+        """
+        if self.dtype is not None:
+            result = numpy.asarray(function(self.live()))
+            return ArrayList(result, dtype=result.dtype)
+        return ArrayList([function(element) for element in self.array.view(slice(0, self.size))])
+
+    def filter(self, predicate: Callable[[Any], Any]) -> MutableSequence:
+        """
+        Creates a new ArrayList with the elements of the ArrayList that satisfy a predicate.
+        In numeric mode, the predicate is applied once to the whole ndarray and must return a boolean mask.
+
+        :param predicate: the predicate to test
+        :return: an ArrayList of the elements satisfying the predicate
+        """
+        if self.dtype is not None:
+            live = self.live()
+            return ArrayList(live[numpy.asarray(predicate(live), dtype=bool)], dtype=self.dtype)
+        return ArrayList([element for element in self.array.view(slice(0, self.size)) if predicate(element)])
+
+    def sum(self) -> Any:
+        """
+        Adds up the elements of the ArrayList.
+
+        :return: the sum of the elements
+        """
+        if self.dtype is not None:
+            return self.live().sum()
+        return sum(self.array.view(slice(0, self.size)))
+
+    def min(self) -> Any:
+        """
+        Finds the smallest element of the ArrayList.
+
+        :return: the smallest element
+        """
+        if self.size == 0:
+            raise ValueError("min of an empty list")
+        if self.dtype is not None:
+            return self.live().min()
+        return min(self.array.view(slice(0, self.size)))
+
+    def max(self) -> Any:
+        """
+        Finds the largest element of the ArrayList.
+
+        :return: the largest element
+        """
+        if self.size == 0:
+            raise ValueError("max of an empty list")
+        if self.dtype is not None:
+            return self.live().max()
+        return max(self.array.view(slice(0, self.size)))
+
+    def searchsorted(self, value: Any, side: str = "left") -> int:
+        """
+        Finds the index at which a value would be inserted into the (sorted) ArrayList to keep it sorted.
+
+        :param value: the value to be inserted
+        :param side: "left" for the first suitable index, or "right" for the last one
+        :return: the insertion index
+        """
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right'")
+        if self.dtype is not None:
+            return int(numpy.searchsorted(self.live(), value, side=side))
+        search = bisect_left if side == "left" else bisect_right
+        return search(self.array, value, 0, self.size)
+
+    def argsort(self) -> MutableSequence:
+        """
+        Finds the indices which would sort the ArrayList. Equal elements keep their relative order.
+
+        :return: an ArrayList of the indices of the elements in sorted order
+        """
+        if self.dtype is not None:
+            order = numpy.argsort(self.live(), kind="stable")
+            return ArrayList(order, dtype=order.dtype)
+        order = ArrayList(range(self.size))
+        order.sort(key=self.live().__getitem__)
+        return order
+
+
+def min_run_length(n: int) -> int:
+    """
+    Computes the minimum length of a run such that n / min_run is close to, but no more than, a power of two. This
+    keeps the final merges balanced.
+
+    :param n: the number of elements being sorted
+    :return: the minimum run length
+    """
+    extra = 0
+    while n >= MIN_RUN:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def reverse_block(keys: list, values: Optional[list], lo: int, hi: int) -> None:
+    """
+    Reverses the keys (and the values carried with them) in the interval [lo, hi).
+
+    :param keys: the sort keys
+    :param values: the values carried with the keys, or None
+    :param lo: the start (inclusive) of the interval
+    :param hi: the end (exclusive) of the interval
+    :return: None
+    """
+    keys[lo:hi] = keys[lo:hi][::-1]
+    if values is not None:
+        values[lo:hi] = values[lo:hi][::-1]
+
+
+def binary_insertion_sort(keys: list, values: Optional[list], lo: int, start: int, hi: int) -> None:
+    """
+    Extends the sorted interval [lo, start) to [lo, hi) by binary insertion. Each insertion point is found with a binary
+    search and the elements behind it are shifted as a single block.
+
+    :param keys: the sort keys
+    :param values: the values carried with the keys, or None
+    :param lo: the start (inclusive) of the sorted interval
+    :param start: the end (exclusive) of the sorted interval
+    :param hi: the end (exclusive) of the interval to be sorted
+    :return: None
+    """
+    for i in range(start, hi):
+        k = keys[i]
+        position = bisect_right(keys, k, lo, i)
+        if position < i:
+            keys[position + 1:i + 1] = keys[position:i]
+            keys[position] = k
+            if values is not None:
+                v = values[i]
+                values[position + 1:i + 1] = values[position:i]
+                values[position] = v
+
+
+def merge_runs(keys: list, values: Optional[list], scratch_keys: list, scratch_values: Optional[list],
+               lo: int, mid: int, hi: int) -> None:
+    """
+    Merges the adjacent sorted runs [lo, mid) and [mid, hi) in place. Elements of the left run which are already in
+    position are skipped, as are elements of the right run, and the rest of the left run is moved to the scratch buffer
+    before merging. Once one run has won MIN_GALLOP comparisons in a row, the merge switches to galloping: the extent of
+    the winning block is found by binary search and the block is moved at once.
+
+    :param keys: the sort keys
+    :param values: the values carried with the keys, or None
+    :param scratch_keys: the scratch buffer for the keys
+    :param scratch_values: the scratch buffer for the values, or None
+    :param lo: the start (inclusive) of the left run
+    :param mid: the end (exclusive) of the left run and the start (inclusive) of the right run
+    :param hi: the end (exclusive) of the right run
+    :return: None
+    """
+
+    # skip the prefix of the left run and the suffix of the right run which are already in position
+    lo = bisect_right(keys, keys[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(keys, keys[mid - 1], mid, hi)
+
+    # move the left run into the scratch buffer
+    left_size = mid - lo
+    scratch_keys[:left_size] = keys[lo:mid]
+    if values is not None:
+        scratch_values[:left_size] = values[lo:mid]
+
+    i, j, d = 0, mid, lo
+    left_wins, right_wins = 0, 0
+    while i < left_size and j < hi:
+        if keys[j] < scratch_keys[i]:
+            keys[d] = keys[j]
+            if values is not None:
+                values[d] = values[j]
+            j += 1
+            d += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and j < hi:
+                end = bisect_left(keys, scratch_keys[i], j, hi)
+                keys[d:d + end - j] = keys[j:end]
+                if values is not None:
+                    values[d:d + end - j] = values[j:end]
+                d += end - j
+                j = end
+                right_wins = 0
+        else:
+            keys[d] = scratch_keys[i]
+            if values is not None:
+                values[d] = scratch_values[i]
+            i += 1
+            d += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < left_size:
+                end = bisect_right(scratch_keys, keys[j], i, left_size)
+                keys[d:d + end - i] = scratch_keys[i:end]
+                if values is not None:
+                    values[d:d + end - i] = scratch_values[i:end]
+                d += end - i
+                i = end
+                left_wins = 0
 
-        list_size = 1
-        while list_size < self.size:
-            for start in range(0, self.size, 2 * list_size):
-                list1 = self[start:start + list_size]
-                iter1 = iter(list1)
-
-                try:
-                    val1 = next(iter1)
-                except StopIteration:
-                    iter1, val1 = None, None
-
-                list2 = self[start + list_size: start + (2 * list_size)]
-                iter2 = iter(list2)
-
-                try:
-                    val2 = next(iter2)
-                except StopIteration:
-                    iter2, val2 = None, None
-
-                index = start
-                while (iter1 is not None) or (iter2 is not None):
-                    if iter1 is None:
-                        self.array[index] = val2
-                        try:
-                            val2 = next(iter2)
-                        except StopIteration:
-                            iter2, val2 = None, None
-                    elif iter2 is None:
-                        self.array[index] = val1
-                        try:
-                            val1 = next(iter1)
-                        except StopIteration:
-                            iter1, val1 = None, None
-                    elif val2 < val1:
-                        self.array[index] = val2
-                        try:
-                            val2 = next(iter2)
-                        except StopIteration:
-                            iter2, val2 = None, None
-                    else:
-                        self.array[index] = val1
-                        try:
-                            val1 = next(iter1)
-                        except StopIteration:
-                            iter1, val1 = None, None
-                    index += 1
-            list_size *= 2
+    # the rest of the right run is already in position, so only the rest of the left run is moved
+    keys[d:d + left_size - i] = scratch_keys[i:left_size]
+    if values is not None:
+        values[d:d + left_size - i] = scratch_values[i:left_size]
@@ -0,0 +1,338 @@
+from array import array as typed_array
+from collections.abc import Sequence, Iterable, Iterator
+from typing import Union
+from library.array import Array
+
+# the number of bytes converted to an integer at a time when scanning for a set bit
+SCAN_BLOCK: int = 4096
+
+
+class BitArray(Sequence):
+    def __init__(self, size: int = 0) -> None:
+        """
+        The BitArray is a fixed-length array of booleans which stores each element as a single bit. The bits are packed
+        into a typed Array of bytes, bit i being bit (i % 8) of byte (i // 8), so the BitArray uses 1/64 of the memory
+        of an Array of booleans. The bits past the end of the array in the last byte are always zero.
+
+        The bulk operations (&, |, ^, ~, count, find_first_set) treat the whole array as one python integer, so that
+        they run a machine word at a time rather than a bit at a time. fill sets or clears a contiguous slice a byte at
+        a time, and a contiguous slice is read or written through the integer form of only the bytes it covers.
+
+        Implements abstract methods from Sequence:
+        __getitem__, __len__
+
+        Includes mixin methods from Sequence:
+        __contains__, __reversed__, index
+
+        Overrides mixin methods from Sequence:
+        __iter__, count
+
+        Implements bitwise operators:
+        __and__, __or__, __xor__, __invert__, __iand__, __ior__, __ixor__
+
+        Overrides methods from object:
+        __repr__
+
+        :param size: the number of bits
+        """
+        self.size: int = size
+        self.array: Array = Array((size + 7) // 8, typecode="B")
+
+    @classmethod
+    def from_int(cls, value: int, size: int) -> "BitArray":
+        """
+        Creates a BitArray from the lowest bits of an integer, bit i of the integer becoming element i.
+
+        :param value: the integer
+        :param size: the number of bits
+        :return: the BitArray
+        """
+        bits = cls(size)
+        value &= (1 << size) - 1
+        bits.array.elements = typed_array("B", value.to_bytes(len(bits.array), "little"))
+        return bits
+
+    def to_int(self) -> int:
+        """
+        Converts the BitArray into an integer, element i becoming bit i of the integer.
+
+        :return: the integer
+        """
+        return int.from_bytes(self.array.elements, "little")
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the BitArray.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for bit in self:
+                s = s + f"{bit}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of bits in the BitArray.
+        Overrides abstract method in Collection.
+
+        :return: the number of bits
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which unpacks the bits one byte at a time.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the BitArray
+        """
+        remaining = self.size
+        for byte in self.array.elements:
+            for shift in range(min(8, remaining)):
+                yield bool((byte >> shift) & 1)
+            remaining -= 8
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bool, "BitArray"]:
+        """
+        Retrieves the bit in an index or a BitArray of the bits in a slice of the BitArray.
+        Overrides abstract method in Sequence.
+
+        :param index: the index or slice
+        :return: the bit or BitArray of bits
+        """
+
+        # if the index is an integer, return the bit at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                return bool((self.array.elements[index >> 3] >> (index & 7)) & 1)
+            raise IndexError("bit array index out of range")
+
+        # if the index is a slice, return a new BitArray with the bits in the slice
+        # a contiguous slice is shifted out of the integer form of the bytes it covers
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            positions = range(start, stop, step)
+            if step == 1:
+                if start >= stop:
+                    return BitArray(0)
+                covered = self.array.elements[start >> 3:((stop - 1) >> 3) + 1]
+                return BitArray.from_int(int.from_bytes(covered, "little") >> (start & 7), len(positions))
+            bits = BitArray(len(positions))
+            for i, position in enumerate(positions):
+                if self[position]:
+                    bits[i] = True
+            return bits
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], value: Union[bool, Iterable]) -> None:
+        """
+        Sets the bit in an index, or the bits in a slice with an iterable of values of the same length.
+
+        :param index: the index or slice
+        :param value: the value or iterable of values
+        :return: None
+        """
+
+        # if the index is an integer, set the bit at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                if value:
+                    self.array.elements[index >> 3] |= 1 << (index & 7)
+                else:
+                    self.array.elements[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+                return
+            raise IndexError("bit array index out of range")
+
+        # if the index is a slice, a contiguous slice is written a byte at a time, and any other slice one bit at a time
+        if isinstance(index, slice):
+            if isinstance(value, Iterable):
+                positions = range(*index.indices(self.size))
+                values = value if isinstance(value, BitArray) else list(value)
+                if len(values) != len(positions):
+                    raise ValueError(
+                        f"attempt to assign sequence of size {len(values)} to slice of size {len(positions)}")
+                if positions.step == 1:
+                    if isinstance(values, BitArray):
+                        bits = values.to_int()
+                    else:
+                        bits = int("".join("1" if bit else "0" for bit in reversed(values)) or "0", 2)
+                    self.write_bits(positions.start, positions.stop, bits)
+                    return
+                for position, bit in zip(positions, values):
+                    self[position] = bit
+                return
+            raise TypeError("can only assign an iterable")
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def fill(self, value: bool, index: slice = slice(None)) -> None:
+        """
+        Sets (or clears) every bit in a slice of the BitArray. A contiguous slice is filled a whole byte at a time, with
+        only the partial bytes at either end masked.
+
+        :param value: whether to set or clear the bits
+        :param index: the slice
+        :return: None
+        """
+        start, stop, step = index.indices(self.size)
+        if step != 1:
+            for position in range(start, stop, step):
+                self[position] = value
+            return
+        if start >= stop:
+            return
+        elements = self.array.elements
+        first, last = start >> 3, (stop - 1) >> 3
+        for byte_index in {first, last}:
+            low = start - 8 * byte_index if byte_index == first else 0
+            high = stop - 8 * byte_index if byte_index == last else 8
+            mask = ((1 << (high - low)) - 1) << low
+            elements[byte_index] = (elements[byte_index] | mask) if value else (elements[byte_index] & ~mask & 0xFF)
+        if last - first > 1:
+            elements[first + 1:last] = typed_array("B", [0xFF if value else 0]) * (last - first - 1)
+
+    def write_bits(self, start: int, stop: int, bits: int) -> None:
+        """
+        Writes the lowest bits of an integer into the contiguous slice [start, stop) of the BitArray. Only the bytes
+        covered by the slice are converted to an integer, and the bits outside the slice in its first and last bytes are
+        kept by masking them, as in fill().
+
+        :param start: the start (inclusive) of the slice
+        :param stop: the end (exclusive) of the slice
+        :param bits: the integer whose bit i is written to index start + i
+        :return: None
+        """
+        if start >= stop:
+            return
+        elements = self.array.elements
+        first, last = start >> 3, (stop - 1) >> 3
+        mask = ((1 << (stop - start)) - 1) << (start & 7)
+        block = int.from_bytes(elements[first:last + 1], "little")
+        block = (block & ~mask) | ((bits << (start & 7)) & mask)
+        elements[first:last + 1] = typed_array("B", block.to_bytes(last - first + 1, "little"))
+
+    def count(self, value: bool = True) -> int:
+        """
+        Counts the bits which are set (or clear) by counting the ones in the binary string of the integer form of the
+        array, which runs in C rather than a bit at a time (int.bit_count() needs Python 3.10).
+        Overrides mixin method in Sequence.
+
+        :param value: whether to count the set bits or the clear bits
+        :return: the number of bits with the value
+        """
+        ones = bin(self.to_int()).count("1")
+        return ones if value else self.size - ones
+
+    def find_first_set(self, start: int = 0) -> int:
+        """
+        Finds the first set bit at or after an index. The bytes are scanned in blocks which are each converted to an
+        integer, so that the scan does not examine one bit or byte at a time.
+
+        :param start: the index to start from
+        :return: the index of the first set bit, or -1 if there is none
+        """
+        start = max(0, start)
+        elements = self.array.elements
+        block_start = start >> 3
+        while block_start < len(elements):
+            block = int.from_bytes(elements[block_start:block_start + SCAN_BLOCK], "little")
+            if block_start == start >> 3:
+                block &= ~((1 << (start & 7)) - 1)
+            if block:
+                return 8 * block_start + (block & -block).bit_length() - 1
+            block_start += SCAN_BLOCK
+        return -1
+
+    def combine(self, other: "BitArray", operator: str) -> int:
+        """
+        Combines the integer forms of two BitArrays of the same size with a bitwise operator.
+
+        :param other: the other BitArray
+        :param operator: "&", "|" or "^"
+        :return: the combined integer
+        """
+        if not isinstance(other, BitArray):
+            raise TypeError("can only combine a BitArray with another BitArray")
+        if other.size != self.size:
+            raise ValueError("bit arrays must have the same size")
+        if operator == "&":
+            return self.to_int() & other.to_int()
+        if operator == "|":
+            return self.to_int() | other.to_int()
+        return self.to_int() ^ other.to_int()
+
+    def __and__(self, other: "BitArray") -> "BitArray":
+        """
+        Creates the intersection of two BitArrays.
+
+        :param other: the other BitArray
+        :return: the BitArray of the bits set in both
+        """
+        return BitArray.from_int(self.combine(other, "&"), self.size)
+
+    def __or__(self, other: "BitArray") -> "BitArray":
+        """
+        Creates the union of two BitArrays.
+
+        :param other: the other BitArray
+        :return: the BitArray of the bits set in either
+        """
+        return BitArray.from_int(self.combine(other, "|"), self.size)
+
+    def __xor__(self, other: "BitArray") -> "BitArray":
+        """
+        Creates the symmetric difference of two BitArrays.
+
+        :param other: the other BitArray
+        :return: the BitArray of the bits set in exactly one
+        """
+        return BitArray.from_int(self.combine(other, "^"), self.size)
+
+    def __invert__(self) -> "BitArray":
+        """
+        Creates the complement of the BitArray.
+
+        :return: the BitArray of the bits which are clear
+        """
+        return BitArray.from_int(~self.to_int(), self.size)
+
+    def __iand__(self, other: "BitArray") -> "BitArray":
+        """
+        Intersects the BitArray with another in place.
+
+        :param other: the other BitArray
+        :return: the BitArray
+        """
+        self.array = BitArray.from_int(self.combine(other, "&"), self.size).array
+        return self
+
+    def __ior__(self, other: "BitArray") -> "BitArray":
+        """
+        Unites the BitArray with another in place.
+
+        :param other: the other BitArray
+        :return: the BitArray
+        """
+        self.array = BitArray.from_int(self.combine(other, "|"), self.size).array
+        return self
+
+    def __ixor__(self, other: "BitArray") -> "BitArray":
+        """
+        Takes the symmetric difference of the BitArray with another in place.
+
+        :param other: the other BitArray
+        :return: the BitArray
+        """
+        self.array = BitArray.from_int(self.combine(other, "^"), self.size).array
+        return self
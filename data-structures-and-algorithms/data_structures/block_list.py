@@ -0,0 +1,338 @@
+from collections.abc import MutableSequence, Iterable, Iterator
+from itertools import chain
+from typing import Union, Any
+from library.array import Array
+
+CHUNK_CAPACITY: int = 512
+
+
+class BlockList(MutableSequence):
+    def __init__(self, elements: Iterable = (), chunk_capacity: int = CHUNK_CAPACITY) -> None:
+        """
+        The BlockList (or B-list) stores the values of the list in a sequence of chunks, each of which is an array with a
+        fixed capacity. A Fenwick tree over the sizes of the chunks serves as a cumulative-size index, so the chunk which
+        holds any index can be found in O(log n) time. An insertion or deletion only shifts the elements within a single
+        chunk. A chunk which becomes full is split in two, and a chunk which becomes small is merged with a neighbour, at
+        which point the index is rebuilt. With the default chunk capacity, an insertion or deletion anywhere in the list
+        costs a binary search plus a block move of at most a few hundred elements.
+
+        Implements abstract methods from MutableSequence:
+        __getitem__, __setitem__, __delitem__, __len__, insert
+
+        Includes mixin methods from MutableSequence:
+        __contains__, __reversed__, index, count, append, reverse, pop, remove, __iadd__
+
+        Overrides mixin methods from MutableSequence:
+        clear, extend, __iter__
+
+        Implements methods from list:
+        copy
+
+        Overrides methods from object:
+        __repr__
+
+        :param elements: the initial elements of the BlockList
+        :param chunk_capacity: the capacity of each chunk
+        """
+        if chunk_capacity < 4:
+            raise ValueError("chunk capacity must be at least 4")
+        self.size: int = 0
+        self.chunk_capacity: int = chunk_capacity
+        self.chunks: list = []
+        self.sizes: list = []
+        self.tree: list = [0]
+
+        # initialize the list
+        self.extend(elements)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the BlockList.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for element in self:
+                s = s + f"{element}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the BlockList.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which reads the chunks one after another.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the list
+        """
+        return chain.from_iterable(chunk.view(slice(0, size)) for chunk, size in zip(self.chunks, self.sizes))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
+        """
+        Retrieves the element in an index or elements in a slice of the BlockList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: the value or values
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                k, offset = self.locate(index % self.size)
+                return self.chunks[k][offset]
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, return a new BlockList with the elements in the slice
+        if isinstance(index, slice):
+            return BlockList(list(self)[index], self.chunk_capacity)
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Any, Iterable]) -> None:
+        """
+        Sets the element in an index or elements in a slice of the BlockList with a value or iterable of values.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :param value: the value or values
+        :return: None
+        """
+
+        # if the index is an integer, set the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                k, offset = self.locate(index % self.size)
+                self.chunks[k][offset] = value
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the chunks are rebuilt from the updated elements
+        if isinstance(index, slice):
+            if isinstance(value, Iterable):
+                elements = list(self)
+                elements[index] = value
+                self.clear()
+                self.extend(elements)
+                return
+            raise TypeError("can only assign an iterable")
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Deletes the element in an index or elements in a slice of the BlockList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: None
+        """
+
+        # if the index is an integer, delete the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                k, offset = self.locate(index % self.size)
+                chunk, chunk_size = self.chunks[k], self.sizes[k]
+                chunk[offset:chunk_size - 1] = chunk.view(slice(offset + 1, chunk_size))
+                chunk[chunk_size - 1] = None
+                self.sizes[k] -= 1
+                self.size -= 1
+                if self.sizes[k] < self.chunk_capacity // 4:
+                    self.merge(k)
+                else:
+                    self.update_index(k, -1)
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the chunks are rebuilt from the remaining elements
+        if isinstance(index, slice):
+            elements = list(self)
+            del elements[index]
+            self.clear()
+            self.extend(elements)
+            return
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a new value into the BlockList at a given index. Only the elements behind the index in the same chunk are
+        shifted, and the chunk is split in two if it is full.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the new value
+        :return: None
+        """
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+            if self.size == 0:
+                self.chunks.append(Array(self.chunk_capacity))
+                self.sizes.append(0)
+                self.rebuild_index()
+            if index == self.size:
+                k, offset = len(self.chunks) - 1, self.sizes[-1]
+            else:
+                k, offset = self.locate(index)
+            if self.sizes[k] == self.chunk_capacity:
+                self.split(k)
+                if offset > self.sizes[k]:
+                    k, offset = k + 1, offset - self.sizes[k]
+            chunk, chunk_size = self.chunks[k], self.sizes[k]
+            chunk[offset + 1:chunk_size + 1] = chunk.view(slice(offset, chunk_size))
+            chunk[offset] = value
+            self.sizes[k] += 1
+            self.size += 1
+            self.update_index(k, 1)
+            return
+        raise IndexError("index out of range")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of extend() inserts the values one at a time.
+    # Instead, the last chunk is filled and new chunks are created in blocks,
+    # and the index is rebuilt once at the end.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of the BlockList.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: None
+        """
+        values = list(values)
+        position = 0
+        while position < len(values):
+            if not self.chunks or self.sizes[-1] == self.chunk_capacity:
+                self.chunks.append(Array(self.chunk_capacity))
+                self.sizes.append(0)
+            chunk, chunk_size = self.chunks[-1], self.sizes[-1]
+            block = values[position:position + self.chunk_capacity - chunk_size]
+            chunk[chunk_size:chunk_size + len(block)] = block
+            self.sizes[-1] += len(block)
+            position += len(block)
+        self.size += len(values)
+        self.rebuild_index()
+
+    def split(self, k: int) -> None:
+        """
+        Splits a chunk into two chunks holding half of its elements each.
+
+        :param k: the index of the chunk
+        :return: None
+        """
+        chunk, chunk_size = self.chunks[k], self.sizes[k]
+        half = chunk_size // 2
+        new_chunk = Array(self.chunk_capacity)
+        new_chunk[:chunk_size - half] = chunk.view(slice(half, chunk_size))
+        chunk[half:chunk_size] = [None] * (chunk_size - half)
+        self.chunks.insert(k + 1, new_chunk)
+        self.sizes[k] = half
+        self.sizes.insert(k + 1, chunk_size - half)
+        self.rebuild_index()
+
+    def merge(self, k: int) -> None:
+        """
+        Merges a small chunk into one of its neighbours if the elements of both fit comfortably into one chunk, and
+        removes the chunk if it is empty. The chunk has just lost an element which the index does not account for yet.
+
+        :param k: the index of the chunk
+        :return: None
+        """
+        if self.sizes[k] > 0:
+            if k + 1 < len(self.chunks) and self.sizes[k] + self.sizes[k + 1] <= 3 * self.chunk_capacity // 4:
+                left = k
+            elif k > 0 and self.sizes[k - 1] + self.sizes[k] <= 3 * self.chunk_capacity // 4:
+                left = k - 1
+            else:
+                # the chunk stays, and only its size changed
+                self.update_index(k, -1)
+                return
+            left_chunk, left_size = self.chunks[left], self.sizes[left]
+            right_size = self.sizes[left + 1]
+            left_chunk[left_size:left_size + right_size] = self.chunks[left + 1].view(slice(0, right_size))
+            self.sizes[left] += right_size
+            k = left + 1
+        del self.chunks[k]
+        del self.sizes[k]
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """
+        Builds the Fenwick tree over the sizes of the chunks in linear time.
+
+        :return: None
+        """
+        self.tree = [0] + self.sizes
+        for i in range(1, len(self.tree)):
+            j = i + (i & -i)
+            if j < len(self.tree):
+                self.tree[j] += self.tree[i]
+
+    def update_index(self, k: int, delta: int) -> None:
+        """
+        Updates the Fenwick tree after the size of a chunk has changed.
+
+        :param k: the index of the chunk
+        :param delta: the change in the size of the chunk
+        :return: None
+        """
+        i = k + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def locate(self, index: int) -> tuple:
+        """
+        Finds the chunk holding an index by descending the Fenwick tree.
+
+        :param index: a valid, non-negative index of the list
+        :return: the index of the chunk and the offset of the element within the chunk
+        """
+        k = 0
+        bit = 1 << (len(self.tree) - 1).bit_length()
+        while bit:
+            next_k = k + bit
+            if next_k < len(self.tree) and self.tree[next_k] <= index:
+                k = next_k
+                index -= self.tree[next_k]
+            bit >>= 1
+        return k, index
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin method implements the clear() method by repeatedly removing
+    # single values. A more efficient method is to reset the list all at once.
+    def clear(self) -> None:
+        """
+        Removes all the elements in the BlockList.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        self.size = 0
+        self.chunks = []
+        self.sizes = []
+        self.tree = [0]
+
+    def copy(self) -> MutableSequence:
+        """
+        Creates a shallow copy of the BlockList.
+        Implements copy to fulfill the list interface.
+
+        :return: a copy of the BlockList
+        """
+        return BlockList(self, self.chunk_capacity)
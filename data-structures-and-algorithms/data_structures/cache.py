@@ -0,0 +1,356 @@
+from functools import wraps
+from time import monotonic
+from typing import Any, Callable, Optional
+from library.doubly_linked_list import DoublyLinkedList, DoublyLinkedListNode, DoublyLinkedListCursor
+from library.hash_map import HashMap
+
+# the eviction policies of a cache
+POLICIES: tuple = ("lru", "lfu", "ttl")
+
+# marks a missing value, and separates the positional from the keyword arguments in a memoization key
+MISSING: object = object()
+
+
+class CacheEntry:
+    __slots__ = ("key", "value", "expires", "group")
+
+    def __init__(self, key: Any, value: Any, expires: float, group: Optional[DoublyLinkedListNode]):
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.group = group
+
+
+class FrequencyGroup:
+    __slots__ = ("frequency", "entries")
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.entries = DoublyLinkedList()
+
+
+class Cache:
+    def __init__(self, maxsize: int = 128, policy: str = "lru", ttl: Optional[float] = None,
+                 timer: Callable[[], float] = monotonic) -> None:
+        """
+        The Cache maps at most maxsize keys to values. A HashMap maps each key to the node of its entry in a
+        DoublyLinkedList, so that an entry is found, moved and removed in constant time, and the list order decides
+        which entry is evicted when the cache is full:
+
+        - lru: the list is in order of use, and the least recently used entry is evicted.
+        - lfu: the entries are grouped by the number of times they were used. The groups are nodes of another
+          DoublyLinkedList in increasing order of frequency, and each group holds a DoublyLinkedList of its entries in
+          order of use. The least recently used entry of the least frequently used group is evicted.
+        - ttl: the list is in order of insertion, which is also the order of expiry, and the entry which expires first
+          is evicted.
+
+        If the cache has a ttl, an entry expires ttl seconds after it was put, with any policy. An expired entry is
+        removed when it is next read, or by expire().
+
+        The cache counts its hits, misses, evictions and expirations.
+
+        :param maxsize: the maximum number of entries
+        :param policy: the eviction policy, one of "lru", "lfu" or "ttl"
+        :param ttl: the number of seconds an entry lives, or None for entries which do not expire
+        :param timer: the clock of the expiry times
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError(f"unknown eviction policy {policy!r}")
+        if policy == "ttl" and ttl is None:
+            raise ValueError("the ttl policy requires a ttl")
+        self.maxsize: int = maxsize
+        self.policy: str = policy
+        self.ttl: Optional[float] = ttl
+        self.timer: Callable[[], float] = timer
+        self.size: int = 0
+        self.nodes: HashMap = HashMap(maxsize)
+
+        # the entries in eviction order (lru and ttl), or the frequency groups in increasing order of frequency (lfu)
+        self.order: DoublyLinkedList = DoublyLinkedList()
+
+        # the statistics of the cache
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the Cache.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        return f"Cache(size={self.size}, maxsize={self.maxsize}, policy={self.policy!r}, ttl={self.ttl})"
+
+    def __len__(self) -> int:
+        """
+        Counts the entries of the Cache, including expired entries which have not been removed yet.
+
+        :return: the number of entries
+        """
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether a key has an entry in the Cache which has not expired, without counting a hit or a miss.
+
+        :param key: the key
+        :return: whether the key is in the cache
+        """
+        node = self.lookup(key)
+        return node is not None and not self.expired(node.val)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Retrieves the value of a key, and counts a hit or a miss. A hit counts as a use of the entry.
+
+        :param key: the key
+        :param default: the value returned if the key is not in the cache
+        :return: the value of the key, or the default
+        """
+        node = self.lookup(key)
+        if node is not None and self.expired(node.val):
+            self.remove(node)
+            self.expirations += 1
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.policy != "ttl":
+            self.use(node)
+        return node.val.value
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Sets the value of a key, evicting an entry if the cache is full. Putting a key which is already in the cache
+        counts as a use of its entry and restarts its time to live.
+
+        :param key: the key
+        :param value: the value
+        :return: None
+        """
+        expires = float("inf") if self.ttl is None else self.timer() + self.ttl
+        node = self.lookup(key)
+        if node is not None:
+            entry = node.val
+            entry.value = value
+            entry.expires = expires
+            if self.policy == "ttl":
+                self.order.unlink(node)
+                self.order.link_chain(node, node, 1, len(self.order))
+            else:
+                self.use(node)
+            return
+        if self.size == self.maxsize:
+            self.evict()
+
+        # a new entry joins the end of the list, or the end of the group of frequency 1
+        if self.policy == "lfu":
+            group = self.order.head
+            if group is None or group.val.frequency != 1:
+                self.order.insert(0, FrequencyGroup(1))
+                group = self.order.head
+            entries = group.val.entries
+        else:
+            group = None
+            entries = self.order
+        entries.append(CacheEntry(key, value, expires, group))
+        self.nodes.insert(key, entries.tail)
+        self.size += 1
+
+    def delete(self, key: Any) -> None:
+        """
+        Removes the entry of a key from the Cache.
+
+        :param key: the key
+        :return: None
+        """
+        node = self.lookup(key)
+        if node is None:
+            raise KeyError(key)
+        self.remove(node)
+
+    def evict(self) -> tuple:
+        """
+        Removes the entry chosen by the eviction policy: the least recently used entry (lru), the least recently used
+        entry of the least frequently used ones (lfu) or the entry which expires first (ttl).
+
+        :return: the key and value of the evicted entry
+        """
+        if self.size == 0:
+            raise KeyError("evict from an empty cache")
+        node = self.order.head.val.entries.head if self.policy == "lfu" else self.order.head
+        self.remove(node)
+        self.evictions += 1
+        return node.val.key, node.val.value
+
+    def expire(self) -> int:
+        """
+        Removes every expired entry from the Cache. With the ttl policy, the entries are in order of expiry, so only the
+        expired entries are visited; with the other policies, every entry is checked.
+
+        :return: the number of removed entries
+        """
+        if self.ttl is None:
+            return 0
+        if self.policy == "ttl":
+            expired = []
+            node = self.order.head
+            while node is not None and self.expired(node.val):
+                expired.append(node)
+                node = node.nxt
+        elif self.policy == "lfu":
+            expired = [node for group in iter_nodes(self.order) for node in iter_nodes(group.val.entries)
+                       if self.expired(node.val)]
+        else:
+            expired = [node for node in iter_nodes(self.order) if self.expired(node.val)]
+        for node in expired:
+            self.remove(node)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the Cache. The statistics are kept.
+
+        :return: None
+        """
+        self.size = 0
+        self.nodes = HashMap(self.maxsize)
+        self.order = DoublyLinkedList()
+
+    def stats(self) -> dict:
+        """
+        Collects the statistics of the Cache.
+
+        :return: the numbers of hits, misses, evictions and expirations, the size and the hit rate
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "expirations": self.expirations, "size": self.size,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def lookup(self, key: Any) -> Optional[DoublyLinkedListNode]:
+        """
+        Finds the node of the entry of a key.
+
+        :param key: the key
+        :return: the node, or None if the key is not in the cache
+        """
+        try:
+            return self.nodes.access(key)
+        except KeyError:
+            return None
+
+    def expired(self, entry: CacheEntry) -> bool:
+        """
+        Checks whether an entry has expired.
+
+        :param entry: the entry
+        :return: whether the entry has expired
+        """
+        return entry.expires <= self.timer()
+
+    def use(self, node: DoublyLinkedListNode) -> None:
+        """
+        Records a use of an entry: with the lru policy the entry is moved to the end of the list, and with the lfu
+        policy it is moved to the end of the group of the next frequency, which is created after its group if needed.
+
+        :param node: the node of the entry
+        :return: None
+        """
+        if self.policy == "lru":
+            self.order.unlink(node)
+            self.order.link_chain(node, node, 1, len(self.order))
+            return
+        group = node.val.group
+        frequency = group.val.frequency + 1
+        if group.nxt is None or group.nxt.val.frequency != frequency:
+            DoublyLinkedListCursor(self.order, group).insert_after(FrequencyGroup(frequency))
+        group.val.entries.unlink(node)
+        next_group = group.nxt
+        next_group.val.entries.link_chain(node, node, 1, len(next_group.val.entries))
+        node.val.group = next_group
+        if len(group.val.entries) == 0:
+            self.order.unlink(group)
+
+    def remove(self, node: DoublyLinkedListNode) -> None:
+        """
+        Removes the entry of a node from the cache, and its frequency group if the group becomes empty.
+
+        :param node: the node of the entry
+        :return: None
+        """
+        group = node.val.group
+        if group is None:
+            self.order.unlink(node)
+        else:
+            group.val.entries.unlink(node)
+            if len(group.val.entries) == 0:
+                self.order.unlink(group)
+        self.nodes.delete(node.val.key)
+        self.size -= 1
+
+
+def iter_nodes(linked_list: DoublyLinkedList):
+    """
+    Iterates over the nodes of a DoublyLinkedList.
+
+    :param linked_list: the list
+    :return: a generator of the nodes
+    """
+    node = linked_list.head
+    while node is not None:
+        yield node
+        node = node.nxt
+
+
+def make_key(args: tuple, kwargs: dict) -> tuple:
+    """
+    Builds the memoization key of the arguments of a call.
+
+    :param args: the positional arguments
+    :param kwargs: the keyword arguments
+    :return: the key
+    """
+    if not kwargs:
+        return args
+    return args + (MISSING,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(maxsize: int = 128, policy: str = "lru", ttl: Optional[float] = None,
+            key: Optional[Callable[..., Any]] = None) -> Callable:
+    """
+    Creates a decorator which memoizes a function in a Cache. The cache of the decorated function is its cache
+    attribute, e.g. for its statistics.
+
+    The arguments must be hashable, unless a key function is given which builds a hashable key from them, e.g.
+    key=tuple for a function of a single list such as a failure function of a sequence. The cached values are returned
+    as they are, so they must not be mutated by the caller.
+
+    :param maxsize: the maximum number of entries of the cache
+    :param policy: the eviction policy of the cache
+    :param ttl: the number of seconds an entry lives, or None for entries which do not expire
+    :param key: a function computing the cache key from the arguments of a call, or None to use the arguments
+    :return: the decorator
+    """
+    def decorator(function: Callable) -> Callable:
+        cache = Cache(maxsize, policy, ttl)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            cache_key = make_key(args, kwargs) if key is None else key(*args, **kwargs)
+            value = cache.get(cache_key, MISSING)
+            if value is MISSING:
+                value = function(*args, **kwargs)
+                cache.put(cache_key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
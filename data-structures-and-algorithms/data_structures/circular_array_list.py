@@ -0,0 +1,287 @@
+from collections.abc import MutableSequence, Iterable, Iterator, Sized
+from itertools import chain
+from typing import Union, Any
+from library.array import Array
+from library.array_list import DEFAULT_CAPACITY, EXPAND_FACTOR, SHRINK_FACTOR
+
+
+class CircularArrayList(MutableSequence):
+    def __init__(self, elements: Iterable = ()) -> None:
+        """
+        The CircularArrayList stores the values of the list in an array used as a ring buffer. The list starts at a head
+        offset into the array and wraps around the end of the array back to its start. Inserting or deleting at either
+        end of the list only moves the head offset or the end of the list, so both take constant (amortized) time. An
+        insertion or deletion in the middle shifts the elements on whichever side of the index is shorter.
+
+        The array is expanded and shrunk with the same policy as the ArrayList.
+
+        Implements abstract methods from MutableSequence:
+        __getitem__, __setitem__, __delitem__, __len__, insert
+
+        Includes mixin methods from MutableSequence:
+        __contains__, __reversed__, index, count, append, reverse, extend, pop, remove, __iadd__
+
+        Overrides mixin methods from MutableSequence:
+        clear, __iter__
+
+        Implements methods from deque:
+        appendleft, popleft
+
+        Implements methods from list:
+        copy
+
+        Overrides methods from object:
+        __repr__
+
+        :param elements: the initial elements of the CircularArrayList
+        """
+        self.size: int = 0
+        self.head: int = 0
+        if isinstance(elements, Sized):
+            self.array: Array = Array(max(DEFAULT_CAPACITY, len(elements)))
+        else:
+            self.array: Array = Array(DEFAULT_CAPACITY)
+
+        # initialize the list
+        for element in elements:
+            self.append(element)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the CircularArrayList.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for element in self:
+                s = s + f"{element}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the CircularArrayList.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator over the elements, reading the segment from the head to the end of the array followed by
+        the segment which wraps around to the start of the array.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the list
+        """
+        first, second = self.segments()
+        return chain(first, second)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
+        """
+        Retrieves the element in an index or elements in a slice of the CircularArrayList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: the value or values
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                return self.array[(self.head + index) % len(self.array)]
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, return a new CircularArrayList with the elements in the slice
+        if isinstance(index, slice):
+            return CircularArrayList([self[i] for i in range(*index.indices(self.size))])
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Any, Iterable]) -> None:
+        """
+        Sets the element in an index or elements in a slice of the CircularArrayList with a value or iterable of values.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :param value: the value or values
+        :return: None
+        """
+
+        # if the index is an integer, set the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                self.array[(self.head + index) % len(self.array)] = value
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the list is rebuilt from its straightened elements
+        if isinstance(index, slice):
+            if isinstance(value, Iterable):
+                elements = list(self)
+                elements[index] = value
+                self.rebuild(elements)
+                return
+            raise TypeError("can only assign an iterable")
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Deletes the element in an index or elements in a slice of the CircularArrayList. The elements on the shorter
+        side of a deleted index are shifted to close the gap.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: None
+        """
+
+        # if the index is an integer, delete the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                capacity = len(self.array)
+                if index < self.size - 1 - index:
+                    for i in range(index, 0, -1):
+                        self.array[(self.head + i) % capacity] = self.array[(self.head + i - 1) % capacity]
+                    self.array[self.head] = None
+                    self.head = (self.head + 1) % capacity
+                else:
+                    for i in range(index, self.size - 1):
+                        self.array[(self.head + i) % capacity] = self.array[(self.head + i + 1) % capacity]
+                    self.array[(self.head + self.size - 1) % capacity] = None
+                self.size -= 1
+                if self.size <= int(capacity / SHRINK_FACTOR) and capacity > DEFAULT_CAPACITY:
+                    self.reallocate(max(self.size, DEFAULT_CAPACITY, int(capacity / SHRINK_FACTOR)))
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the list is rebuilt from its straightened elements
+        if isinstance(index, slice):
+            elements = list(self)
+            del elements[index]
+            self.rebuild(elements)
+            return
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a new value into the CircularArrayList at a given index. The elements on the shorter side of the index
+        are shifted to make room, so inserting at either end takes constant (amortized) time.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the new value
+        :return: None
+        """
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+            if self.size == len(self.array):
+                self.reallocate(max(self.size + 1, int(self.size * EXPAND_FACTOR)))
+            capacity = len(self.array)
+            if index < self.size - index:
+                self.head = (self.head - 1) % capacity
+                for i in range(index):
+                    self.array[(self.head + i) % capacity] = self.array[(self.head + i + 1) % capacity]
+            else:
+                for i in range(self.size, index, -1):
+                    self.array[(self.head + i) % capacity] = self.array[(self.head + i - 1) % capacity]
+            self.array[(self.head + index) % capacity] = value
+            self.size += 1
+            return
+        raise IndexError("index out of range")
+
+    def appendleft(self, value: Any) -> None:
+        """
+        Inserts a new value at the front of the CircularArrayList.
+
+        :param value: the new value
+        :return: None
+        """
+        self.insert(0, value)
+
+    def popleft(self) -> Any:
+        """
+        Removes and returns the value at the front of the CircularArrayList.
+
+        :return: the removed value
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        value = self.array[self.head]
+        del self[0]
+        return value
+
+    def segments(self) -> tuple:
+        """
+        Splits the list into the two contiguous segments of the array that it occupies: the segment from the head
+        towards the end of the array, and the segment which wraps around to the start of the array (which may be empty).
+
+        :return: the two segments as views of the array
+        """
+        end = self.head + self.size
+        capacity = len(self.array)
+        if end <= capacity:
+            return self.array.view(slice(self.head, end)), self.array.view(slice(0, 0))
+        return self.array.view(slice(self.head, capacity)), self.array.view(slice(0, end - capacity))
+
+    def reallocate(self, capacity: int) -> None:
+        """
+        Moves the elements into a new array with the given capacity, straightening them so that the head is at the
+        start of the new array.
+
+        :param capacity: the capacity of the new array
+        :return: None
+        """
+        first, second = self.segments()
+        new_array = Array(capacity)
+        new_array[:len(first)] = first
+        new_array[len(first):self.size] = second
+        self.array = new_array
+        self.head = 0
+
+    def rebuild(self, elements: list) -> None:
+        """
+        Replaces the contents of the list with the given elements, straightened at the start of a new array.
+
+        :param elements: the new elements
+        :return: None
+        """
+        self.array = Array(max(DEFAULT_CAPACITY, len(elements)))
+        self.array[:len(elements)] = elements
+        self.size = len(elements)
+        self.head = 0
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin method implements the clear() method by repeatedly removing
+    # single values. A more efficient method is to reset the list all at once.
+    def clear(self) -> None:
+        """
+        Removes all the elements in the CircularArrayList.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        self.size = 0
+        self.head = 0
+        self.array = Array(DEFAULT_CAPACITY)
+
+    def copy(self) -> MutableSequence:
+        """
+        Creates a shallow copy of the CircularArrayList.
+        Implements copy to fulfill the list interface.
+
+        :return: a copy of the CircularArrayList
+        """
+        return CircularArrayList(list(self))
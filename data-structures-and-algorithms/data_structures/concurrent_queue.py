@@ -0,0 +1,418 @@
+import asyncio
+import threading
+from collections import deque
+from queue import Empty, Full
+from typing import Any, Callable, Iterable, Optional
+from library.doubly_linked_list import DoublyLinkedList, DoublyLinkedListNode
+
+
+class ConcurrentQueue:
+    def __init__(self, maxsize: int = 0, lifo: bool = False) -> None:
+        """
+        The ConcurrentQueue is a thread-safe FIFO queue (or LIFO stack) of DoublyLinkedListNodes, which blocks consumers
+        while it is empty and producers while it is full.
+
+        In FIFO mode it is a two-lock queue: the nodes hang off a dummy node at the head, producers link new nodes at the
+        tail while holding only the tail lock, and consumers unlink nodes at the head while holding only the head lock,
+        where the first node with a value becomes the new dummy node. The two ends never write to the same node, so
+        producers and consumers do not contend. The size is the difference between a count of puts, written only under
+        the tail lock, and a count of gets, written only under the head lock. A producer which makes the queue non-empty
+        wakes a consumer, and a consumer which makes the queue non-full wakes a producer, each of which wakes the next
+        waiter if there is still work for it.
+
+        In LIFO mode both ends of the stack are at the tail, so producers and consumers share the tail lock.
+
+        The methods follow queue.Queue, and raise queue.Empty and queue.Full.
+
+        :param maxsize: the maximum number of values in the queue, or 0 for an unbounded queue
+        :param lifo: whether values are taken from the end they were put at, rather than from the other end
+        """
+        self.maxsize: int = maxsize
+        self.lifo: bool = lifo
+        self.head: DoublyLinkedListNode = DoublyLinkedListNode(None, None, None)
+        self.tail: DoublyLinkedListNode = self.head
+        self.puts: int = 0
+        self.gets: int = 0
+
+        # producers wait for space under the tail lock, and consumers wait for values under the lock of their end
+        self.head_lock: threading.Lock = threading.Lock()
+        self.tail_lock: threading.Lock = threading.Lock()
+        self.not_full: threading.Condition = threading.Condition(self.tail_lock)
+        self.not_empty: threading.Condition = threading.Condition(self.tail_lock if lifo else self.head_lock)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the ConcurrentQueue.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        return f"ConcurrentQueue(size={self.qsize()}, maxsize={self.maxsize}, lifo={self.lifo})"
+
+    def __len__(self) -> int:
+        """
+        Counts the number of values in the ConcurrentQueue, which may change as soon as it is read.
+
+        :return: the number of values
+        """
+        return self.qsize()
+
+    def qsize(self) -> int:
+        """
+        Counts the number of values in the ConcurrentQueue. The gets are read before the puts, so that the count is
+        never negative.
+
+        :return: the number of values
+        """
+        gets = self.gets
+        return self.puts - gets
+
+    def empty(self) -> bool:
+        """
+        Checks whether the ConcurrentQueue is empty.
+
+        :return: whether the queue is empty
+        """
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        """
+        Checks whether the ConcurrentQueue is full.
+
+        :return: whether the queue is full
+        """
+        return 0 < self.maxsize <= self.qsize()
+
+    def put(self, value: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Puts a value into the ConcurrentQueue, waiting for space if it is full.
+
+        :param value: the value
+        :param block: whether to wait for space, rather than raise queue.Full at once
+        :param timeout: the maximum number of seconds to wait, or None to wait indefinitely
+        :return: None
+        """
+        with self.not_full:
+            wait(self.not_full, lambda: not self.full(), block, timeout, Full)
+            self.link(value)
+            size = self.qsize()
+            if 0 < self.maxsize and size < self.maxsize:
+                self.not_full.notify()
+            if size == 1:
+                self.signal_not_empty()
+
+    def put_many(self, values: Iterable, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Puts the values of an iterable into the ConcurrentQueue in order, holding the tail lock for the whole batch
+        except while waiting for space. If queue.Full is raised, the values before the failed one have been put.
+
+        :param values: the values
+        :param block: whether to wait for space, rather than raise queue.Full at once
+        :param timeout: the maximum number of seconds to wait for space for each value, or None to wait indefinitely
+        :return: None
+        """
+        with self.not_full:
+            linked = False
+            try:
+                for value in values:
+                    if self.full():
+                        # consumers are woken before waiting, since they are the ones to make space
+                        if linked:
+                            self.signal_not_empty(every=True)
+                            linked = False
+                        wait(self.not_full, lambda: not self.full(), block, timeout, Full)
+                    self.link(value)
+                    linked = True
+            finally:
+                if linked:
+                    self.signal_not_empty(every=True)
+
+                # a wake-up this batch consumed is passed on to the next producer if there is still space, as in put()
+                if 0 < self.maxsize and self.qsize() < self.maxsize:
+                    self.not_full.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns a value from the ConcurrentQueue, waiting for a value if it is empty.
+
+        :param block: whether to wait for a value, rather than raise queue.Empty at once
+        :param timeout: the maximum number of seconds to wait, or None to wait indefinitely
+        :return: the value
+        """
+        with self.not_empty:
+            wait(self.not_empty, lambda: self.qsize() > 0, block, timeout, Empty)
+            value = self.take()
+            size = self.qsize()
+            if size > 0:
+                self.not_empty.notify()
+
+        # the tail lock is only taken after the head lock is released, so the locks are never taken in both orders
+        if 0 < self.maxsize and size == self.maxsize - 1:
+            with self.not_full:
+                self.not_full.notify()
+        return value
+
+    def get_many(self, max_items: int, block: bool = True, timeout: Optional[float] = None) -> list:
+        """
+        Removes and returns up to max_items values from the ConcurrentQueue, waiting until it has at least one value.
+
+        :param max_items: the maximum number of values
+        :param block: whether to wait for a value, rather than raise queue.Empty at once
+        :param timeout: the maximum number of seconds to wait, or None to wait indefinitely
+        :return: the list of values, in the order they were taken
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        with self.not_empty:
+            wait(self.not_empty, lambda: self.qsize() > 0, block, timeout, Empty)
+            values = [self.take() for _ in range(min(max_items, self.qsize()))]
+            size = self.qsize()
+            if size > 0:
+                self.not_empty.notify()
+        if 0 < self.maxsize and size + len(values) >= self.maxsize:
+            with self.not_full:
+                self.not_full.notify_all()
+        return values
+
+    def link(self, value: Any) -> None:
+        """
+        Links a new node with a value at the tail. Must be called with the tail lock held.
+
+        :param value: the value
+        :return: None
+        """
+        node = DoublyLinkedListNode(value, self.tail, None)
+        self.tail.nxt = node
+        self.tail = node
+        self.puts += 1
+
+    def take(self) -> Any:
+        """
+        Unlinks the next node to take from a non-empty queue. Must be called with the lock of the taken end held.
+
+        In FIFO mode, the first node after the dummy node becomes the new dummy node, and in LIFO mode the tail node is
+        unlinked.
+
+        :return: the value of the node
+        """
+        if self.lifo:
+            node = self.tail
+            self.tail = node.prv
+            self.tail.nxt = None
+        else:
+            node = self.head.nxt
+            self.head = node
+            node.prv = None
+        value = node.val
+        node.val = None
+        self.gets += 1
+        return value
+
+    def signal_not_empty(self, every: bool = False) -> None:
+        """
+        Wakes a consumer (or every consumer) waiting for a value. Must be called with the tail lock held; in FIFO mode
+        the head lock is taken inside it.
+
+        :param every: whether to wake every waiting consumer
+        :return: None
+        """
+        if self.lifo:
+            self.not_empty.notify_all() if every else self.not_empty.notify()
+        else:
+            with self.not_empty:
+                self.not_empty.notify_all() if every else self.not_empty.notify()
+
+
+def wait(condition: threading.Condition, predicate: Callable[[], bool], block: bool, timeout: Optional[float],
+         error: type) -> None:
+    """
+    Waits on a condition, whose lock is held, until a predicate holds.
+
+    :param condition: the condition
+    :param predicate: the predicate
+    :param block: whether to wait at all, rather than raise the error if the predicate does not hold
+    :param timeout: the maximum number of seconds to wait, or None to wait indefinitely
+    :param error: the exception class raised if the predicate does not hold in time
+    :return: None
+    """
+    if not block:
+        if not predicate():
+            raise error
+    elif timeout is None:
+        condition.wait_for(predicate)
+    elif timeout < 0:
+        raise ValueError("'timeout' must be a non-negative number")
+    elif not condition.wait_for(predicate, timeout):
+        raise error
+
+
+class AsyncQueue:
+    def __init__(self, maxsize: int = 0, lifo: bool = False) -> None:
+        """
+        The AsyncQueue is a FIFO queue (or LIFO stack) for coroutines of a single event loop, which stores its values in
+        a DoublyLinkedList. The event loop runs one coroutine at a time, so the list needs no lock: a coroutine waiting
+        for a value or for space parks a future in a queue of waiters, and whichever call makes a value or space
+        available wakes the first waiter.
+
+        The methods follow asyncio.Queue, and raise asyncio.QueueEmpty and asyncio.QueueFull.
+
+        :param maxsize: the maximum number of values in the queue, or 0 for an unbounded queue
+        :param lifo: whether values are taken from the end they were put at, rather than from the other end
+        """
+        self.maxsize: int = maxsize
+        self.lifo: bool = lifo
+        self.items: DoublyLinkedList = DoublyLinkedList()
+        self.getters: deque = deque()
+        self.putters: deque = deque()
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the AsyncQueue.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        return f"AsyncQueue(size={self.qsize()}, maxsize={self.maxsize}, lifo={self.lifo})"
+
+    def __len__(self) -> int:
+        """
+        Counts the number of values in the AsyncQueue.
+
+        :return: the number of values
+        """
+        return len(self.items)
+
+    def qsize(self) -> int:
+        """
+        Counts the number of values in the AsyncQueue.
+
+        :return: the number of values
+        """
+        return len(self.items)
+
+    def empty(self) -> bool:
+        """
+        Checks whether the AsyncQueue is empty.
+
+        :return: whether the queue is empty
+        """
+        return len(self.items) == 0
+
+    def full(self) -> bool:
+        """
+        Checks whether the AsyncQueue is full.
+
+        :return: whether the queue is full
+        """
+        return 0 < self.maxsize <= len(self.items)
+
+    def put_nowait(self, value: Any) -> None:
+        """
+        Puts a value into the AsyncQueue, or raises asyncio.QueueFull if it is full.
+
+        :param value: the value
+        :return: None
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self.items.append(value)
+        wake_next(self.getters)
+
+    def get_nowait(self) -> Any:
+        """
+        Removes and returns a value from the AsyncQueue, or raises asyncio.QueueEmpty if it is empty.
+
+        :return: the value
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        value = self.items.pop(-1 if self.lifo else 0)
+        wake_next(self.putters)
+        return value
+
+    async def put(self, value: Any) -> None:
+        """
+        Puts a value into the AsyncQueue, waiting for space if it is full.
+
+        :param value: the value
+        :return: None
+        """
+        while self.full():
+            await park(self.putters, self.full)
+        self.put_nowait(value)
+
+    async def put_many(self, values: Iterable) -> None:
+        """
+        Puts the values of an iterable into the AsyncQueue in order, waiting for space whenever it is full.
+
+        :param values: the values
+        :return: None
+        """
+        for value in values:
+            while self.full():
+                await park(self.putters, self.full)
+            self.put_nowait(value)
+
+    async def get(self) -> Any:
+        """
+        Removes and returns a value from the AsyncQueue, waiting for a value if it is empty.
+
+        :return: the value
+        """
+        while self.empty():
+            await park(self.getters, self.empty)
+        return self.get_nowait()
+
+    async def get_many(self, max_items: int) -> list:
+        """
+        Removes and returns up to max_items values from the AsyncQueue, waiting until it has at least one value.
+
+        :param max_items: the maximum number of values
+        :return: the list of values, in the order they were taken
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        while self.empty():
+            await park(self.getters, self.empty)
+        values = []
+        while len(values) < max_items and not self.empty():
+            values.append(self.get_nowait())
+        return values
+
+
+def wake_next(waiters: deque) -> None:
+    """
+    Wakes the first waiter of a queue of waiters which is still waiting.
+
+    :param waiters: the futures of the waiters
+    :return: None
+    """
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+async def park(waiters: deque, blocked: Callable[[], bool]) -> None:
+    """
+    Waits in a queue of waiters until it is woken. If the waiting coroutine is cancelled after it was woken, the
+    wake-up is passed on to the next waiter so that it is not lost.
+
+    :param waiters: the futures of the waiters
+    :param blocked: a function checking whether the waiters are still blocked
+    :return: None
+    """
+    waiter = asyncio.get_running_loop().create_future()
+    waiters.append(waiter)
+    try:
+        await waiter
+    except BaseException:
+        waiter.cancel()
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not blocked() and not waiter.cancelled():
+            wake_next(waiters)
+        raise
@@ -1,8 +1,11 @@
 from collections.abc import MutableSequence, Iterator, Iterable, Collection
-from typing import Optional
+from typing import Any, Callable, Optional
+from library.node_pool import NodePool
 
 
 class DoublyLinkedListNode:
+    __slots__ = ("val", "prv", "nxt")
+
     def __init__(self, val: any, prv: Optional[object], nxt: Optional[object]):
         self.val = val
         self.prv = prv
@@ -10,12 +13,31 @@ class DoublyLinkedListNode:
 
 
 class DoublyLinkedList(MutableSequence):
-    def __init__(self, items=()) -> None:
-        self.size = len(items)
+    def __init__(self, items=(), pool: Optional[NodePool] = None) -> None:
+        """
+        The doubly-linked list stores elements in a sequence of nodes linked in both directions. A node is searched for
+        from whichever of the head, the tail or the finger (the last accessed index and node) is closest to it.
+
+        The nodes use __slots__ rather than an instance dictionary. If the list is given a NodePool, it takes its new
+        nodes from the pool and gives its removed nodes back to it rather than allocating a node for every insertion.
+
+        Other lists and ranges of nodes are moved into the list by relinking their ends rather than by copying their
+        elements, with splice, concat, split_at and move_range. A cursor inserts and removes values at its position in
+        constant time, which makes a filtering or rewriting pass over the list linear.
+
+        :param items: the initial elements of the list
+        :param pool: the NodePool of the list, or None to allocate every node
+        """
+        self.size = 0
+        self.pool: Optional[NodePool] = pool
         self.head = None
         self.tail = None
-        for item in items:
-            self.append(item)
+
+        # the last accessed (index, node), or None
+        self.finger: Optional[tuple] = None
+
+        # initialize the list
+        self.extend(items)
 
     def __repr__(self) -> str:
         """
@@ -36,28 +58,14 @@ class DoublyLinkedList(MutableSequence):
     # Implements MutableSequence abstract method
     def __getitem__(self, index: int) -> any:
         if -self.size <= index < self.size:
-            index = index % self.size
-            curr_node = self.tail if (2 * index >= self.size) else self.head
-            curr_index = (self.size - 1) if (2 * index >= self.size) else 0
-            step = -1 if (2 * index >= self.size) else 1
-            while curr_index != index:
-                curr_node = curr_node.nxt if step == 1 else curr_node.prv
-                curr_index += step
-            return curr_node.val
+            return self.locate(index % self.size).val
         else:
             raise IndexError
 
     # Implements MutableSequence abstract method
     def __setitem__(self, index: int, value: any) -> None:
         if -self.size <= index < self.size:
-            index = index % self.size
-            curr_node = self.tail if (2 * index >= self.size) else self.head
-            curr_index = (self.size - 1) if (2 * index >= self.size) else 0
-            step = -1 if (2 * index >= self.size) else 1
-            while curr_index != index:
-                curr_node = curr_node.nxt if step == 1 else curr_node.prv
-                curr_index += step
-            curr_node.val = value
+            self.locate(index % self.size).val = value
         else:
             raise IndexError
 
@@ -65,28 +73,73 @@ class DoublyLinkedList(MutableSequence):
     def __delitem__(self, index: int) -> None:
         if -self.size <= index < self.size:
             index = index % self.size
-            curr_node = self.tail if (2 * index >= self.size) else self.head
-            curr_index = (self.size - 1) if (2 * index >= self.size) else 0
-            step = -1 if (2 * index >= self.size) else 1
-            while curr_index != index:
-                curr_node = curr_node.nxt if step == 1 else curr_node.prv
-                curr_index += step
-            if curr_node.nxt is None:
-                self.tail = curr_node.prv
-                if self.tail is not None:
-                    self.tail.nxt = None
-            else:
-                curr_node.nxt.prv = curr_node.prv
-            if curr_node.prv is None:
-                self.head = curr_node.nxt
-                if self.head is not None:
-                    self.head.prv = None
-            else:
-                curr_node.prv.nxt = curr_node.nxt
-            self.size -= 1
+            self.unlink(self.locate(index), index)
         else:
             raise IndexError
 
+    def new_node(self, val: any, prv: Optional[DoublyLinkedListNode],
+                 nxt: Optional[DoublyLinkedListNode]) -> DoublyLinkedListNode:
+        """
+        Creates a node, taking it from the NodePool of the list if it has one.
+        :param val: the value of the node
+        :param prv: the previous node
+        :param nxt: the next node
+        :return: the node
+        """
+        if self.pool is None:
+            return DoublyLinkedListNode(val, prv, nxt)
+        return self.pool.acquire(val, prv, nxt)
+
+    def locate(self, index: int) -> DoublyLinkedListNode:
+        """
+        Finds the node at an index by walking from whichever of the head, the tail or the finger is closest to it, and
+        moves the finger to the node.
+        :param index: a valid, non-negative index of the list
+        :return: the node at the index
+        """
+        curr_index, curr_node = 0, self.head
+        if self.size - 1 - index < index:
+            curr_index, curr_node = self.size - 1, self.tail
+        if self.finger is not None and abs(self.finger[0] - index) < abs(curr_index - index):
+            curr_index, curr_node = self.finger
+        while curr_index < index:
+            curr_node = curr_node.nxt
+            curr_index += 1
+        while curr_index > index:
+            curr_node = curr_node.prv
+            curr_index -= 1
+        self.finger = (index, curr_node)
+        return curr_node
+
+    def unlink(self, node: DoublyLinkedListNode, index: Optional[int] = None) -> None:
+        """
+        Removes a node from the list in constant time. If the index of the node is known, the finger is moved to the
+        node before it, and otherwise the finger is dropped, since the indices of the nodes after it change. The node is
+        given back to the NodePool of the list if it has one.
+        :param node: the removed node
+        :param index: the index of the removed node, if it is known
+        :return: None
+        """
+        if index is not None and node.prv is not None:
+            self.finger = (index - 1, node.prv)
+        else:
+            self.finger = None
+        if node.nxt is None:
+            self.tail = node.prv
+            if self.tail is not None:
+                self.tail.nxt = None
+        else:
+            node.nxt.prv = node.prv
+        if node.prv is None:
+            self.head = node.nxt
+            if self.head is not None:
+                self.head.prv = None
+        else:
+            node.prv.nxt = node.nxt
+        self.size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
+
     # Implements MutableSequence abstract method
     def __len__(self) -> int:
         return self.size
@@ -100,28 +153,24 @@ class DoublyLinkedList(MutableSequence):
         :return: None
         """
         if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
             if index == self.size:
-                new_node = DoublyLinkedListNode(value, self.tail, None)
+                new_node = self.new_node(value, self.tail, None)
                 self.tail = new_node
                 if new_node.prv is None:
                     self.head = new_node
                 else:
                     new_node.prv.nxt = new_node
             else:
-                index = (index + self.size) if index < 0 else index
-                curr_node = self.tail if (2 * index >= self.size) else self.head
-                curr_index = (self.size - 1) if (2 * index >= self.size) else 0
-                step = -1 if (2 * index >= self.size) else 1
-                while curr_index != index:
-                    curr_node = curr_node.nxt if step == 1 else curr_node.prv
-                    curr_index += step
-                new_node = DoublyLinkedListNode(value, curr_node.prv, curr_node)
+                curr_node = self.locate(index)
+                new_node = self.new_node(value, curr_node.prv, curr_node)
                 curr_node.prv = new_node
                 if new_node.prv is None:
                     self.head = new_node
                 else:
                     new_node.prv.nxt = new_node
             self.size += 1
+            self.finger = (index, new_node)
         else:
             raise IndexError
 
@@ -172,20 +221,98 @@ class DoublyLinkedList(MutableSequence):
         :param stop: the end (exclusive) bound of the search interval
         :return: the index of the first instance of the value
         """
-        for i, item in enumerate(self):
-            if stop <= i:
-                raise ValueError
-            if (item == value) and (start <= i):
-                return i
-        raise ValueError
+        start, stop, _ = slice(start, stop).indices(self.size)
+        curr_node = self.head
+        curr_index = 0
+        while curr_index < stop:
+            if curr_index >= start and (curr_node.val is value or curr_node.val == value):
+                return curr_index
+            curr_node = curr_node.nxt
+            curr_index += 1
+        raise ValueError(f"{value} is not in list")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementations of __contains__() and count() iterate through
+    # the values with an iterator object. Instead, the nodes are traversed
+    # directly.
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the list.
+        :param value: the value
+        :return: whether the value is in the list
+        """
+        curr_node = self.head
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                return True
+            curr_node = curr_node.nxt
+        return False
+
+    def count(self, value: any) -> int:
+        """
+        Counts the instances of a value in the list.
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        count = 0
+        curr_node = self.head
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                count += 1
+            curr_node = curr_node.nxt
+        return count
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementations of pop() and remove() first find the value
+    # (by index or by value), and then delete it by index, which traverses the
+    # list a second time. Instead, the node is unlinked as soon as it is found,
+    # so popping from either end of the list takes constant time.
+    def pop(self, index: int = -1) -> any:
+        """
+        Removes and returns the value at an index of the list, the last value by default.
+        :param index: the index
+        :return: the removed value
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        if not -self.size <= index < self.size:
+            raise IndexError("pop index out of range")
+        index = index % self.size
+        curr_node = self.locate(index)
+        value = curr_node.val
+        self.unlink(curr_node, index)
+        return value
+
+    def remove(self, value: any) -> None:
+        """
+        Removes the first instance of a value from the list.
+        :param value: the value
+        :return: None
+        """
+        curr_node = self.head
+        curr_index = 0
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                self.unlink(curr_node, curr_index)
+                return
+            curr_node = curr_node.nxt
+            curr_index += 1
+        raise ValueError(f"{value} is not in list")
 
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin method implements the clear() method by repeatedly removing
     # single values. A more efficient method is to reset the list all at once.
     def clear(self) -> None:
+        if self.pool is not None:
+            curr_node = self.head
+            while curr_node is not None and len(self.pool) < self.pool.capacity:
+                next_node = curr_node.nxt
+                self.pool.release(curr_node)
+                curr_node = next_node
         self.size = 0
         self.head = None
         self.tail = None
+        self.finger = None
 
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin implementation of reverse() iterates through the indices of the
@@ -206,6 +333,222 @@ class DoublyLinkedList(MutableSequence):
         tail = self.tail
         self.tail = self.head
         self.head = tail
+        self.finger = None
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        Sorts the list IN PLACE with a stable, bottom-up mergesort which only relinks the nodes, in both directions as
+        they are merged. On each pass, runs of width 1, 2, 4, ... are merged pairwise by walking the list once, so the
+        sort takes O(n log n) time and only a constant amount of extra memory: no node or copy of the values is
+        allocated.
+        Implements sort to fulfill the list interface.
+
+        :param key: a function computing the comparison key of an element, called on each comparison
+        :param reverse: whether to sort in descending order
+        :return: None
+        """
+        width = 1
+        while width < self.size:
+            left = self.head
+            tail = None
+            while left is not None:
+                # the right run starts width nodes after the left run
+                right = left
+                left_size = 0
+                while right is not None and left_size < width:
+                    right = right.nxt
+                    left_size += 1
+                right_size = width if right is not None else 0
+
+                # merge the runs, taking from the right run only if it strictly precedes the left run
+                while left_size > 0 or right_size > 0:
+                    if left_size == 0:
+                        take_right = True
+                    elif right_size == 0:
+                        take_right = False
+                    else:
+                        left_key = left.val if key is None else key(left.val)
+                        right_key = right.val if key is None else key(right.val)
+                        take_right = left_key < right_key if reverse else right_key < left_key
+                    if take_right:
+                        node = right
+                        right = right.nxt
+                        right_size = right_size - 1 if right is not None else 0
+                    else:
+                        node = left
+                        left = left.nxt
+                        left_size -= 1
+                    if tail is None:
+                        self.head = node
+                    else:
+                        tail.nxt = node
+                    node.prv = tail
+                    tail = node
+                left = right
+            tail.nxt = None
+            self.tail = tail
+            width *= 2
+        self.finger = None
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of extend works by repeatedly appending values.
+    # Instead, the new nodes are linked directly after the tail, without
+    # updating the finger for every value.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of the list. The values are copied: use concat() to move the nodes of
+        another DoublyLinkedList instead.
+        :param values: the new values
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+        for value in values:
+            new_node = self.new_node(value, self.tail, None)
+            if self.tail is None:
+                self.head = new_node
+            else:
+                self.tail.nxt = new_node
+            self.tail = new_node
+            self.size += 1
+
+    def cut(self, start: int, stop: int) -> tuple:
+        """
+        Unlinks the nodes in the interval [start, stop) from the list as a chain, whose ends are cut off from the rest
+        of the list. Only the two boundary nodes are searched for.
+        :param start: a valid, non-negative index of the first node
+        :param stop: the index after the last node, with start < stop <= len(list)
+        :return: the first and the last node of the chain
+        """
+        first = self.locate(start)
+        last = first if stop - start == 1 else self.locate(stop - 1)
+        if first.prv is None:
+            self.head = last.nxt
+        else:
+            first.prv.nxt = last.nxt
+        if last.nxt is None:
+            self.tail = first.prv
+        else:
+            last.nxt.prv = first.prv
+        first.prv = None
+        last.nxt = None
+        self.size -= stop - start
+        self.finger = None
+        return first, last
+
+    def link_chain(self, first: DoublyLinkedListNode, last: DoublyLinkedListNode, count: int, index: int) -> None:
+        """
+        Links a chain of nodes into the list before an index in constant time, once the node at the index is found.
+        :param first: the first node of the chain
+        :param last: the last node of the chain
+        :param count: the number of nodes in the chain
+        :param index: a non-negative index of the list, at most len(list)
+        :return: None
+        """
+        nxt = None if index == self.size else self.locate(index)
+        prv = self.tail if nxt is None else nxt.prv
+        first.prv = prv
+        last.nxt = nxt
+        if prv is None:
+            self.head = first
+        else:
+            prv.nxt = first
+        if nxt is None:
+            self.tail = last
+        else:
+            nxt.prv = last
+        self.size += count
+        self.finger = (index, first)
+
+    def splice(self, other: "DoublyLinkedList", at: Optional[int] = None) -> None:
+        """
+        Moves all the nodes of another DoublyLinkedList into the list before an index, leaving the other list empty.
+        No element is copied: the ends of the other list are relinked in constant time once the node at the index is
+        found.
+        :param other: the other list
+        :param at: the index to move the nodes to, the end of the list by default
+        :return: None
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("can only splice a DoublyLinkedList")
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        at = self.size if at is None else at
+        if not -self.size <= at <= self.size:
+            raise IndexError("splice index out of range")
+        at = (at + self.size) if at < 0 else at
+        if other.size == 0:
+            return
+        first, last, count = other.head, other.tail, other.size
+        other.head = None
+        other.tail = None
+        other.size = 0
+        other.finger = None
+        self.link_chain(first, last, count, at)
+
+    def concat(self, other: "DoublyLinkedList") -> None:
+        """
+        Moves all the nodes of another DoublyLinkedList to the end of the list in constant time, leaving the other list
+        empty.
+        :param other: the other list
+        :return: None
+        """
+        self.splice(other)
+
+    def split_at(self, index: int) -> "DoublyLinkedList":
+        """
+        Splits the list in two at an index: the list keeps the elements before the index, and the elements from the
+        index on are moved into a new DoublyLinkedList, which shares the NodePool of the list. No element is copied.
+        :param index: the index of the first moved element
+        :return: the new list
+        """
+        if not -self.size <= index <= self.size:
+            raise IndexError("split index out of range")
+        index = (index + self.size) if index < 0 else index
+        new_list = DoublyLinkedList(pool=self.pool)
+        if index < self.size:
+            new_list.size = self.size - index
+            new_list.head, new_list.tail = self.cut(index, self.size)
+        return new_list
+
+    def move_range(self, start: int, stop: int, other: Optional["DoublyLinkedList"] = None,
+                   at: Optional[int] = None) -> None:
+        """
+        Moves the nodes in the interval [start, stop) of the list before an index of another DoublyLinkedList, or to
+        another position in the same list. The interval is clamped like a slice, and the index is taken in the target
+        list after the nodes are removed. No element is copied.
+        :param start: the start (inclusive) of the moved interval
+        :param stop: the end (exclusive) of the moved interval
+        :param other: the target list, the list itself by default
+        :param at: the index of the target list to move the nodes to, its end by default
+        :return: None
+        """
+        other = self if other is None else other
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("can only move to a DoublyLinkedList")
+        start, stop, _ = slice(start, stop).indices(self.size)
+        count = stop - start
+        target_size = other.size - (count if other is self and count > 0 else 0)
+        at = target_size if at is None else at
+        if not -target_size <= at <= target_size:
+            raise IndexError("move index out of range")
+        at = (at + target_size) if at < 0 else at
+        if count <= 0:
+            return
+        first, last = self.cut(start, stop)
+        other.link_chain(first, last, count, at)
+
+    def cursor(self, index: int = 0) -> "DoublyLinkedListCursor":
+        """
+        Creates a cursor at an index of the list, which can move through the list and insert or remove values at its
+        position in constant time.
+        :param index: the index of the cursor, where len(list) is the end of the list
+        :return: the cursor
+        """
+        if not -self.size <= index <= self.size:
+            raise IndexError("cursor index out of range")
+        index = (index + self.size) if index < 0 else index
+        return DoublyLinkedListCursor(self, None if index == self.size else self.locate(index))
 
 
 class DoublyLinkedListIterator:
@@ -223,3 +566,127 @@ class DoublyLinkedListIterator:
             curr_node = self.curr_node
             self.curr_node = curr_node.nxt if self.step == 1 else curr_node.prv
             return curr_node.val
+
+
+class DoublyLinkedListCursor:
+    def __init__(self, doubly_linked_list: DoublyLinkedList, node: Optional[DoublyLinkedListNode]) -> None:
+        """
+        A cursor points to a node of a DoublyLinkedList, or to the end of the list after its last node. Moving the
+        cursor and inserting or removing values at it take constant time, so a list can be filtered or rewritten in a
+        single pass. The cursor stays valid across edits made through it, and across edits made through the list
+        which do not remove its node.
+
+        :param doubly_linked_list: the list of the cursor
+        :param node: the node of the cursor, or None for the end of the list
+        """
+        self.list = doubly_linked_list
+        self.node = node
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the cursor.
+        :return: a string of the cursor
+        """
+        if self.node is None:
+            return "DoublyLinkedListCursor(<end>)"
+        return f"DoublyLinkedListCursor({self.node.val!r})"
+
+    @property
+    def at_end(self) -> bool:
+        """
+        Checks whether the cursor is at the end of the list, after its last node.
+        :return: whether the cursor is at the end
+        """
+        return self.node is None
+
+    @property
+    def value(self) -> any:
+        """
+        Retrieves the value at the cursor.
+        :return: the value
+        """
+        if self.node is None:
+            raise IndexError("cursor is at the end of the list")
+        return self.node.val
+
+    @value.setter
+    def value(self, value: any) -> None:
+        """
+        Sets the value at the cursor.
+        :param value: the new value
+        :return: None
+        """
+        if self.node is None:
+            raise IndexError("cursor is at the end of the list")
+        self.node.val = value
+
+    def next(self) -> None:
+        """
+        Moves the cursor to the next node, or to the end of the list from its last node.
+        :return: None
+        """
+        if self.node is None:
+            raise IndexError("cursor is at the end of the list")
+        self.node = self.node.nxt
+
+    def prev(self) -> None:
+        """
+        Moves the cursor to the previous node, or to the last node of the list from the end.
+        :return: None
+        """
+        prv = self.list.tail if self.node is None else self.node.prv
+        if prv is None:
+            raise IndexError("cursor is at the start of the list")
+        self.node = prv
+
+    def insert_before(self, value: any) -> None:
+        """
+        Inserts a new value before the cursor, or appends it to the list if the cursor is at the end. The cursor stays
+        at its node.
+        :param value: the new value
+        :return: None
+        """
+        linked_list = self.list
+        prv = linked_list.tail if self.node is None else self.node.prv
+        new_node = linked_list.new_node(value, prv, self.node)
+        if prv is None:
+            linked_list.head = new_node
+        else:
+            prv.nxt = new_node
+        if self.node is None:
+            linked_list.tail = new_node
+        else:
+            self.node.prv = new_node
+        linked_list.size += 1
+        linked_list.finger = None
+
+    def insert_after(self, value: any) -> None:
+        """
+        Inserts a new value after the cursor. The cursor stays at its node.
+        :param value: the new value
+        :return: None
+        """
+        if self.node is None:
+            raise IndexError("cursor is at the end of the list")
+        linked_list = self.list
+        new_node = linked_list.new_node(value, self.node, self.node.nxt)
+        if self.node.nxt is None:
+            linked_list.tail = new_node
+        else:
+            self.node.nxt.prv = new_node
+        self.node.nxt = new_node
+        linked_list.size += 1
+        linked_list.finger = None
+
+    def remove(self) -> any:
+        """
+        Removes the value at the cursor from the list, and moves the cursor to the next node.
+        :return: the removed value
+        """
+        if self.node is None:
+            raise IndexError("cursor is at the end of the list")
+        node = self.node
+        value = node.val
+        self.node = node.nxt
+        self.list.unlink(node)
+        return value
@@ -1,5 +1,5 @@
 from collections.abc import MutableMapping
-from singly_linked_list import SinglyLinkedList
+from library.singly_linked_list import SinglyLinkedList
 
 
 class HashMap:
@@ -52,9 +52,10 @@ class HashMap:
         # iterate through the bucket to find key duplicates
         for i, (k, v) in enumerate(bucket):
             if k == key:
-                bucket.delete(i)
+                del bucket[i]
+                break
 
-        bucket.push((key, value))
+        bucket.append((key, value))
 
     def access(self, key: any) -> any:
         """
@@ -93,7 +94,7 @@ class HashMap:
         # iterate through the bucket to find the key of interest
         for i, (k, v) in enumerate(bucket):
             if k == key:
-                bucket.delete(i)
+                del bucket[i]
                 return
 
         # if the key was not found, return an error
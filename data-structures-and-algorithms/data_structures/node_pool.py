@@ -0,0 +1,84 @@
+from typing import Any
+
+# the default number of detached nodes kept by a pool
+POOL_CAPACITY: int = 1024
+
+
+class NodePool:
+    def __init__(self, node_class: type, capacity: int = POOL_CAPACITY) -> None:
+        """
+        The NodePool is a free list of detached nodes of a linked list. Instead of allocating a new node for every
+        insertion and leaving a removed node to the garbage collector, a list with a pool takes its new nodes from the
+        pool and gives its removed nodes back to it, so that a list with a steady stream of insertions and deletions
+        reuses the same node objects. A pool can be given to a single list, or shared by several lists of the same kind.
+
+        A released node has all of its fields cleared, so that the pool does not keep the values or the neighbours of
+        the node alive. The pool keeps at most capacity nodes, and any further released nodes are left to the garbage
+        collector.
+
+        A node must not be released while it is still referenced, e.g. by an iterator over the list.
+
+        :param node_class: the class of the nodes, whose constructor takes one argument per field in its __slots__
+        :param capacity: the maximum number of detached nodes kept by the pool
+        """
+        self.node_class: type = node_class
+        self.capacity: int = capacity
+        self.nodes: list = []
+
+        # the arguments which clear every field of a node
+        self.cleared: tuple = (None,) * len(node_class.__slots__)
+
+        # the number of nodes allocated by the pool and the number of nodes it reused
+        self.allocated: int = 0
+        self.reused: int = 0
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the NodePool.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        return f"NodePool({self.node_class.__name__}, {len(self.nodes)}/{self.capacity} free)"
+
+    def __len__(self) -> int:
+        """
+        Counts the number of detached nodes in the NodePool.
+
+        :return: the number of detached nodes
+        """
+        return len(self.nodes)
+
+    def acquire(self, *fields: Any) -> Any:
+        """
+        Takes a detached node from the pool, or allocates a new node if the pool is empty, and initializes its fields.
+
+        :param fields: the values of the fields of the node, in the order of its constructor
+        :return: the node
+        """
+        if self.nodes:
+            node = self.nodes.pop()
+            node.__init__(*fields)
+            self.reused += 1
+            return node
+        self.allocated += 1
+        return self.node_class(*fields)
+
+    def release(self, node: Any) -> None:
+        """
+        Clears a node which has been removed from its list and gives it back to the pool.
+
+        :param node: the detached node
+        :return: None
+        """
+        if len(self.nodes) < self.capacity:
+            node.__init__(*self.cleared)
+            self.nodes.append(node)
+
+    def clear(self) -> None:
+        """
+        Drops every detached node in the pool.
+
+        :return: None
+        """
+        self.nodes = []
@@ -1,27 +1,38 @@
 from collections.abc import MutableSequence, Iterator, Iterable
-from typing import Any, Union
+from typing import Any, Callable, Union, Optional
+from library.node_pool import NodePool
 
 
 class SinglyLinkedListNode:
+    __slots__ = ("val", "nxt")
+
     def __init__(self, val, nxt):
         self.val = val
         self.nxt = nxt
 
 
 class SinglyLinkedList(MutableSequence):
-    def __init__(self, elements=()) -> None:
+    def __init__(self, elements=(), pool: Optional[NodePool] = None) -> None:
         """
         The singly-linked list stores elements in a sequence of linked nodes. The head of the list is kept as the starting
         point of all operations.
 
+        The list also keeps a pointer to its tail, so appending takes constant time, and a finger: the index and node of
+        the last position which was accessed. A search for an index at or after the finger starts from the finger rather
+        than from the head, so accessing or inserting at consecutive indices (e.g. in a loop over range(len(list)))
+        takes constant amortized time per index. A structural change before the finger invalidates it.
+
+        The nodes use __slots__ rather than an instance dictionary. If the list is given a NodePool, it takes its new
+        nodes from the pool and gives its removed nodes back to it rather than allocating a node for every insertion.
+
         Implements abstract methods from MutableSequence:
         __getitem__, __setitem__, __delitem__, __len__, insert
 
         Includes mixin methods from MutableSequence:
-        __contains__, __iter__, __reversed__, index, count, append, reverse, extend, pop, remove, __iadd__
+        append, __iadd__
 
         Overrides mixin methods from MutableSequence:
-        clear, __iter__, __reversed__
+        __contains__, __iter__, __reversed__, index, count, pop, remove, clear, reverse, extend
 
         Implements methods from list:
         copy, sort
@@ -29,21 +40,19 @@ class SinglyLinkedList(MutableSequence):
         Overrides methods from object:
         __repr__
 
-        :param elements: the initial elements of the ArrayList
+        :param elements: the initial elements of the list
+        :param pool: the NodePool of the list, or None to allocate every node
         """
         self.size = 0
+        self.pool: Optional[NodePool] = pool
         self.head = None
+        self.tail = None
+
+        # the last accessed (index, node), or None
+        self.finger: Optional[tuple] = None
 
         # initialize the list
-        prev_node = None
-        for element in elements:
-            self.size += 1
-            if self.head is None:
-                self.head = SinglyLinkedListNode(element, None)
-                prev_node = self.head
-            else:
-                prev_node.nxt = SinglyLinkedListNode(element, None)
-                prev_node = prev_node.nxt
+        self.extend(elements)
 
     def __repr__(self) -> str:
         """
@@ -82,23 +91,14 @@ class SinglyLinkedList(MutableSequence):
         # if the index is an integer, return the element at a single position
         if isinstance(index, int):
             if -self.size <= index < self.size:
-                index = index % self.size
-                curr_node = self.head
-                curr_index = 0
-                while curr_index < index:
-                    curr_node = curr_node.nxt
-                    curr_index += 1
-                return curr_node.val
+                return self.locate(index % self.size).val
             else:
                 raise IndexError("list index out of range")
 
         # if the index is a slice, return a new LinkedList with the elements in that slice
+        # the elements are collected in a single traversal, rather than traversing the list for every index
         if isinstance(index, slice):
-            start, stop, step = index.indices(self.size)
-            new_list = SinglyLinkedList()
-            prev_node = None
-            for i, element in enumerate(self):
-                if (i == start) and
+            return SinglyLinkedList(list(self)[index], self.pool)
 
         # if the index is neither type, return an error
         raise TypeError("index must be an int or a slice")
@@ -115,13 +115,7 @@ class SinglyLinkedList(MutableSequence):
         """
 
         if -self.size <= index < self.size:
-            index = index % self.size
-            curr_node = self.head
-            curr_index = 0
-            while curr_index < index:
-                curr_node = curr_node.nxt
-                curr_index += 1
-            curr_node.val = value
+            self.locate(index % self.size).val = value
         else:
             raise IndexError
 
@@ -129,18 +123,8 @@ class SinglyLinkedList(MutableSequence):
     def __delitem__(self, index: int) -> None:
         if -self.size <= index < self.size:
             index = index % self.size
-            prev_node = None
-            curr_node = self.head
-            curr_index = 0
-            while curr_index < index:
-                prev_node = curr_node
-                curr_node = curr_node.nxt
-                curr_index += 1
-            self.size -= 1
-            if prev_node is None:
-                self.head = self.head.nxt
-            else:
-                prev_node.nxt = curr_node.nxt
+            prev_node = self.locate(index - 1) if index > 0 else None
+            self.unlink(prev_node, self.head if prev_node is None else prev_node.nxt, index)
         else:
             raise IndexError
 
@@ -154,21 +138,51 @@ class SinglyLinkedList(MutableSequence):
         """
         if -self.size <= index <= self.size:
             index = (index + self.size) if index < 0 else index
-            prev_node = None
-            curr_node = self.head
-            curr_index = 0
-            while curr_index < index:
-                prev_node = curr_node
-                curr_node = curr_node.nxt
-                curr_index += 1
-            if prev_node is None:
-                self.head = SinglyLinkedListNode(value, self.head)
+            if index == 0:
+                new_node = self.new_node(value, self.head)
+                self.head = new_node
             else:
-                prev_node.nxt = SinglyLinkedListNode(value, curr_node)
+                prev_node = self.locate(index - 1)
+                new_node = self.new_node(value, prev_node.nxt)
+                prev_node.nxt = new_node
+            if new_node.nxt is None:
+                self.tail = new_node
             self.size += 1
+            self.finger = (index, new_node)
         else:
             raise IndexError
 
+    def new_node(self, val: any, nxt: Optional[SinglyLinkedListNode]) -> SinglyLinkedListNode:
+        """
+        Creates a node, taking it from the NodePool of the list if it has one.
+        :param val: the value of the node
+        :param nxt: the next node
+        :return: the node
+        """
+        if self.pool is None:
+            return SinglyLinkedListNode(val, nxt)
+        return self.pool.acquire(val, nxt)
+
+    def locate(self, index: int) -> SinglyLinkedListNode:
+        """
+        Finds the node at an index and moves the finger to it. The tail is returned directly, and any other node is
+        searched for from the finger if the finger is at or before the index, or from the head otherwise.
+        :param index: a valid, non-negative index of the list
+        :return: the node at the index
+        """
+        if index == self.size - 1:
+            curr_node = self.tail
+        else:
+            if self.finger is not None and self.finger[0] <= index:
+                curr_index, curr_node = self.finger
+            else:
+                curr_index, curr_node = 0, self.head
+            while curr_index < index:
+                curr_node = curr_node.nxt
+                curr_index += 1
+        self.finger = (index, curr_node)
+        return curr_node
+
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin implementation of __iter__() used a while loop and a stored
     # index. It used the built-in get() method in order to retrieve sequential
@@ -186,11 +200,53 @@ class SinglyLinkedList(MutableSequence):
         """
         return SinglyLinkedListIterator(self)
 
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of __reversed__() retrieves the values by
+    # index from the back of the list, which traverses the list from the head
+    # for every value. Instead, the values are collected in a single traversal
+    # and returned in reverse.
+    def __reversed__(self) -> Iterator:
+        """
+        Creates a reverse iterator for the list from a single traversal of the list.
+        :return: a reverse iterator for the list
+        """
+        return reversed(list(self))
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementations of __contains__() and count() iterate through
+    # the values with the mixin __iter__(), which retrieves every value by
+    # index. Instead, the nodes are traversed directly.
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the list.
+        :param value: the value
+        :return: whether the value is in the list
+        """
+        curr_node = self.head
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                return True
+            curr_node = curr_node.nxt
+        return False
+
+    def count(self, value: any) -> int:
+        """
+        Counts the instances of a value in the list.
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        count = 0
+        curr_node = self.head
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                count += 1
+            curr_node = curr_node.nxt
+        return count
+
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin implementation of index() used a while loop and a stored index
-    # rather than the built-in iterator. The built-in iterator is more
-    # efficient since it does not require re-traversal of any segments of the
-    # list.
+    # rather than traversing the nodes. Traversing the nodes is more efficient
+    # since it does not require re-traversal of any segments of the list.
     def index(self, value: any, start=0, stop=None) -> int:
         """
         Finds and returns the index of the first instance of a given value.
@@ -199,20 +255,90 @@ class SinglyLinkedList(MutableSequence):
         :param stop: the end (exclusive) bound of the search interval
         :return: the index of the first instance of the value
         """
-        stop = len(self) if stop is None else stop
-        for i, item in enumerate(self):
-            if stop <= i:
-                raise ValueError
-            if (item == value) and (start <= i):
-                return i
-        raise ValueError
+        start, stop, _ = slice(start, stop).indices(self.size)
+        curr_node = self.head
+        curr_index = 0
+        while curr_index < stop:
+            if curr_index >= start and (curr_node.val is value or curr_node.val == value):
+                return curr_index
+            curr_node = curr_node.nxt
+            curr_index += 1
+        raise ValueError(f"{value} is not in list")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementations of pop() and remove() first find the value
+    # (by index or by value), and then delete it by index, which traverses the
+    # list a second time. Instead, the node is unlinked in the same traversal
+    # in which it is found.
+    def pop(self, index: int = -1) -> any:
+        """
+        Removes and returns the value at an index of the list, the last value by default.
+        :param index: the index
+        :return: the removed value
+        """
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        if not -self.size <= index < self.size:
+            raise IndexError("pop index out of range")
+        index = index % self.size
+        prev_node = self.locate(index - 1) if index > 0 else None
+        curr_node = self.head if prev_node is None else prev_node.nxt
+        value = curr_node.val
+        self.unlink(prev_node, curr_node, index)
+        return value
+
+    def remove(self, value: any) -> None:
+        """
+        Removes the first instance of a value from the list.
+        :param value: the value
+        :return: None
+        """
+        prev_node = None
+        curr_node = self.head
+        curr_index = 0
+        while curr_node is not None:
+            if curr_node.val is value or curr_node.val == value:
+                self.unlink(prev_node, curr_node, curr_index)
+                return
+            prev_node = curr_node
+            curr_node = curr_node.nxt
+            curr_index += 1
+        raise ValueError(f"{value} is not in list")
+
+    def unlink(self, prev_node: Optional[SinglyLinkedListNode], node: SinglyLinkedListNode, index: int) -> None:
+        """
+        Removes a node from the list, given the node before it. The finger is moved to the node before it, since the
+        indices of the nodes after it change. The node is given back to the NodePool of the list if it has one.
+        :param prev_node: the node before the removed node, or None if it is the head
+        :param node: the removed node
+        :param index: the index of the removed node
+        :return: None
+        """
+        if prev_node is None:
+            self.head = node.nxt
+        else:
+            prev_node.nxt = node.nxt
+        if node is self.tail:
+            self.tail = prev_node
+        self.size -= 1
+        self.finger = None if prev_node is None else (index - 1, prev_node)
+        if self.pool is not None:
+            self.pool.release(node)
 
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin method implements the clear() method by repeatedly removing
     # single values. A more efficient method is to reset the list all at once.
     def clear(self) -> None:
+        if self.pool is not None:
+            curr_node = self.head
+            while curr_node is not None and len(self.pool) < self.pool.capacity:
+                next_node = curr_node.nxt
+                self.pool.release(curr_node)
+                curr_node = next_node
         self.size = 0
         self.head = None
+        self.tail = None
+        self.finger = None
 
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin implementation of reverse() iterates through the indices of the
@@ -226,23 +352,88 @@ class SinglyLinkedList(MutableSequence):
         """
         prev_node = None
         curr_node = self.head
+        self.tail = curr_node
         while curr_node is not None:
             next_node = curr_node.nxt
             curr_node.nxt = prev_node
             prev_node = curr_node
             curr_node = next_node
         self.head = prev_node
+        self.finger = None
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        Sorts the list IN PLACE with a stable, bottom-up mergesort which only relinks the nodes. On each pass, runs of
+        width 1, 2, 4, ... are merged pairwise by walking the list once, so the sort takes O(n log n) time and only a
+        constant amount of extra memory: no node or copy of the values is allocated.
+        Implements sort to fulfill the list interface.
+
+        :param key: a function computing the comparison key of an element, called on each comparison
+        :param reverse: whether to sort in descending order
+        :return: None
+        """
+        width = 1
+        while width < self.size:
+            left = self.head
+            tail = None
+            while left is not None:
+                # the right run starts width nodes after the left run
+                right = left
+                left_size = 0
+                while right is not None and left_size < width:
+                    right = right.nxt
+                    left_size += 1
+                right_size = width if right is not None else 0
+
+                # merge the runs, taking from the right run only if it strictly precedes the left run
+                while left_size > 0 or right_size > 0:
+                    if left_size == 0:
+                        take_right = True
+                    elif right_size == 0:
+                        take_right = False
+                    else:
+                        left_key = left.val if key is None else key(left.val)
+                        right_key = right.val if key is None else key(right.val)
+                        take_right = left_key < right_key if reverse else right_key < left_key
+                    if take_right:
+                        node = right
+                        right = right.nxt
+                        right_size = right_size - 1 if right is not None else 0
+                    else:
+                        node = left
+                        left = left.nxt
+                        left_size -= 1
+                    if tail is None:
+                        self.head = node
+                    else:
+                        tail.nxt = node
+                    tail = node
+                left = right
+            tail.nxt = None
+            self.tail = tail
+            width *= 2
+        self.finger = None
 
     # Overrides MutableSequence mixin method for efficiency:
     # The mixin implementation of extend works by repeatedly appending values.
-    # However, each call to append traverses the entire list. It is more
-    # efficient to reverse the list, insert the values at the front, and then
-    # reverse the list a final time.
+    # Instead, the new nodes are linked directly after the tail, without
+    # updating the finger for every value.
     def extend(self, values: Iterable) -> None:
-        self.reverse()
+        """
+        Appends an iterable of values to the end of the list.
+        :param values: the new values
+        :return: None
+        """
+        if values is self:
+            values = list(values)
         for value in values:
-            self.insert(0, value)
-        self.reverse()
+            new_node = self.new_node(value, None)
+            if self.tail is None:
+                self.head = new_node
+            else:
+                self.tail.nxt = new_node
+            self.tail = new_node
+            self.size += 1
 
 
 class SinglyLinkedListIterator:
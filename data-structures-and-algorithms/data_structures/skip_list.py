@@ -0,0 +1,472 @@
+from collections.abc import MutableSequence, Iterable, Iterator
+from random import random
+from typing import Union, Any, Optional
+
+# the maximum number of levels of a SkipList, enough for 2^32 elements
+MAX_LEVEL: int = 32
+
+# the probability that a node which reaches a level also reaches the next level
+PROMOTION_PROBABILITY: float = 0.5
+
+
+class SkipListNode:
+    __slots__ = ("val", "nxt", "span")
+
+    def __init__(self, val: Any, level: int):
+        self.val = val
+        self.nxt = [None] * level
+        self.span = [0] * level
+
+
+class SkipList(MutableSequence):
+    def __init__(self, elements: Iterable = (), ordered: bool = False) -> None:
+        """
+        The SkipList is a linked list with additional levels of forward pointers. Every node is on level 0, and a node on
+        a level is also on the next level with probability 1/2, so each level skips over about half of the nodes of the
+        level below it. A search starts on the highest level and drops down a level whenever the next node would overshoot
+        its target, which takes O(log n) expected time.
+
+        Each forward pointer also stores its span, the number of positions it skips over (a pointer to the end of the
+        list spans to the position after the last element). Adding up the spans along a search gives the position of a
+        node, so the list can be indexed by position in O(log n) expected time.
+
+        In positional mode (the default), the SkipList is a list like the SinglyLinkedList, with O(log n) indexing,
+        insertion and deletion at any position. In ordered mode, the SkipList is a sorted set: values are added with add
+        and removed with discard (or by position), and they cannot be inserted or set at a position. Searching for a
+        value, finding its index and iterating over a range of values then take O(log n) expected time.
+
+        Implements abstract methods from MutableSequence:
+        __getitem__, __setitem__, __delitem__, __len__, insert
+
+        Includes mixin methods from MutableSequence:
+        __reversed__, append, reverse, pop, remove, __iadd__
+
+        Overrides mixin methods from MutableSequence:
+        __contains__, __iter__, index, count, clear, extend
+
+        Implements methods from sorted sets:
+        add, discard, irange, bisect_left
+
+        Implements methods from list:
+        copy
+
+        Overrides methods from object:
+        __repr__
+
+        :param elements: the initial elements of the SkipList
+        :param ordered: whether the SkipList is a sorted set rather than a positional list
+        """
+        self.size: int = 0
+        self.ordered: bool = ordered
+        self.levels: int = 1
+        self.head: SkipListNode = SkipListNode(None, MAX_LEVEL)
+        self.head.span[0] = 1
+
+        # initialize the list
+        self.extend(elements)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the SkipList.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for element in self:
+                s = s + f"{element}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the SkipList.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which follows the level 0 pointers of the nodes.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the SkipList
+        """
+        node = self.head.nxt[0]
+        while node is not None:
+            yield node.val
+            node = node.nxt[0]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
+        """
+        Retrieves the element in an index or elements in a slice of the SkipList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: the value or values
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                return self.locate(index % self.size).val
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, return a new SkipList with the elements in the slice
+        if isinstance(index, slice):
+            return SkipList(list(self)[index], self.ordered)
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Any, Iterable]) -> None:
+        """
+        Sets the element in an index or elements in a slice of a positional SkipList with a value or iterable of values.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :param value: the value or values
+        :return: None
+        """
+        if self.ordered:
+            raise TypeError("cannot set a position of an ordered SkipList, use add")
+
+        # if the index is an integer, set the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                self.locate(index % self.size).val = value
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the list is rebuilt from the updated elements
+        if isinstance(index, slice):
+            if isinstance(value, Iterable):
+                elements = list(self)
+                elements[index] = value
+                self.clear()
+                self.extend(elements)
+                return
+            raise TypeError("can only assign an iterable")
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Deletes the element in an index or elements in a slice of the SkipList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: None
+        """
+
+        # if the index is an integer, delete the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                update, ranks = self.trace_index(index % self.size)
+                self.unlink(update)
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the list is rebuilt from the remaining elements
+        if isinstance(index, slice):
+            elements = list(self)
+            del elements[index]
+            self.clear()
+            self.extend(elements)
+            return
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a new value into a positional SkipList at a given index.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the new value
+        :return: None
+        """
+        if self.ordered:
+            raise TypeError("cannot insert at a position of an ordered SkipList, use add")
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+            update, ranks = self.trace_index(index)
+            self.link(update, ranks, value)
+            return
+        raise IndexError("index out of range")
+
+    def add(self, value: Any) -> None:
+        """
+        Adds a value to an ordered SkipList, unless it is already in the SkipList.
+
+        :param value: the value
+        :return: None
+        """
+        if not self.ordered:
+            raise TypeError("can only add to an ordered SkipList")
+        update, ranks = self.trace_value(value)
+        node = update[0].nxt[0]
+        if node is None or node.val != value:
+            self.link(update, ranks, value)
+
+    def discard(self, value: Any) -> None:
+        """
+        Removes a value from an ordered SkipList if it is in the SkipList.
+
+        :param value: the value
+        :return: None
+        """
+        if not self.ordered:
+            raise TypeError("can only discard from an ordered SkipList")
+        update, ranks = self.trace_value(value)
+        node = update[0].nxt[0]
+        if node is not None and node.val == value:
+            self.unlink(update)
+
+    def bisect_left(self, value: Any) -> int:
+        """
+        Finds the index at which a value would be added to an ordered SkipList, before any equal value.
+
+        :param value: the value
+        :return: the index
+        """
+        if not self.ordered:
+            raise TypeError("can only bisect an ordered SkipList")
+        update, ranks = self.trace_value(value)
+        return ranks[0] + 1
+
+    def irange(self, minimum: Any = None, maximum: Any = None) -> Iterator:
+        """
+        Creates an iterator over the values of an ordered SkipList in the interval [minimum, maximum]. The first value is
+        found by a search, so the iteration takes O(log n + k) expected time for k values.
+
+        :param minimum: the smallest value (inclusive), or None for no lower bound
+        :param maximum: the largest value (inclusive), or None for no upper bound
+        :return: an iterator over the values
+        """
+        if not self.ordered:
+            raise TypeError("can only iterate over a range of an ordered SkipList")
+        if minimum is None:
+            node = self.head.nxt[0]
+        else:
+            update, ranks = self.trace_value(minimum)
+            node = update[0].nxt[0]
+        while node is not None and (maximum is None or node.val <= maximum):
+            yield node.val
+            node = node.nxt[0]
+
+    # Overrides MutableSequence mixin methods for efficiency:
+    # The mixin implementations of __contains__(), index() and count() scan the
+    # list. In an ordered SkipList, a value is found with a single search from
+    # the highest level, and its index is the sum of the spans along the search.
+    # In a positional SkipList, the nodes are traversed on level 0.
+    def __contains__(self, value: Any) -> bool:
+        """
+        Checks whether a value is in the SkipList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: whether the value is in the SkipList
+        """
+        if self.ordered:
+            update, ranks = self.trace_value(value)
+            node = update[0].nxt[0]
+            return node is not None and node.val == value
+        node = self.head.nxt[0]
+        while node is not None:
+            if node.val is value or node.val == value:
+                return True
+            node = node.nxt[0]
+        return False
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the index of the first instance of a value in the interval [start, stop) of the SkipList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :param start: the start (inclusive) of the searched interval
+        :param stop: the end (exclusive) of the searched interval
+        :return: the index of the first instance of the value
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if self.ordered:
+            update, ranks = self.trace_value(value)
+            node = update[0].nxt[0]
+            if node is not None and node.val == value and start <= ranks[0] + 1 < stop:
+                return ranks[0] + 1
+        else:
+            node = self.head.nxt[0]
+            for i in range(stop):
+                if i >= start and (node.val is value or node.val == value):
+                    return i
+                node = node.nxt[0]
+        raise ValueError(f"{value} is not in list")
+
+    def count(self, value: Any) -> int:
+        """
+        Counts the instances of a value in the SkipList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :return: the number of instances of the value
+        """
+        if self.ordered:
+            return int(value in self)
+        return sum(1 for element in self if element is value or element == value)
+
+    # Overrides MutableSequence mixin method:
+    # The values are added to an ordered SkipList, and appended to a positional
+    # SkipList.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of a positional SkipList, or adds them to an ordered SkipList.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+        for value in values:
+            if self.ordered:
+                self.add(value)
+            else:
+                update, ranks = self.trace_index(self.size)
+                self.link(update, ranks, value)
+
+    def locate(self, index: int) -> SkipListNode:
+        """
+        Finds the node at an index by adding up the spans of the pointers followed from the highest level.
+
+        :param index: a valid, non-negative index of the list
+        :return: the node at the index
+        """
+        node, position = self.head, -1
+        for level in range(self.levels - 1, -1, -1):
+            while node.nxt[level] is not None and position + node.span[level] <= index:
+                position += node.span[level]
+                node = node.nxt[level]
+        return node
+
+    def trace_index(self, index: int) -> tuple:
+        """
+        Finds the last node before an index on every level, and the index of each of these nodes (-1 for the head).
+
+        :param index: an index of the list, up to its size
+        :return: the list of the nodes and the list of their indices, by level
+        """
+        update = [self.head] * self.levels
+        ranks = [-1] * self.levels
+        node, position = self.head, -1
+        for level in range(self.levels - 1, -1, -1):
+            while node.nxt[level] is not None and position + node.span[level] < index:
+                position += node.span[level]
+                node = node.nxt[level]
+            update[level] = node
+            ranks[level] = position
+        return update, ranks
+
+    def trace_value(self, value: Any) -> tuple:
+        """
+        Finds the last node with a value smaller than a value on every level of an ordered SkipList, and the index of
+        each of these nodes (-1 for the head).
+
+        :param value: the value
+        :return: the list of the nodes and the list of their indices, by level
+        """
+        update = [self.head] * self.levels
+        ranks = [-1] * self.levels
+        node, position = self.head, -1
+        for level in range(self.levels - 1, -1, -1):
+            while node.nxt[level] is not None and node.nxt[level].val < value:
+                position += node.span[level]
+                node = node.nxt[level]
+            update[level] = node
+            ranks[level] = position
+        return update, ranks
+
+    def link(self, update: list, ranks: list, value: Any) -> None:
+        """
+        Links a new node with a random number of levels after the nodes found by a trace.
+
+        :param update: the last node before the new node on every level
+        :param ranks: the indices of the nodes in update
+        :param value: the value of the new node
+        :return: None
+        """
+        index = ranks[0] + 1
+        level = 1
+        while level < MAX_LEVEL and random() < PROMOTION_PROBABILITY:
+            level += 1
+
+        # the new levels start at the head, with a pointer spanning to the end of the list
+        for new_level in range(self.levels, level):
+            update.append(self.head)
+            ranks.append(-1)
+            self.head.nxt[new_level] = None
+            self.head.span[new_level] = self.size + 1
+        self.levels = max(self.levels, level)
+
+        node = SkipListNode(value, level)
+        for i in range(level):
+            prev_node = update[i]
+            node.nxt[i] = prev_node.nxt[i]
+            node.span[i] = ranks[i] + prev_node.span[i] + 1 - index
+            prev_node.nxt[i] = node
+            prev_node.span[i] = index - ranks[i]
+
+        # the pointers which pass over the new node span one more position
+        for i in range(level, self.levels):
+            update[i].span[i] += 1
+        self.size += 1
+
+    def unlink(self, update: list) -> None:
+        """
+        Unlinks the node after the nodes found by a trace.
+
+        :param update: the last node before the removed node on every level
+        :return: None
+        """
+        node = update[0].nxt[0]
+        for i in range(self.levels):
+            prev_node = update[i]
+            if prev_node.nxt[i] is node:
+                prev_node.span[i] += node.span[i] - 1
+                prev_node.nxt[i] = node.nxt[i]
+            else:
+                prev_node.span[i] -= 1
+        while self.levels > 1 and self.head.nxt[self.levels - 1] is None:
+            self.levels -= 1
+        self.size -= 1
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin method implements the clear() method by repeatedly removing
+    # single values. A more efficient method is to reset the list all at once.
+    def clear(self) -> None:
+        """
+        Removes all the elements in the SkipList.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        self.size = 0
+        self.levels = 1
+        self.head = SkipListNode(None, MAX_LEVEL)
+        self.head.span[0] = 1
+
+    def copy(self) -> MutableSequence:
+        """
+        Creates a shallow copy of the SkipList.
+        Implements copy to fulfill the list interface.
+
+        :return: a copy of the SkipList
+        """
+        return SkipList(self, self.ordered)
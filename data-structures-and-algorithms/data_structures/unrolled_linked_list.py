@@ -0,0 +1,402 @@
+from collections.abc import MutableSequence, Iterable, Iterator
+from itertools import islice
+from typing import Union, Any, Optional
+from library.array import Array
+
+NODE_CAPACITY: int = 64
+
+
+class UnrolledLinkedListNode:
+    __slots__ = ("array", "size", "prv", "nxt")
+
+    def __init__(self, capacity: int, prv: Optional[object], nxt: Optional[object]):
+        self.array = Array(capacity)
+        self.size = 0
+        self.prv = prv
+        self.nxt = nxt
+
+
+class UnrolledLinkedList(MutableSequence):
+    def __init__(self, elements: Iterable = (), node_capacity: int = NODE_CAPACITY) -> None:
+        """
+        The unrolled linked list is a doubly-linked list of nodes which each hold up to node_capacity elements in an
+        Array, rather than a single element. The pointers of a node are shared by all of its elements, and iterating
+        over the list reads each Array as a block, so the list uses less memory and has better locality than a linked
+        list of single elements. An insertion or deletion only shifts the elements within a single node.
+
+        A full node is split in two when an element is inserted into it, except that appending to a full tail starts a
+        new node, so a list built by appending keeps its nodes full. A node which becomes less than half full takes
+        elements from the next node, or is merged with it if both fit into one node.
+
+        A node is searched for from whichever of the head, the tail or the finger (the last accessed node and the index
+        of its first element) is closest to the index.
+
+        Implements abstract methods from MutableSequence:
+        __getitem__, __setitem__, __delitem__, __len__, insert
+
+        Includes mixin methods from MutableSequence:
+        __contains__, count, append, reverse, pop, remove, __iadd__
+
+        Overrides mixin methods from MutableSequence:
+        __iter__, __reversed__, index, clear, extend
+
+        Implements methods from list:
+        copy
+
+        Overrides methods from object:
+        __repr__
+
+        :param elements: the initial elements of the UnrolledLinkedList
+        :param node_capacity: the number of elements each node can hold
+        """
+        if node_capacity < 4:
+            raise ValueError("node capacity must be at least 4")
+        self.size: int = 0
+        self.node_capacity: int = node_capacity
+        self.head: Optional[UnrolledLinkedListNode] = None
+        self.tail: Optional[UnrolledLinkedListNode] = None
+
+        # the last accessed (index of the first element, node), or None
+        self.finger: Optional[tuple] = None
+
+        # initialize the list
+        self.extend(elements)
+
+    def __repr__(self) -> str:
+        """
+        Creates a string representation of the UnrolledLinkedList.
+        Overrides method in object.
+
+        :return: the string representation
+        """
+        if self.size == 0:
+            return "[]"
+        else:
+            s = "["
+            for element in self:
+                s = s + f"{element}, "
+            s = s[:-2] + "]"
+            return s
+
+    def __len__(self) -> int:
+        """
+        Counts the number of elements in the UnrolledLinkedList.
+        Overrides abstract method in Collection.
+
+        :return: the number of elements
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator:
+        """
+        Creates an iterator which reads the arrays of the nodes one after another.
+        Overrides mixin method in Sequence.
+
+        :return: an iterator for the list
+        """
+        node = self.head
+        while node is not None:
+            yield from islice(node.array, node.size)
+            node = node.nxt
+
+    def __reversed__(self) -> Iterator:
+        """
+        Creates a reverse iterator which reads the arrays of the nodes backwards, from the tail to the head.
+        Overrides mixin method in Sequence.
+
+        :return: a reverse iterator for the list
+        """
+        node = self.tail
+        while node is not None:
+            yield from reversed(node.array.view(slice(0, node.size)))
+            node = node.prv
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, MutableSequence]:
+        """
+        Retrieves the element in an index or elements in a slice of the UnrolledLinkedList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: the value or values
+        """
+
+        # if the index is an integer, return the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                node, start = self.locate(index)
+                return node.array[index - start]
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, return a new UnrolledLinkedList with the elements in the slice
+        if isinstance(index, slice):
+            return UnrolledLinkedList(list(self)[index], self.node_capacity)
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Any, Iterable]) -> None:
+        """
+        Sets the element in an index or elements in a slice of the UnrolledLinkedList with a value or iterable of values.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :param value: the value or values
+        :return: None
+        """
+
+        # if the index is an integer, set the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                node, start = self.locate(index)
+                node.array[index - start] = value
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the nodes are rebuilt from the updated elements
+        if isinstance(index, slice):
+            if isinstance(value, Iterable):
+                elements = list(self)
+                elements[index] = value
+                self.clear()
+                self.extend(elements)
+                return
+            raise TypeError("can only assign an iterable")
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Deletes the element in an index or elements in a slice of the UnrolledLinkedList.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index or slice
+        :return: None
+        """
+
+        # if the index is an integer, delete the element at a single position
+        if isinstance(index, int):
+            if -self.size <= index < self.size:
+                index = index % self.size
+                node, start = self.locate(index)
+                offset = index - start
+                node.array[offset:node.size - 1] = node.array.view(slice(offset + 1, node.size))
+                node.array[node.size - 1] = None
+                node.size -= 1
+                self.size -= 1
+                self.rebalance(node, start)
+                return
+            raise IndexError("list index out of range")
+
+        # if the index is a slice, the nodes are rebuilt from the remaining elements
+        if isinstance(index, slice):
+            elements = list(self)
+            del elements[index]
+            self.clear()
+            self.extend(elements)
+            return
+
+        # if the index is neither type, return an error
+        raise TypeError("index must be an int or a slice")
+
+    def insert(self, index: int, value: Any) -> None:
+        """
+        Inserts a new value into the UnrolledLinkedList at a given index. Only the elements behind the index in the same
+        node are shifted, and the node is split in two if it is full.
+        Overrides abstract method in MutableSequence.
+
+        :param index: the index
+        :param value: the new value
+        :return: None
+        """
+        if -self.size <= index <= self.size:
+            index = (index + self.size) if index < 0 else index
+
+            # appending to a full (or missing) tail starts a new node
+            if index == self.size:
+                if self.tail is None or self.tail.size == self.node_capacity:
+                    self.link_after(self.tail)
+                node, start = self.tail, self.size - self.tail.size
+            else:
+                node, start = self.locate(index)
+                if node.size == self.node_capacity:
+                    self.split(node)
+                    if index - start > node.size:
+                        start += node.size
+                        node = node.nxt
+            offset = index - start
+            if offset < node.size:
+                node.array[offset + 1:node.size + 1] = node.array.view(slice(offset, node.size))
+            node.array[offset] = value
+            node.size += 1
+            self.size += 1
+            self.finger = (start, node)
+            return
+        raise IndexError("index out of range")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of index() retrieves the values by index.
+    # Instead, the values are read from the arrays of the nodes in order.
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Finds the index of the first instance of a value in the interval [start, stop) of the UnrolledLinkedList.
+        Overrides mixin method in Sequence.
+
+        :param value: the value
+        :param start: the start (inclusive) of the searched interval
+        :param stop: the end (exclusive) of the searched interval
+        :return: the index of the first instance of the value
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        for i, element in enumerate(islice(self, start, stop), start):
+            if element is value or element == value:
+                return i
+        raise ValueError(f"{value} is not in list")
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin implementation of extend() inserts the values one at a time.
+    # Instead, the tail is filled and new nodes are filled in blocks.
+    def extend(self, values: Iterable) -> None:
+        """
+        Appends an iterable of values to the end of the UnrolledLinkedList.
+        Overrides mixin method in MutableSequence.
+
+        :param values: the new values
+        :return: None
+        """
+        values = list(values)
+        position = 0
+        while position < len(values):
+            if self.tail is None or self.tail.size == self.node_capacity:
+                self.link_after(self.tail)
+            node = self.tail
+            block = values[position:position + self.node_capacity - node.size]
+            node.array[node.size:node.size + len(block)] = block
+            node.size += len(block)
+            position += len(block)
+        self.size += len(values)
+
+    def locate(self, index: int) -> tuple:
+        """
+        Finds the node holding an index by walking from whichever of the head, the tail or the finger is closest to it,
+        and moves the finger to the node.
+
+        :param index: a valid, non-negative index of the list
+        :return: the node and the index of its first element
+        """
+        curr_start, curr_node = 0, self.head
+        if self.size - index < index:
+            curr_start, curr_node = self.size - self.tail.size, self.tail
+        if self.finger is not None and abs(self.finger[0] - index) < abs(curr_start - index):
+            curr_start, curr_node = self.finger
+        while index >= curr_start + curr_node.size:
+            curr_start += curr_node.size
+            curr_node = curr_node.nxt
+        while index < curr_start:
+            curr_node = curr_node.prv
+            curr_start -= curr_node.size
+        self.finger = (curr_start, curr_node)
+        return curr_node, curr_start
+
+    def link_after(self, node: Optional[UnrolledLinkedListNode]) -> UnrolledLinkedListNode:
+        """
+        Links a new, empty node into the list after a node.
+
+        :param node: the node before the new node, or None to link the new node at the head
+        :return: the new node
+        """
+        nxt = self.head if node is None else node.nxt
+        new_node = UnrolledLinkedListNode(self.node_capacity, node, nxt)
+        if node is None:
+            self.head = new_node
+        else:
+            node.nxt = new_node
+        if nxt is None:
+            self.tail = new_node
+        else:
+            nxt.prv = new_node
+        return new_node
+
+    def unlink(self, node: UnrolledLinkedListNode) -> None:
+        """
+        Removes a node from the list.
+
+        :param node: the removed node
+        :return: None
+        """
+        if node.prv is None:
+            self.head = node.nxt
+        else:
+            node.prv.nxt = node.nxt
+        if node.nxt is None:
+            self.tail = node.prv
+        else:
+            node.nxt.prv = node.prv
+        self.finger = None
+
+    def split(self, node: UnrolledLinkedListNode) -> None:
+        """
+        Splits a node into two nodes holding half of its elements each.
+
+        :param node: the node
+        :return: None
+        """
+        half = node.size // 2
+        new_node = self.link_after(node)
+        new_node.array[:node.size - half] = node.array.view(slice(half, node.size))
+        node.array[half:node.size] = [None] * (node.size - half)
+        new_node.size = node.size - half
+        node.size = half
+
+    def rebalance(self, node: UnrolledLinkedListNode, start: int) -> None:
+        """
+        Restores the fill of a node after a deletion: an empty node is removed, and a node which is less than half full
+        is merged with the next node if both fit into one node, or otherwise takes elements from the next node until it
+        is half full.
+
+        :param node: the node
+        :param start: the index of the first element of the node
+        :return: None
+        """
+        half = self.node_capacity // 2
+        if node.size == 0:
+            self.unlink(node)
+            return
+        nxt = node.nxt
+        if node.size >= half or nxt is None:
+            return
+        moved = nxt.size if node.size + nxt.size <= self.node_capacity else half - node.size
+        node.array[node.size:node.size + moved] = nxt.array.view(slice(0, moved))
+        nxt.array[:nxt.size - moved] = nxt.array.view(slice(moved, nxt.size))
+        nxt.array[nxt.size - moved:nxt.size] = [None] * moved
+        node.size += moved
+        nxt.size -= moved
+        if nxt.size == 0:
+            self.unlink(nxt)
+        self.finger = (start, node)
+
+    # Overrides MutableSequence mixin method for efficiency:
+    # The mixin method implements the clear() method by repeatedly removing
+    # single values. A more efficient method is to reset the list all at once.
+    def clear(self) -> None:
+        """
+        Removes all the elements in the UnrolledLinkedList.
+        Overrides mixin method in MutableSequence.
+
+        :return: None
+        """
+        self.size = 0
+        self.head = None
+        self.tail = None
+        self.finger = None
+
+    def copy(self) -> MutableSequence:
+        """
+        Creates a shallow copy of the UnrolledLinkedList.
+        Implements copy to fulfill the list interface.
+
+        :return: a copy of the UnrolledLinkedList
+        """
+        return UnrolledLinkedList(self, self.node_capacity)
@@ -0,0 +1,120 @@
+from library.array_linked_list import ArrayLinkedList
+from random import random, randint, randrange
+import pickle
+import unittest
+
+
+class ArrayLinkedListTest(unittest.TestCase):
+    def test_empty_init(self):
+        test_all = ArrayLinkedList([])
+        self.assertEqual(len(test_all), 0)
+        self.assertSequenceEqual(test_all, [])
+        with self.assertRaises(IndexError):
+            v = test_all[0]
+        with self.assertRaises(IndexError):
+            del test_all[0]
+        with self.assertRaises(IndexError):
+            test_all.pop()
+
+    def test_collection_init(self):
+        for size in range(20):
+            test_list = [random() for _ in range(size)]
+            test_all = ArrayLinkedList(test_list)
+            self.assertEqual(len(test_list), len(test_all))
+            self.assertSequenceEqual(test_list, test_all)
+            self.assertSequenceEqual(test_list[::-1], list(reversed(test_all)))
+
+    def test_model(self):
+        for sample in range(100):
+            test_list = [random() for _ in range(randint(0, 10))]
+            test_all = ArrayLinkedList(test_list)
+            for step in range(40):
+                operation = randint(0, 6)
+                if operation < 2:
+                    i = randint(-len(test_list), len(test_list))
+                    test_list.insert(i, step)
+                    test_all.insert(i, step)
+                elif operation == 2 and test_list:
+                    i = randrange(-len(test_list), len(test_list))
+                    del test_list[i]
+                    del test_all[i]
+                elif operation == 3 and test_list:
+                    i = randrange(-len(test_list), len(test_list))
+                    self.assertEqual(test_list.pop(i), test_all.pop(i))
+                elif operation == 4 and test_list:
+                    i = randrange(len(test_list))
+                    self.assertEqual(test_list[i], test_all[i])
+                    test_list[i] = step
+                    test_all[i] = step
+                elif operation == 5:
+                    test_list.reverse()
+                    test_all.reverse()
+                else:
+                    test_list.extend([step, step])
+                    test_all.extend([step, step])
+                self.assertSequenceEqual(test_list, test_all)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_all)))
+
+            # every slot is either in the list or on the free list
+            free, slot = 0, test_all.free
+            while slot != -1:
+                free += 1
+                slot = test_all.nxt[slot]
+            self.assertEqual(len(test_all.values), len(test_all) + free)
+
+    def test_sequence_methods(self):
+        test_list = [randint(0, 4) for _ in range(30)]
+        test_all = ArrayLinkedList(test_list)
+        for value in range(6):
+            self.assertEqual(value in test_list, value in test_all)
+            self.assertEqual(test_list.count(value), test_all.count(value))
+            for start, stop in [(0, 30), (5, 20), (-10, -2)]:
+                if value in test_list[start:stop]:
+                    self.assertEqual(test_list.index(value, start, stop), test_all.index(value, start, stop))
+                else:
+                    with self.assertRaises(ValueError):
+                        test_all.index(value, start, stop)
+        for value in [0, 1, 2, 3, 4]:
+            while value in test_list:
+                test_list.remove(value)
+                test_all.remove(value)
+                self.assertSequenceEqual(test_list, test_all)
+        with self.assertRaises(ValueError):
+            test_all.remove(0)
+
+    def test_free_list(self):
+        test_all = ArrayLinkedList(range(100))
+        test_all.append(100)
+        capacity = len(test_all.values)
+        for i in range(1000):
+            test_all.append(i)
+            test_all.pop(0)
+        self.assertEqual(capacity, len(test_all.values))
+        self.assertSequenceEqual(list(range(899, 1000)), test_all)
+
+    def test_compact_copy(self):
+        test_list = list(range(50))
+        test_all = ArrayLinkedList(test_list)
+        for i in range(0, 50, 3):
+            test_all.insert(randint(0, len(test_all)), -i)
+            test_all.pop(randrange(len(test_all)))
+        test_list = list(test_all)
+        test_copy = test_all.copy()
+        test_all.compact()
+        self.assertSequenceEqual(test_list, test_all)
+        self.assertSequenceEqual(list(range(1, len(test_list))), [test_all.nxt[i] for i in range(len(test_list) - 1)])
+        test_all[0] = "changed"
+        self.assertSequenceEqual(test_list, test_copy)
+
+    def test_pickle(self):
+        test_all = ArrayLinkedList(range(200000))
+        del test_all[5]
+        loaded = pickle.loads(pickle.dumps(test_all))
+        self.assertEqual(len(test_all), len(loaded))
+        self.assertSequenceEqual(list(test_all), list(loaded))
+        loaded.append(-1)
+        self.assertEqual(-1, loaded[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
-from library.array_list import ArrayList
-from random import random, randint
+from library.array_list import ArrayList, GeometricGrowth, FixedStepGrowth, HysteresisShrink, NeverShrink
+from random import random, randint, randrange
+import pickle
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class ArrayListTest(unittest.TestCase):
     def test_empty_init(self):
@@ -151,6 +157,30 @@ class ArrayListTest(unittest.TestCase):
                 self.assertEqual(len(test_list), len(test_arraylist))
                 self.assertSequenceEqual(test_list, test_arraylist)
 
+    def test_extend(self):
+        for base_size in range(10):
+            for suffix_size in range(10):
+                base_list = [random() for _ in range(base_size)]
+                suffix_list = [random() for _ in range(suffix_size)]
+                test_arraylist = ArrayList(base_list)
+                test_arraylist.extend(iter(suffix_list))
+                test_arraylist += suffix_list
+                base_list.extend(suffix_list)
+                base_list += suffix_list
+                self.assertSequenceEqual(base_list, test_arraylist)
+
+    def test_insert_many(self):
+        for size in range(10):
+            for insert_size in range(10):
+                for i in range(-size, size + 1):
+                    test_list = [random() for _ in range(size)]
+                    insertion = [random() for _ in range(insert_size)]
+                    test_arraylist = ArrayList(test_list)
+                    test_arraylist.insert_many(i, insertion)
+                    i = (i + size) if i < 0 else i
+                    test_list[i:i] = insertion
+                    self.assertSequenceEqual(test_list, test_arraylist)
+
     def test_clear(self):
         for size in range(0, 20):
             for sample in range(50):
@@ -179,6 +209,242 @@ class ArrayListTest(unittest.TestCase):
                 test_arraylist.sort()
                 self.assertSequenceEqual(test_list, test_arraylist)
 
+    def test_sort_runs(self):
+        for size in [0, 1, 31, 32, 33, 100, 500]:
+            for run_size in [1, 5, 40]:
+                test_list = []
+                while len(test_list) < size:
+                    run = sorted(randint(0, 20) for _ in range(run_size))
+                    test_list.extend(run if randint(0, 1) else run[::-1])
+                test_arraylist = ArrayList(test_list)
+                test_list.sort()
+                test_arraylist.sort()
+                self.assertSequenceEqual(test_list, test_arraylist)
+
+    def test_sort_key_reverse(self):
+        for size in range(0, 100, 7):
+            for sample in range(10):
+                test_list = [(randint(0, 5), i) for i in range(size)]
+                for reverse in [False, True]:
+                    test_arraylist = ArrayList(test_list)
+                    expected = sorted(test_list, key=lambda pair: pair[0], reverse=reverse)
+                    test_arraylist.sort(key=lambda pair: pair[0], reverse=reverse)
+                    self.assertSequenceEqual(expected, test_arraylist)
+
+    def test_bulk_methods(self):
+        test_list = [randint(-20, 20) for _ in range(50)]
+        test_arraylist = ArrayList(test_list)
+        self.assertSequenceEqual([v * 2 for v in test_list], test_arraylist.map(lambda v: v * 2))
+        self.assertSequenceEqual([v for v in test_list if v > 0], test_arraylist.filter(lambda v: v > 0))
+        self.assertEqual(sum(test_list), test_arraylist.sum())
+        self.assertEqual(min(test_list), test_arraylist.min())
+        self.assertEqual(max(test_list), test_arraylist.max())
+        self.assertSequenceEqual(sorted(range(50), key=test_list.__getitem__), test_arraylist.argsort())
+        test_list.sort()
+        test_arraylist.sort()
+        for value in range(-22, 22):
+            self.assertEqual(test_list.index(value) if value in test_list else None,
+                             test_arraylist.searchsorted(value) if value in test_list else None)
+            self.assertEqual(sum(v <= value for v in test_list), test_arraylist.searchsorted(value, side="right"))
+        with self.assertRaises(ValueError):
+            ArrayList().min()
+
+    def test_policies(self):
+        for policy in [GeometricGrowth(), GeometricGrowth(1.5, 3), FixedStepGrowth(5), HysteresisShrink(),
+                       NeverShrink()]:
+            test_list = []
+            test_arraylist = ArrayList(policy=policy)
+            for s in range(200):
+                i = randint(-s, s)
+                test_list.insert(i, s)
+                test_arraylist.insert(i, s)
+                self.assertLessEqual(len(test_arraylist), test_arraylist.capacity())
+            while test_list:
+                i = randint(0, len(test_list) - 1)
+                del test_list[i]
+                del test_arraylist[i]
+                self.assertLessEqual(len(test_arraylist), test_arraylist.capacity())
+            self.assertSequenceEqual(test_list, test_arraylist)
+            self.assertGreaterEqual(test_arraylist.peak_capacity, 200)
+            if isinstance(policy, NeverShrink):
+                self.assertEqual(test_arraylist.capacity(), test_arraylist.peak_capacity)
+            else:
+                self.assertLess(test_arraylist.capacity(), test_arraylist.peak_capacity)
+
+    def test_counters(self):
+        test_arraylist = ArrayList()
+        for i in range(1000):
+            test_arraylist.append(i)
+        self.assertEqual(test_arraylist.peak_capacity, 1024)
+        self.assertEqual(test_arraylist.reallocations, 7)
+        self.assertEqual(test_arraylist.elements_copied, 8 + 16 + 32 + 64 + 128 + 256 + 512)
+
+        # test reserve and shrink_to_fit
+        test_arraylist = ArrayList(policy=NeverShrink())
+        test_arraylist.reserve(100)
+        self.assertEqual(test_arraylist.capacity(), 100)
+        test_arraylist.extend(range(100))
+        self.assertEqual(test_arraylist.reallocations, 1)
+        del test_arraylist[10:]
+        self.assertEqual(test_arraylist.capacity(), 100)
+        test_arraylist.shrink_to_fit()
+        self.assertEqual(test_arraylist.capacity(), 10)
+        self.assertSequenceEqual(list(range(10)), test_arraylist)
+
+    def test_copy_on_write(self):
+        for sample in range(200):
+            test_list = [random() for _ in range(randint(0, 30))]
+            test_arraylist = ArrayList(test_list)
+            start, stop, step = randint(-35, 35), randint(-35, 35), randint(1, 4) * (1 if random() < 0.7 else -1)
+            shared = [test_list.copy(), test_list[start:stop:step]]
+            test_shared = [test_arraylist.copy(), test_arraylist[start:stop:step]]
+
+            # mutate the original or one of the shares, and check that the others are unchanged
+            target = randint(0, 2)
+            models = [test_list] + shared
+            lists = [test_arraylist] + test_shared
+            operation = randint(0, 3)
+            if operation == 0:
+                models[target].append(1.0)
+                lists[target].append(1.0)
+            elif operation == 1 and models[target]:
+                del models[target][0]
+                del lists[target][0]
+            elif operation == 2 and models[target]:
+                models[target][-1] = 2.0
+                lists[target][-1] = 2.0
+            else:
+                models[target].sort()
+                lists[target].sort()
+            for model, test in zip(models, lists):
+                self.assertSequenceEqual(model, test)
+
+        # an unmutated copy does not copy the array, and the first mutation copies it once
+        test_arraylist = ArrayList(range(100))
+        test_copy = test_arraylist.copy()
+        self.assertIs(test_arraylist.array, test_copy.array)
+        test_slice = test_arraylist[10:20]
+        self.assertEqual(test_arraylist.reallocations, 0)
+        test_copy[0] = -1
+        self.assertEqual(test_copy.reallocations, 1)
+        self.assertEqual(test_copy.elements_copied, 100)
+        test_slice.append(20)
+        self.assertEqual(test_slice.elements_copied, 10)
+        self.assertSequenceEqual(list(range(10, 21)), test_slice)
+
+        # once the shares are gone, the original list mutates its array in place
+        del test_copy, test_slice
+        test_arraylist[0] = -1
+        self.assertEqual(test_arraylist.reallocations, 0)
+        self.assertSequenceEqual([-1] + list(range(1, 100)), test_arraylist)
+
+    def test_sequence_methods(self):
+        for size in range(12):
+            for sample in range(10):
+                test_list = [randint(0, 4) for _ in range(size)]
+                test_arraylist = ArrayList(test_list)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_arraylist)))
+                for value in range(6):
+                    self.assertEqual(value in test_list, value in test_arraylist)
+                    self.assertEqual(test_list.count(value), test_arraylist.count(value))
+                    for start, stop in [(0, None), (2, None), (-3, None), (1, -1), (5, 3)]:
+                        try:
+                            expected = test_list.index(value, start, size if stop is None else stop)
+                        except ValueError:
+                            with self.assertRaises(ValueError):
+                                test_arraylist.index(value, start, stop)
+                        else:
+                            self.assertEqual(expected, test_arraylist.index(value, start, stop))
+
+                # pop and remove values until the list is empty
+                while test_list:
+                    if random() < 0.5:
+                        i = randrange(-len(test_list), len(test_list)) if random() < 0.5 else -1
+                        self.assertEqual(test_list.pop(i), test_arraylist.pop(i))
+                    else:
+                        value = randint(0, 5)
+                        if value in test_list:
+                            test_list.remove(value)
+                            test_arraylist.remove(value)
+                        else:
+                            with self.assertRaises(ValueError):
+                                test_arraylist.remove(value)
+                    self.assertSequenceEqual(test_list, test_arraylist)
+                with self.assertRaises(IndexError):
+                    test_arraylist.pop()
+
+    def test_pickle(self):
+        test_list = [random() for _ in range(100)]
+        test_arraylist = ArrayList(test_list + test_list, policy=FixedStepGrowth(3))
+        del test_arraylist[100:]
+        copy = pickle.loads(pickle.dumps(test_arraylist))
+        self.assertSequenceEqual(test_list, copy)
+        self.assertIsInstance(copy.policy, FixedStepGrowth)
+        self.assertEqual(copy.capacity(), 100)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumericArrayListTest(unittest.TestCase):
+    def test_model(self):
+        for size in range(20):
+            for sample in range(20):
+                test_list = []
+                test_arraylist = ArrayList(dtype=numpy.int64)
+                for s in range(size):
+                    i = randint(-s, s)
+                    v = randint(-100, 100)
+                    test_list.insert(i, v)
+                    test_arraylist.insert(i, v)
+                self.assertSequenceEqual(test_list, test_arraylist)
+                test_list.extend(range(size))
+                test_arraylist.extend(range(size))
+                self.assertSequenceEqual(test_list, test_arraylist)
+                for s in range(len(test_list), 0, -1):
+                    i = randint(0, s - 1)
+                    del test_list[i]
+                    del test_arraylist[i]
+                    self.assertSequenceEqual(test_list, test_arraylist)
+                self.assertIsInstance(test_arraylist.array.elements, numpy.ndarray)
+
+    def test_slice(self):
+        test_list = list(range(10))
+        test_arraylist = ArrayList(test_list, dtype=numpy.int64)
+        for step in [-3, -1, 1, 2]:
+            self.assertSequenceEqual(test_list[1:8:step], test_arraylist[1:8:step])
+        test_list[2:5] = [7, 7, 7, 7, 7]
+        test_arraylist[2:5] = [7, 7, 7, 7, 7]
+        del test_list[::3]
+        del test_arraylist[::3]
+        self.assertSequenceEqual(test_list, test_arraylist)
+
+    def test_bulk_methods(self):
+        test_list = [randint(-20, 20) for _ in range(50)]
+        test_arraylist = ArrayList(test_list, dtype=numpy.int64)
+        self.assertSequenceEqual([v * 2 for v in test_list], test_arraylist.map(lambda a: a * 2))
+        self.assertSequenceEqual([v for v in test_list if v > 0], test_arraylist.filter(lambda a: a > 0))
+        self.assertEqual(sum(test_list), test_arraylist.sum())
+        self.assertEqual(min(test_list), test_arraylist.min())
+        self.assertEqual(max(test_list), test_arraylist.max())
+        self.assertSequenceEqual(sorted(range(50), key=test_list.__getitem__), test_arraylist.argsort())
+        test_copy = test_arraylist[:]
+        test_copy.sort(key=numpy.abs, reverse=True)
+        self.assertSequenceEqual(sorted(test_list, key=abs, reverse=True), test_copy)
+        test_list.sort()
+        test_arraylist.sort()
+        self.assertSequenceEqual(test_list, test_arraylist)
+        self.assertEqual(sum(v < 3 for v in test_list), test_arraylist.searchsorted(3))
+        self.assertEqual(sum(v <= 3 for v in test_list), test_arraylist.searchsorted(3, side="right"))
+
+    def test_serialization(self):
+        test_arraylist = ArrayList(range(100), dtype=numpy.int64)
+        buffers = []
+        data = pickle.dumps(test_arraylist, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertSequenceEqual(list(range(100)), pickle.loads(data, buffers=buffers))
+        copy = ArrayList.from_bytes(test_arraylist.to_bytes(), dtype=numpy.int64)
+        self.assertEqual(copy.dtype, numpy.int64)
+        self.assertSequenceEqual(list(range(100)), copy)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,13 @@
+import os
+import pickle
+import sys
+import tempfile
 import unittest
+from array import array as typed_array
 from math import ceil
 
-from library.array import Array
-from random import random
+from library.array import Array, ArrayView, MAPPED_HEADER, MAPPED_MAGIC
+from random import random, randint
 
 
 class ArrayTest(unittest.TestCase):
@@ -103,6 +108,210 @@ class ArrayTest(unittest.TestCase):
                                         test_array[start:stop:step] = insertion
                                         self.assertSequenceEqual(test_list, test_array)
 
+    def test_typed(self):
+
+        # typed init is zero-filled
+        for size in range(10):
+            test_array = Array(size, typecode="d")
+            self.assertEqual(len(test_array), size)
+            self.assertSequenceEqual(test_array, [0.0] * size)
+
+        # model test index and slice
+        for size in range(5):
+            for sample in range(5):
+                test_list = [random() for _ in range(size)]
+                test_array = Array(size, typecode="d")
+                test_array[:] = test_list
+                for start in range(-(size + 1), size + 2):
+                    for stop in range(-(size + 1), size + 2):
+                        for step in [-2, -1, 1, 2]:
+                            array_slice = test_array[start:stop:step]
+                            self.assertEqual(array_slice.typecode, "d")
+                            self.assertSequenceEqual(test_list[start:stop:step], array_slice)
+
+        # test the values are checked against the typecode
+        test_array = Array(3, typecode="q")
+        with self.assertRaises(TypeError):
+            test_array[0] = "a"
+        with self.assertRaises(IndexError):
+            test_array[3] = 1
+
+    def test_buffer(self):
+        test_array = Array(4, typecode="q")
+        test_array[:] = [1, 2, 3, 4]
+        view = test_array.buffer()
+        self.assertEqual(view.format, "q")
+        view[0] = 10
+        self.assertEqual(test_array[0], 10)
+        with self.assertRaises(TypeError):
+            Array(4).buffer()
+
+        # bytes() and memoryview() of buffer() work on every version, memoryview() of the Array only on 3.12+
+        test_array = Array(4, typecode="d")
+        test_array[:] = [0.5, 1.5, 2.5, 3.5]
+        self.assertEqual(typed_array("d", [0.5, 1.5, 2.5, 3.5]).tobytes(), bytes(test_array))
+        self.assertEqual(typed_array("d", [1.5, 2.5]).tobytes(), bytes(test_array.view(slice(1, 3))))
+        self.assertEqual([0.5, 1.5, 2.5, 3.5], memoryview(test_array.buffer()).tolist())
+        if sys.version_info >= (3, 12):
+            self.assertEqual([0.5, 1.5, 2.5, 3.5], memoryview(test_array).tolist())
+            self.assertEqual([1.5, 2.5], memoryview(test_array.view(slice(1, 3))).tolist())
+        else:
+            with self.assertRaises(TypeError):
+                memoryview(test_array)
+        with self.assertRaises(TypeError):
+            bytes(Array(4))
+
+    def test_sequence_methods(self):
+        for typecode in [None, "q"]:
+            for size in range(12):
+                test_list = [randint(0, 4) for _ in range(size)]
+                test_array = Array(size, typecode=typecode)
+                test_array[:] = test_list
+                self.assertSequenceEqual(test_list, list(iter(test_array)))
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_array)))
+                for value in range(6):
+                    self.assertEqual(value in test_list, value in test_array)
+                    self.assertEqual(test_list.count(value), test_array.count(value))
+                    for start, stop in [(0, None), (2, None), (-3, None), (1, -1), (5, 3)]:
+                        try:
+                            expected = test_list.index(value, start, size if stop is None else stop)
+                        except ValueError:
+                            with self.assertRaises(ValueError):
+                                test_array.index(value, start, stop)
+                        else:
+                            self.assertEqual(expected, test_array.index(value, start, stop))
+
+    def test_view(self):
+
+        # model test nested views
+        for size in range(6):
+            test_list = [random() for _ in range(size)]
+            test_array = Array(size)
+            test_array[:] = test_list
+            for step in [-2, -1, 1, 2]:
+                for start in range(-(size + 1), size + 2):
+                    view = test_array.view(slice(start, None, step))
+                    self.assertIsInstance(view, ArrayView)
+                    self.assertSequenceEqual(test_list[start::step], view)
+                    self.assertSequenceEqual(test_list[start::step][1::-1], view[1::-1])
+                    self.assertSequenceEqual(test_list[start::step], view.copy())
+
+        # test writes go through to the array
+        test_list = [random() for _ in range(10)]
+        test_array = Array(10)
+        test_array[:] = test_list
+        view = test_array.view(slice(1, 9))[::2]
+        view[0] = -1.0
+        view[-1] = -2.0
+        test_list[1] = -1.0
+        test_list[7] = -2.0
+        self.assertSequenceEqual(test_list, test_array)
+        view[1:3] = [-3.0, -4.0]
+        test_list[3:7:2] = [-3.0, -4.0]
+        self.assertSequenceEqual(test_list, test_array)
+        with self.assertRaises(ValueError):
+            view[1:3] = [0.0]
+        with self.assertRaises(IndexError):
+            v = view[4]
+
+        # test the typed view shares the buffer
+        test_array = Array(6, typecode="q")
+        test_array[:] = range(6)
+        view = test_array.view(slice(None, None, -2))
+        self.assertSequenceEqual(view.buffer().tolist(), [5, 3, 1])
+
+    def test_mapped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "array.bin")
+
+            # test a new file is zeroed and writes persist
+            test_list = [random() for _ in range(20)]
+            with Array.from_file(path, "d", 20) as test_array:
+                self.assertSequenceEqual([0.0] * 20, test_array)
+                test_array[:] = test_list
+                test_array[3] = -1.0
+                test_list[3] = -1.0
+                self.assertSequenceEqual(test_list[2:15:3], test_array[2:15:3])
+                self.assertSequenceEqual(test_list[::-1], test_array.view(slice(None, None, -1)))
+            self.assertEqual(len(test_array), 0)
+
+            # test reopening the file
+            with Array.open(path) as test_array:
+                self.assertSequenceEqual(test_list, test_array)
+            with Array.from_file(path, "d", 20) as test_array:
+                self.assertSequenceEqual(test_list, test_array)
+            with self.assertRaises(ValueError):
+                Array.from_file(path, "d", 21)
+
+            # test a read-only mapping
+            with Array.open(path, readonly=True) as test_array:
+                self.assertSequenceEqual(test_list, test_array)
+                with self.assertRaises(TypeError):
+                    test_array[0] = 1.0
+
+    def test_mapped_invalid(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "array.bin")
+            valid = MAPPED_HEADER.pack(MAPPED_MAGIC, b"d", 2) + bytes(16)
+            contents = [
+                b"",                                                    # empty file
+                b"ARRY",                                                # truncated header
+                b"not an array file, but long enough",                  # wrong magic
+                MAPPED_HEADER.pack(MAPPED_MAGIC, b"\xff", 2) + bytes(16),  # non-ASCII typecode
+                MAPPED_HEADER.pack(MAPPED_MAGIC, b"z", 2) + bytes(16),  # unknown typecode
+                valid[:-1],                                             # truncated elements
+            ]
+            for content in contents:
+                with open(path, "wb") as file:
+                    file.write(content)
+                for readonly in [False, True]:
+                    with self.assertRaisesRegex(ValueError, "does not hold a mapped array"):
+                        Array.open(path, readonly=readonly)
+            with open(path, "wb") as file:
+                file.write(valid)
+            with Array.open(path) as test_array:
+                self.assertSequenceEqual([0.0, 0.0], test_array)
+
+    def test_pickle(self):
+        test_list = [random() for _ in range(10)]
+        for typecode in [None, "d"]:
+            test_array = Array(10, typecode=typecode)
+            test_array[:] = test_list
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                copy = pickle.loads(pickle.dumps(test_array, protocol=protocol))
+                self.assertEqual(copy.typecode, typecode)
+                self.assertSequenceEqual(test_list, copy)
+
+        # test the typed elements are sent out-of-band
+        buffers = []
+        data = pickle.dumps(test_array, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 80)
+        self.assertSequenceEqual(test_list, pickle.loads(data, buffers=buffers))
+
+    def test_bytes(self):
+        test_array = Array(10, typecode="q")
+        test_array[:] = range(10)
+        data = test_array.to_bytes()
+        self.assertEqual(len(data), 16 + 80)
+        copy = Array.from_bytes(data)
+        self.assertEqual(copy.typecode, "q")
+        self.assertSequenceEqual(list(range(10)), copy)
+        self.assertSequenceEqual(list(range(9, -1, -3)), Array.from_bytes(test_array.view(slice(None, None, -3)).to_bytes()))
+        with self.assertRaises(TypeError):
+            Array(10).to_bytes()
+        with self.assertRaises(ValueError):
+            Array.from_bytes(data[:-1])
+
+        # test the serialized array can be mapped from a file
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "array.bin")
+            with open(path, "wb") as file:
+                file.write(data)
+            with Array.open(path, readonly=True) as mapped_array:
+                self.assertSequenceEqual(list(range(10)), mapped_array)
+                self.assertSequenceEqual(list(range(10)), pickle.loads(pickle.dumps(mapped_array, protocol=5)))
+
 
 if __name__ == '__main__':
     unittest.main()
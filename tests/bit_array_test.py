@@ -0,0 +1,117 @@
+from library.bit_array import BitArray
+from random import random, randint
+import unittest
+
+
+def random_bits(size):
+    return [random() < 0.5 for _ in range(size)]
+
+
+def model(bits):
+    test_bitarray = BitArray(len(bits))
+    for i, bit in enumerate(bits):
+        test_bitarray[i] = bit
+    return test_bitarray
+
+
+class BitArrayTest(unittest.TestCase):
+    def test_init(self):
+        for size in range(20):
+            test_bitarray = BitArray(size)
+            self.assertEqual(len(test_bitarray), size)
+            self.assertSequenceEqual([False] * size, test_bitarray)
+            self.assertEqual(len(test_bitarray.array), (size + 7) // 8)
+
+    def test_getitem(self):
+        for size in range(20):
+            test_list = random_bits(size)
+            test_bitarray = model(test_list)
+            with self.assertRaises(IndexError):
+                v = test_bitarray[size]
+            with self.assertRaises(IndexError):
+                v = test_bitarray[-size - 1]
+            for i in range(-size, size):
+                self.assertEqual(test_list[i], test_bitarray[i])
+            for start in range(-size - 1, size + 1, 3):
+                for stop in range(-size - 1, size + 1, 3):
+                    for step in [-3, -1, 1, 2]:
+                        self.assertSequenceEqual(test_list[start:stop:step], test_bitarray[start:stop:step])
+
+    def test_setitem(self):
+        for size in range(20):
+            test_list = random_bits(size)
+            test_bitarray = model(test_list)
+            for i in range(-size, size):
+                v = random() < 0.5
+                test_list[i] = v
+                test_bitarray[i] = v
+                self.assertSequenceEqual(test_list, test_bitarray)
+            insertion = random_bits(len(test_list[1::2]))
+            test_list[1::2] = insertion
+            test_bitarray[1::2] = insertion
+            self.assertSequenceEqual(test_list, test_bitarray)
+            with self.assertRaises(ValueError):
+                test_bitarray[:] = [True] * (size + 1)
+
+    def test_contiguous_slices(self):
+        for size in [0, 1, 7, 8, 9, 30, 70]:
+            test_list = random_bits(size)
+            test_bitarray = model(test_list)
+            for sample in range(40):
+                start, stop = sorted([randint(-size - 1, size + 1), randint(-size - 1, size + 1)])
+                self.assertSequenceEqual(test_list[start:stop], test_bitarray[start:stop])
+                insertion = random_bits(len(test_list[start:stop]))
+                test_list[start:stop] = insertion
+                if random() < 0.5:
+                    test_bitarray[start:stop] = insertion
+                else:
+                    test_bitarray[start:stop] = model(insertion)
+                self.assertSequenceEqual(test_list, test_bitarray)
+                self.assertEqual(test_list.count(True), test_bitarray.count())
+                self.assertEqual(test_list.count(False), test_bitarray.count(False))
+
+            # the bits past the end stay clear
+            self.assertEqual(sum(test_list), bin(test_bitarray.to_int()).count("1"))
+
+    def test_fill(self):
+        for size in range(30):
+            for sample in range(10):
+                start, stop = randint(-size, size), randint(-size, size)
+                step = 1 if sample % 2 else randint(1, 3)
+                value = random() < 0.5
+                test_list = random_bits(size)
+                test_bitarray = model(test_list)
+                test_list[start:stop:step] = [value] * len(test_list[start:stop:step])
+                test_bitarray.fill(value, slice(start, stop, step))
+                self.assertSequenceEqual(test_list, test_bitarray)
+
+    def test_bulk(self):
+        for size in range(70):
+            list1, list2 = random_bits(size), random_bits(size)
+            bits1, bits2 = model(list1), model(list2)
+            self.assertSequenceEqual([a and b for a, b in zip(list1, list2)], bits1 & bits2)
+            self.assertSequenceEqual([a or b for a, b in zip(list1, list2)], bits1 | bits2)
+            self.assertSequenceEqual([a != b for a, b in zip(list1, list2)], bits1 ^ bits2)
+            self.assertSequenceEqual([not a for a in list1], ~bits1)
+            self.assertEqual(list1.count(True), bits1.count())
+            self.assertEqual(list1.count(False), bits1.count(False))
+            self.assertEqual(size - list1.count(True), (~bits1).count())
+            bits1 ^= bits2
+            self.assertSequenceEqual([a != b for a, b in zip(list1, list2)], bits1)
+        with self.assertRaises(ValueError):
+            BitArray(3) & BitArray(4)
+
+    def test_find_first_set(self):
+        for size in range(0, 200, 7):
+            test_list = [random() < 0.05 for _ in range(size)]
+            test_bitarray = model(test_list)
+            for start in range(size + 1):
+                expected = test_list.index(True, start) if True in test_list[start:] else -1
+                self.assertEqual(expected, test_bitarray.find_first_set(start))
+        test_bitarray = BitArray(100000)
+        test_bitarray[99999] = True
+        self.assertEqual(99999, test_bitarray.find_first_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
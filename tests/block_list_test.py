@@ -0,0 +1,95 @@
+from library.block_list import BlockList
+from random import random, randint
+import unittest
+
+
+class BlockListTest(unittest.TestCase):
+    def test_empty_init(self):
+        test_blocklist = BlockList()
+        self.assertEqual(len(test_blocklist), 0)
+        self.assertSequenceEqual(test_blocklist, [])
+
+    def test_collection_init(self):
+        for size in range(0, 100, 7):
+            test_list = [random() for _ in range(size)]
+            test_blocklist = BlockList(test_list, chunk_capacity=8)
+            self.assertEqual(len(test_list), len(test_blocklist))
+            self.assertSequenceEqual(test_list, test_blocklist)
+        with self.assertRaises(ValueError):
+            BlockList(chunk_capacity=2)
+
+    def test_getitem(self):
+        for size in range(0, 60, 3):
+            test_list = [random() for _ in range(size)]
+            test_blocklist = BlockList(test_list, chunk_capacity=8)
+            with self.assertRaises(IndexError):
+                v = test_blocklist[size]
+            with self.assertRaises(IndexError):
+                v = test_blocklist[-size - 1]
+            for i in range(-size, size):
+                self.assertEqual(test_list[i], test_blocklist[i])
+            for step in [-2, -1, 1, 3]:
+                self.assertSequenceEqual(test_list[2:-2:step], test_blocklist[2:-2:step])
+
+    def test_setitem(self):
+        for size in range(0, 40, 3):
+            test_list = [random() for _ in range(size)]
+            test_blocklist = BlockList(test_list, chunk_capacity=8)
+            for i in range(-size, size):
+                v = random()
+                test_list[i] = v
+                test_blocklist[i] = v
+            self.assertSequenceEqual(test_list, test_blocklist)
+            test_list[1:5] = [1, 2]
+            test_blocklist[1:5] = [1, 2]
+            self.assertSequenceEqual(test_list, test_blocklist)
+
+    def test_model(self):
+        for chunk_capacity in [4, 5, 8, 64]:
+            for sample in range(5):
+                test_list = []
+                test_blocklist = BlockList(chunk_capacity=chunk_capacity)
+                for s in range(300):
+                    i = randint(-s, s)
+                    v = random()
+                    test_list.insert(i, v)
+                    test_blocklist.insert(i, v)
+                    self.assertLessEqual(max(test_blocklist.sizes), chunk_capacity)
+                self.assertSequenceEqual(test_list, test_blocklist)
+                while test_list:
+                    i = randint(-len(test_list), len(test_list) - 1)
+                    del test_list[i]
+                    del test_blocklist[i]
+                    self.assertEqual(len(test_list), len(test_blocklist))
+                    self.assertNotIn(0, test_blocklist.sizes)
+
+                    # the index kept up to date by the deletion is the index built from scratch
+                    tree = test_blocklist.tree
+                    test_blocklist.rebuild_index()
+                    self.assertEqual(test_blocklist.tree, tree)
+                self.assertSequenceEqual(test_list, test_blocklist)
+                self.assertEqual(test_blocklist.chunks, [])
+
+    def test_delitem_slice(self):
+        for size in range(0, 30, 4):
+            for step in [-2, -1, 1, 3]:
+                test_list = [random() for _ in range(size)]
+                test_blocklist = BlockList(test_list, chunk_capacity=4)
+                del test_list[1::step]
+                del test_blocklist[1::step]
+                self.assertSequenceEqual(test_list, test_blocklist)
+
+    def test_extend(self):
+        for base_size in range(0, 20, 3):
+            for suffix_size in range(0, 20, 3):
+                base_list = [random() for _ in range(base_size)]
+                suffix_list = [random() for _ in range(suffix_size)]
+                test_blocklist = BlockList(base_list, chunk_capacity=4)
+                test_blocklist.extend(suffix_list)
+                base_list.extend(suffix_list)
+                self.assertSequenceEqual(base_list, test_blocklist)
+                self.assertSequenceEqual(base_list, test_blocklist.copy())
+
+
+if __name__ == '__main__':
+    unittest.main()
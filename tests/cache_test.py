@@ -0,0 +1,163 @@
+from library.cache import Cache, memoize
+from collections import OrderedDict
+from random import randint
+import unittest
+
+
+class Timer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheTest(unittest.TestCase):
+    def test_lru_model(self):
+        for maxsize in [1, 2, 5]:
+            test_cache = Cache(maxsize, "lru")
+            test_dict = OrderedDict()
+            for step in range(500):
+                key = randint(0, 8)
+                if randint(0, 1):
+                    expected = test_dict.get(key)
+                    if key in test_dict:
+                        test_dict.move_to_end(key)
+                    self.assertEqual(expected, test_cache.get(key))
+                else:
+                    if key not in test_dict and len(test_dict) == maxsize:
+                        test_dict.popitem(last=False)
+                    test_dict[key] = step
+                    test_dict.move_to_end(key)
+                    test_cache.put(key, step)
+                self.assertEqual(len(test_dict), len(test_cache))
+                for k in range(9):
+                    self.assertEqual(k in test_dict, k in test_cache)
+            while test_dict:
+                self.assertEqual(test_dict.popitem(last=False), test_cache.evict())
+            with self.assertRaises(KeyError):
+                test_cache.evict()
+
+    def test_lfu_model(self):
+        for maxsize in [1, 3, 6]:
+            test_cache = Cache(maxsize, "lfu")
+            # key -> [frequency, last use, value]; the evicted key has the lowest (frequency, last use)
+            test_dict = {}
+            for step in range(1000):
+                key = randint(0, 10)
+                if randint(0, 1):
+                    if key in test_dict:
+                        test_dict[key][0] += 1
+                        test_dict[key][1] = step
+                        self.assertEqual(test_dict[key][2], test_cache.get(key))
+                    else:
+                        self.assertIsNone(test_cache.get(key))
+                else:
+                    if key in test_dict:
+                        test_dict[key] = [test_dict[key][0] + 1, step, step]
+                    else:
+                        if len(test_dict) == maxsize:
+                            del test_dict[min(test_dict, key=lambda k: test_dict[k][:2])]
+                        test_dict[key] = [1, step, step]
+                    test_cache.put(key, step)
+                self.assertEqual(len(test_dict), len(test_cache))
+                self.assertEqual(set(test_dict), {k for k in range(11) if k in test_cache})
+
+            # the frequency groups are in increasing order and hold the entries
+            frequencies = []
+            group = test_cache.order.head
+            while group is not None:
+                self.assertGreater(len(group.val.entries), 0)
+                frequencies.append(group.val.frequency)
+                group = group.nxt
+            self.assertEqual(sorted(set(frequencies)), frequencies)
+            self.assertEqual(sorted(set(v[0] for v in test_dict.values())), frequencies)
+
+    def test_ttl(self):
+        timer = Timer()
+        test_cache = Cache(3, "ttl", ttl=10, timer=timer)
+        for key in range(3):
+            test_cache.put(key, key)
+            timer.now += 1
+        test_cache.put(0, "refreshed")
+
+        # the entry which expires first is evicted
+        test_cache.put(3, 3)
+        self.assertNotIn(1, test_cache)
+        self.assertEqual("refreshed", test_cache.get(0))
+
+        # expired entries are misses, and expire() removes them in order of expiry
+        timer.now = 12.5
+        self.assertIsNone(test_cache.get(2))
+        self.assertEqual(1, test_cache.expirations)
+        self.assertEqual(2, len(test_cache))
+        timer.now = 13.5
+        self.assertEqual(2, test_cache.expire())
+        self.assertEqual(0, len(test_cache))
+        with self.assertRaises(ValueError):
+            Cache(3, "ttl")
+        with self.assertRaises(ValueError):
+            Cache(3, "fifo")
+
+    def test_ttl_with_lru(self):
+        timer = Timer()
+        test_cache = Cache(4, "lru", ttl=5, timer=timer)
+        test_cache.put("a", 1)
+        timer.now = 3
+        test_cache.put("b", 2)
+        self.assertEqual(1, test_cache.get("a"))
+        timer.now = 6
+        self.assertNotIn("a", test_cache)
+        self.assertEqual(2, test_cache.get("b"))
+        self.assertEqual(1, test_cache.expire())
+        self.assertEqual(["b"], [key for key in "ab" if key in test_cache])
+
+    def test_stats(self):
+        test_cache = Cache(2)
+        test_cache.put(1, "a")
+        test_cache.get(1)
+        test_cache.get(2)
+        test_cache.put(2, "b")
+        test_cache.put(3, "c")
+        stats = test_cache.stats()
+        self.assertEqual((1, 1, 1, 2), (stats["hits"], stats["misses"], stats["evictions"], stats["size"]))
+        self.assertEqual(0.5, stats["hit_rate"])
+        test_cache.delete(3)
+        with self.assertRaises(KeyError):
+            test_cache.delete(3)
+        test_cache.clear()
+        self.assertEqual(0, len(test_cache))
+        self.assertIsNone(test_cache.get(2))
+
+    def test_memoize(self):
+        calls = []
+
+        @memoize(maxsize=4, key=tuple)
+        def prefix_sums(sequence):
+            calls.append(sequence)
+            sums = [0]
+            for value in sequence:
+                sums.append(sums[-1] + value)
+            return sums
+
+        self.assertEqual([0, 1, 3], prefix_sums([1, 2]))
+        self.assertEqual([0, 1, 3], prefix_sums([1, 2]))
+        self.assertEqual(1, len(calls))
+        self.assertEqual(1, prefix_sums.cache.hits)
+        self.assertEqual("prefix_sums", prefix_sums.__name__)
+
+        @memoize(maxsize=8)
+        def score(a, b=None, penalty=1):
+            calls.append((a, b))
+            return 1 if a == b else -penalty
+
+        for _ in range(3):
+            self.assertEqual(1, score("A", "A"))
+            self.assertEqual(-2, score("A", b="C", penalty=2))
+            self.assertEqual(-1, score("A", b="C"))
+            self.assertEqual(None, memoize()(lambda: None)())
+        self.assertEqual(4, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+from library.circular_array_list import CircularArrayList
+from random import random, randint
+import unittest
+
+
+class CircularArrayListTest(unittest.TestCase):
+    def test_empty_init(self):
+        test_list = CircularArrayList()
+        self.assertEqual(len(test_list), 0)
+        self.assertSequenceEqual(test_list, [])
+
+    def test_collection_init(self):
+        for size in range(20):
+            test_list = [random() for _ in range(size)]
+            test_circular = CircularArrayList(test_list)
+            self.assertEqual(len(test_list), len(test_circular))
+            self.assertSequenceEqual(test_list, test_circular)
+
+    def test_getitem(self):
+        for size in range(10):
+            test_list = [random() for _ in range(size)]
+            test_circular = CircularArrayList()
+            for item in reversed(test_list):
+                test_circular.appendleft(item)
+            with self.assertRaises(IndexError):
+                v = test_circular[size]
+            with self.assertRaises(IndexError):
+                v = test_circular[-size - 1]
+            for i in range(-size, size):
+                self.assertEqual(test_list[i], test_circular[i])
+            for step in [-2, -1, 1, 2]:
+                self.assertSequenceEqual(test_list[1:-1:step], test_circular[1:-1:step])
+
+    def test_setitem(self):
+        for size in range(10):
+            test_list = [random() for _ in range(size)]
+            test_circular = CircularArrayList(test_list)
+            for i in range(-size, size):
+                v = random()
+                test_list[i] = v
+                test_circular[i] = v
+                self.assertSequenceEqual(test_list, test_circular)
+            test_list[1:3] = [1, 2, 3]
+            test_circular[1:3] = [1, 2, 3]
+            self.assertSequenceEqual(test_list, test_circular)
+
+    def test_model(self):
+        for size in range(50):
+            for sample in range(10):
+                test_list = []
+                test_circular = CircularArrayList()
+                for s in range(size):
+                    i = randint(-s, s)
+                    v = random()
+                    test_list.insert(i, v)
+                    test_circular.insert(i, v)
+                    self.assertSequenceEqual(test_list, test_circular)
+                while test_list:
+                    i = randint(-len(test_list), len(test_list) - 1)
+                    del test_list[i]
+                    del test_circular[i]
+                    self.assertSequenceEqual(test_list, test_circular)
+
+    def test_queue(self):
+        test_circular = CircularArrayList()
+        for i in range(100):
+            test_circular.append(i)
+            test_circular.append(i)
+            self.assertEqual(test_circular.popleft(), i // 2)
+        self.assertSequenceEqual([i // 2 for i in range(100, 200)], test_circular)
+        self.assertLessEqual(len(test_circular.array), 256)
+        with self.assertRaises(IndexError):
+            CircularArrayList().popleft()
+
+    def test_delitem_slice(self):
+        for size in range(8):
+            for step in [-2, -1, 1, 3]:
+                test_list = [random() for _ in range(size)]
+                test_circular = CircularArrayList(test_list)
+                del test_list[1::step]
+                del test_circular[1::step]
+                self.assertSequenceEqual(test_list, test_circular)
+
+
+if __name__ == '__main__':
+    unittest.main()
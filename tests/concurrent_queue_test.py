@@ -0,0 +1,220 @@
+from library.concurrent_queue import ConcurrentQueue, AsyncQueue
+from queue import Empty, Full
+from random import randint
+import asyncio
+import sys
+import threading
+import time
+import unittest
+
+
+class ConcurrentQueueTest(unittest.TestCase):
+    def test_order(self):
+        for lifo in [False, True]:
+            test_queue = ConcurrentQueue(lifo=lifo)
+            test_list = []
+            for step in range(200):
+                if randint(0, 2) < 2 or not test_list:
+                    test_queue.put(step)
+                    test_list.append(step)
+                else:
+                    self.assertEqual(test_list.pop(-1 if lifo else 0), test_queue.get())
+                self.assertEqual(len(test_list), test_queue.qsize())
+            self.assertEqual(test_list if not lifo else test_list[::-1], test_queue.get_many(1000))
+            self.assertTrue(test_queue.empty())
+
+    def test_nonblocking_and_timeout(self):
+        test_queue = ConcurrentQueue(maxsize=2)
+        with self.assertRaises(Empty):
+            test_queue.get(block=False)
+        start = time.monotonic()
+        with self.assertRaises(Empty):
+            test_queue.get(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        test_queue.put(1)
+        test_queue.put(2)
+        self.assertTrue(test_queue.full())
+        with self.assertRaises(Full):
+            test_queue.put(3, block=False)
+        with self.assertRaises(Full):
+            test_queue.put(3, timeout=0.01)
+
+        # a batch which does not fit keeps the values it has put
+        test_queue.get()
+        with self.assertRaises(Full):
+            test_queue.put_many([3, 4], timeout=0.01)
+        self.assertEqual([2, 3], test_queue.get_many(5))
+        with self.assertRaises(Empty):
+            test_queue.get_many(5, block=False)
+
+    def test_threads(self):
+        for lifo, maxsize in [(False, 0), (False, 8), (True, 8)]:
+            test_queue = ConcurrentQueue(maxsize=maxsize, lifo=lifo)
+            producers, consumers, count = 4, 4, 2000
+            results = [[] for _ in range(consumers)]
+            done = threading.Event()
+
+            def produce(producer):
+                values = [(producer, i) for i in range(count)]
+                for i in range(0, count, 100):
+                    if i % 200 == 0:
+                        test_queue.put_many(values[i:i + 100])
+                    else:
+                        for value in values[i:i + 100]:
+                            test_queue.put(value)
+
+            def consume(consumer):
+                while True:
+                    try:
+                        if consumer % 2:
+                            results[consumer].extend(test_queue.get_many(randint(1, 5), timeout=0.01))
+                        else:
+                            results[consumer].append(test_queue.get(timeout=0.01))
+                    except Empty:
+                        if done.is_set():
+                            return
+
+            threads = [threading.Thread(target=consume, args=(i,)) for i in range(consumers)]
+            threads += [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads[consumers:]:
+                thread.join(timeout=30)
+                self.assertFalse(thread.is_alive())
+            while not test_queue.empty():
+                time.sleep(0.001)
+            done.set()
+            for thread in threads[:consumers]:
+                thread.join(timeout=10)
+                self.assertFalse(thread.is_alive())
+
+            # every value is taken exactly once, and in FIFO mode each consumer sees each producer's values in order
+            taken = sorted(value for result in results for value in result)
+            self.assertEqual(sorted((p, i) for p in range(producers) for i in range(count)), taken)
+            if not lifo:
+                for result in results:
+                    for producer in range(producers):
+                        indices = [i for p, i in result if p == producer]
+                        self.assertEqual(sorted(indices), indices)
+            self.assertEqual(0, test_queue.qsize())
+
+    def test_small_bounded_queue(self):
+        # producers which mix put and put_many must pass on the wake-ups they consume, or the others stay blocked
+        for maxsize in [1, 2]:
+            for sample in range(5):
+                test_queue = ConcurrentQueue(maxsize=maxsize)
+                producers, count = 3, 600
+                taken = []
+
+                def produce(producer):
+                    values = [(producer, i) for i in range(count)]
+                    i = 0
+                    while i < count:
+                        batch = randint(1, 4)
+                        if randint(0, 1):
+                            test_queue.put_many(values[i:i + batch])
+                        else:
+                            for value in values[i:i + batch]:
+                                test_queue.put(value)
+                        i += batch
+
+                def consume():
+                    for _ in range(producers * count // 3):
+                        taken.append(test_queue.get())
+
+                threads = [threading.Thread(target=produce, args=(p,), daemon=True) for p in range(producers)]
+                threads += [threading.Thread(target=consume, daemon=True) for _ in range(3)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join(timeout=10)
+                    self.assertFalse(thread.is_alive(), f"deadlock with maxsize {maxsize}: {test_queue}")
+                self.assertEqual(sorted((p, i) for p in range(producers) for i in range(count)), sorted(taken))
+                self.assertEqual(0, test_queue.qsize())
+
+    def test_put_many_passes_on_wake_up(self):
+        test_queue = ConcurrentQueue(maxsize=2)
+        test_queue.put_many([1, 2])
+
+        # a batch producer and then a single producer wait on the full queue (polled through the condition's waiters)
+        batch = threading.Thread(target=test_queue.put_many, args=(["a"],), daemon=True)
+        batch.start()
+        while len(test_queue.not_full._waiters) < 1:
+            time.sleep(0.001)
+        single = threading.Thread(target=test_queue.put, args=("b",), daemon=True)
+        single.start()
+        while len(test_queue.not_full._waiters) < 2:
+            time.sleep(0.001)
+
+        # two gets without a thread switch wake only the batch producer, which must wake the single producer in turn
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(5)
+        try:
+            test_queue.get()
+            test_queue.get()
+        finally:
+            sys.setswitchinterval(interval)
+        for thread in [batch, single]:
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(["a", "b"], test_queue.get_many(2))
+
+
+class AsyncQueueTest(unittest.TestCase):
+    def test_order(self):
+        for lifo in [False, True]:
+            test_queue = AsyncQueue(lifo=lifo)
+            for i in range(10):
+                test_queue.put_nowait(i)
+            expected = list(range(10)) if not lifo else list(range(9, -1, -1))
+            self.assertEqual(expected, [test_queue.get_nowait() for _ in range(10)])
+            with self.assertRaises(asyncio.QueueEmpty):
+                test_queue.get_nowait()
+        test_queue = AsyncQueue(maxsize=1)
+        test_queue.put_nowait(1)
+        with self.assertRaises(asyncio.QueueFull):
+            test_queue.put_nowait(2)
+
+    def test_producers_consumers(self):
+        async def run():
+            test_queue = AsyncQueue(maxsize=4)
+            results = []
+
+            async def produce(producer):
+                await test_queue.put_many((producer, i) for i in range(50))
+                for i in range(50, 100):
+                    await test_queue.put((producer, i))
+
+            async def consume():
+                while True:
+                    results.extend(await test_queue.get_many(3))
+
+            # the consumers are left waiting on the empty queue and cancelled
+            consumers = [asyncio.create_task(consume()) for _ in range(3)]
+            await asyncio.wait_for(asyncio.gather(*(produce(p) for p in range(3))), timeout=10)
+            while not test_queue.empty():
+                await asyncio.sleep(0)
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(sorted((p, i) for p in range(3) for i in range(100)), sorted(results))
+
+    def test_cancelled_get(self):
+        async def run():
+            test_queue = AsyncQueue()
+            getter = asyncio.create_task(test_queue.get())
+            await asyncio.sleep(0)
+            getter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await getter
+            test_queue.put_nowait(1)
+            return await asyncio.wait_for(test_queue.get(), timeout=1)
+
+        self.assertEqual(1, asyncio.run(run()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+from collections import deque
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from random import random, randint
+import unittest
+
+# the module lives in the "Linked Lists" directory, which is not a package
+spec = spec_from_file_location("CyclicalLinkedList", Path(__file__).parents[1] / "Linked Lists" / "CyclicalLinkedList.py")
+cyclical_linked_list = module_from_spec(spec)
+spec.loader.exec_module(cyclical_linked_list)
+CyclicalLinkedList = cyclical_linked_list.CyclicalLinkedList
+
+
+def values(test_cll):
+    return [test_cll.get(i) for i in range(len(test_cll))]
+
+
+class CyclicalLinkedListTest(unittest.TestCase):
+    def test_ring_model(self):
+        for capacity in [None, 1, 2, 5]:
+            for sample in range(100):
+                test_cll = CyclicalLinkedList(capacity)
+                test_deque = deque(maxlen=capacity)
+                for step in range(40):
+                    operation = randint(0, 6)
+                    if operation < 3:
+                        test_cll.append(step)
+                        test_deque.append(step)
+                    elif operation == 3:
+                        test_cll.prepend(step)
+                        test_deque.appendleft(step)
+                    elif operation == 4 and test_deque:
+                        self.assertEqual(test_deque.pop(), test_cll.pop())
+                    elif operation == 5 and test_deque:
+                        self.assertEqual(test_deque.popleft(), test_cll.popleft())
+                    else:
+                        steps = randint(-6, 6)
+                        test_cll.rotate(steps)
+                        test_deque.rotate(steps)
+                    self.assertEqual(len(test_deque), len(test_cll))
+                    self.assertEqual(list(test_deque), values(test_cll))
+
+    def test_aggregate_model(self):
+        for capacity in [None, 1, 2, 5]:
+            for sample in range(100):
+                test_cll = CyclicalLinkedList(capacity, aggregates=True)
+                test_deque = deque(maxlen=capacity)
+                for step in range(40):
+                    value = randint(0, 9)
+                    operation = randint(0, 5)
+                    if operation < 3:
+                        test_cll.append(value)
+                        test_deque.append(value)
+                    elif operation == 3:
+                        test_cll.prepend(value)
+                        test_deque.appendleft(value)
+                    elif operation == 4 and test_deque:
+                        self.assertEqual(test_deque.pop(), test_cll.pop())
+                    elif test_deque:
+                        self.assertEqual(test_deque.popleft(), test_cll.popleft())
+
+                    # the aggregates are only read now and then, so that updates also happen while they are stale
+                    if random() < 0.3:
+                        self.assertEqual(sum(test_deque), test_cll.window_sum())
+                        if test_deque:
+                            self.assertEqual(min(test_deque), test_cll.window_min())
+                            self.assertEqual(max(test_deque), test_cll.window_max())
+                            self.assertAlmostEqual(sum(test_deque) / len(test_deque), test_cll.window_mean())
+                        else:
+                            with self.assertRaises(RuntimeError):
+                                test_cll.window_min()
+                self.assertEqual(list(test_deque), values(test_cll))
+
+    def test_stale_aggregates(self):
+        test_cll = CyclicalLinkedList(aggregates=True)
+        test_cll.prepend(5)
+        self.assertEqual(5, test_cll.popleft())
+        self.assertEqual(0, test_cll.window_sum())
+
+        test_cll = CyclicalLinkedList(capacity=2, aggregates=True)
+        test_cll.prepend(1)
+        test_cll.prepend(2)
+        test_cll.append(3)
+        self.assertEqual([1, 3], values(test_cll))
+        self.assertEqual((4, 1, 3), (test_cll.window_sum(), test_cll.window_min(), test_cll.window_max()))
+
+    def test_sliding_window(self):
+        test_cll = CyclicalLinkedList(capacity=3, aggregates=True)
+        stream = [randint(-50, 50) for _ in range(200)]
+        for i, value in enumerate(stream):
+            test_cll.append(value)
+            window = stream[max(0, i - 2):i + 1]
+            self.assertEqual(window, values(test_cll))
+            self.assertEqual((sum(window), min(window), max(window)),
+                             (test_cll.window_sum(), test_cll.window_min(), test_cll.window_max()))
+
+        # the aggregates are kept incrementally while the list is only appended to
+        self.assertTrue(test_cll.aggregates_valid)
+        with self.assertRaises(RuntimeError):
+            CyclicalLinkedList().window_sum()
+
+
+if __name__ == '__main__':
+    unittest.main()
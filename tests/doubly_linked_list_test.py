@@ -3,6 +3,13 @@ from random import random, randint, randrange
 import unittest
 
 
+def iterate_nodes(linked_list):
+    node = linked_list.head
+    while node is not None:
+        yield node
+        node = node.nxt
+
+
 class DoublyLinkedListTest(unittest.TestCase):
     def test_empty_init(self):
         test_dll = DoublyLinkedList([])
@@ -166,6 +173,204 @@ class DoublyLinkedListTest(unittest.TestCase):
                     base_list.extend(suffix_list)
                     self.assertSequenceEqual(test_dll, base_list)
 
+    def test_finger(self):
+        for sample in range(200):
+            test_list = [random() for _ in range(randint(0, 10))]
+            test_dll = DoublyLinkedList(test_list)
+            for step in range(30):
+                operation = randint(0, 4)
+                if operation == 0:
+                    i = randint(-len(test_list), len(test_list))
+                    test_list.insert(i, step)
+                    test_dll.insert(i, step)
+                elif operation == 1 and test_list:
+                    i = randrange(-len(test_list), len(test_list))
+                    del test_list[i]
+                    del test_dll[i]
+                elif operation == 2 and test_list:
+                    i = randrange(-len(test_list), len(test_list))
+                    self.assertEqual(test_list.pop(i), test_dll.pop(i))
+                elif operation == 3 and test_list:
+                    i = randrange(len(test_list))
+                    self.assertEqual(test_list[i], test_dll[i])
+                    test_list[i] = step
+                    test_dll[i] = step
+                else:
+                    test_list.reverse()
+                    test_dll.reverse()
+
+                # the finger stays consistent with the list
+                self.assertSequenceEqual(test_list, test_dll)
+                if test_dll.finger is not None:
+                    finger_index, finger_node = test_dll.finger
+                    self.assertEqual(test_list[finger_index], finger_node.val)
+
+        # local access walks from the finger
+        test_dll = DoublyLinkedList(range(100))
+        for i in [50, 51, 49, 52, 48]:
+            self.assertEqual(i, test_dll[i])
+            self.assertEqual(i, test_dll.finger[0])
+
+    def test_sequence_methods(self):
+        for size in range(12):
+            for sample in range(10):
+                test_list = [randint(0, 4) for _ in range(size)]
+                test_dll = DoublyLinkedList(test_list)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_dll)))
+                for value in range(6):
+                    self.assertEqual(value in test_list, value in test_dll)
+                    self.assertEqual(test_list.count(value), test_dll.count(value))
+                    for start, stop in [(0, None), (2, None), (-3, None), (1, -1), (5, 3)]:
+                        try:
+                            expected = test_list.index(value, start, size if stop is None else stop)
+                        except ValueError:
+                            with self.assertRaises(ValueError):
+                                test_dll.index(value, start, stop)
+                        else:
+                            self.assertEqual(expected, test_dll.index(value, start, stop))
+
+                # pop and remove values until the list is empty
+                while test_list:
+                    if random() < 0.5:
+                        i = randrange(-len(test_list), len(test_list)) if random() < 0.5 else -1
+                        self.assertEqual(test_list.pop(i), test_dll.pop(i))
+                    else:
+                        value = randint(0, 5)
+                        if value in test_list:
+                            test_list.remove(value)
+                            test_dll.remove(value)
+                        else:
+                            with self.assertRaises(ValueError):
+                                test_dll.remove(value)
+                    self.assertSequenceEqual(test_list, test_dll)
+                with self.assertRaises(IndexError):
+                    test_dll.pop()
+
+    def test_sort(self):
+        for size in range(0, 70, 3):
+            for key, reverse in [(None, False), (None, True), (lambda v: v[0], False), (lambda v: v[0], True)]:
+                # pairs of (key, position) check that the sort is stable
+                test_list = [(randint(0, 5), i) for i in range(size)]
+                test_dll = DoublyLinkedList(test_list)
+                nodes = {id(node) for node in iterate_nodes(test_dll)}
+                test_list.sort(key=key, reverse=reverse)
+                test_dll.sort(key=key, reverse=reverse)
+                self.assertSequenceEqual(test_list, test_dll)
+                self.assertEqual(nodes, {id(node) for node in iterate_nodes(test_dll)})
+                self.assertIs(test_dll.tail, None if size == 0 else list(iterate_nodes(test_dll))[-1])
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_dll)))
+                test_dll.append((6, size))
+                self.assertEqual((6, size), test_dll[-1])
+
+    def test_splice(self):
+        for size, other_size in [(0, 0), (0, 5), (5, 0), (6, 4)]:
+            for at in range(-size, size + 1):
+                test_list, other_list = list(range(size)), list(range(100, 100 + other_size))
+                test_dll, other_dll = DoublyLinkedList(test_list), DoublyLinkedList(other_list)
+                test_list[at:at] = other_list
+                test_dll.splice(other_dll, at)
+                self.assertSequenceEqual(test_list, test_dll)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_dll)))
+                self.assertEqual(0, len(other_dll))
+                self.assertSequenceEqual([], other_dll)
+                other_dll.append(1)
+                self.assertSequenceEqual([1], other_dll)
+        test_dll = DoublyLinkedList([1, 2])
+        test_dll.concat(DoublyLinkedList([3, 4]))
+        self.assertSequenceEqual([1, 2, 3, 4], test_dll)
+        with self.assertRaises(IndexError):
+            test_dll.splice(DoublyLinkedList([5]), 5)
+        with self.assertRaises(ValueError):
+            test_dll.splice(test_dll)
+        with self.assertRaises(TypeError):
+            test_dll.splice([5])
+
+    def test_split_at(self):
+        for size in range(8):
+            for index in range(-size, size + 1):
+                test_list = list(range(size))
+                test_dll = DoublyLinkedList(test_list)
+                new_dll = test_dll.split_at(index)
+                self.assertSequenceEqual(test_list[:index], test_dll)
+                self.assertSequenceEqual(test_list[index:], new_dll)
+                self.assertSequenceEqual(test_list[:index][::-1], list(reversed(test_dll)))
+                self.assertSequenceEqual(test_list[index:][::-1], list(reversed(new_dll)))
+                test_dll.concat(new_dll)
+                self.assertSequenceEqual(test_list, test_dll)
+        with self.assertRaises(IndexError):
+            DoublyLinkedList([1]).split_at(2)
+
+    def test_move_range(self):
+        for sample in range(200):
+            test_list = [random() for _ in range(randint(0, 10))]
+            other_list = [random() for _ in range(randint(0, 10))]
+            test_dll, other_dll = DoublyLinkedList(test_list), DoublyLinkedList(other_list)
+            start, stop = randint(-12, 12), randint(-12, 12)
+            moved = test_list[start:stop]
+            del test_list[start:stop]
+            if random() < 0.5:
+                at = randint(-len(test_list), len(test_list))
+                test_list[at:at] = moved
+                test_dll.move_range(start, stop, at=at)
+            else:
+                at = randint(-len(other_list), len(other_list))
+                other_list[at:at] = moved
+                test_dll.move_range(start, stop, other_dll, at)
+            for expected, actual in [(test_list, test_dll), (other_list, other_dll)]:
+                self.assertSequenceEqual(expected, actual)
+                self.assertSequenceEqual(expected[::-1], list(reversed(actual)))
+                for i in range(-len(expected), len(expected)):
+                    self.assertEqual(expected[i], actual[i])
+
+    def test_cursor(self):
+        for sample in range(100):
+            test_list = [random() for _ in range(randint(0, 8))]
+            position = randint(0, len(test_list))
+            test_dll = DoublyLinkedList(test_list)
+            cursor = test_dll.cursor(position)
+            for step in range(30):
+                operation = randint(0, 5)
+                if operation == 0 and position < len(test_list):
+                    cursor.next()
+                    position += 1
+                elif operation == 1 and position > 0:
+                    cursor.prev()
+                    position -= 1
+                elif operation == 2:
+                    test_list.insert(position, step)
+                    cursor.insert_before(step)
+                    position += 1
+                elif operation == 3 and position < len(test_list):
+                    test_list.insert(position + 1, step)
+                    cursor.insert_after(step)
+                elif operation == 4 and position < len(test_list):
+                    self.assertEqual(test_list.pop(position), cursor.remove())
+                elif position < len(test_list):
+                    self.assertEqual(test_list[position], cursor.value)
+                    test_list[position] = -step
+                    cursor.value = -step
+                self.assertEqual(position == len(test_list), cursor.at_end)
+                self.assertSequenceEqual(test_list, test_dll)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_dll)))
+
+        # filter a list in a single pass
+        test_dll = DoublyLinkedList(range(20))
+        cursor = test_dll.cursor()
+        while not cursor.at_end:
+            if cursor.value % 3 == 0:
+                cursor.remove()
+            else:
+                cursor.next()
+        self.assertSequenceEqual([v for v in range(20) if v % 3 != 0], test_dll)
+        with self.assertRaises(IndexError):
+            v = cursor.value
+        with self.assertRaises(IndexError):
+            cursor.next()
+        with self.assertRaises(IndexError):
+            test_dll.cursor(0).prev()
+        with self.assertRaises(IndexError):
+            test_dll.cursor(len(test_dll) + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
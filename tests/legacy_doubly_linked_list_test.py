@@ -0,0 +1,97 @@
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from random import randint
+import unittest
+
+# the module lives in the "Linked Lists" directory, which is not a package
+spec = spec_from_file_location("DoublyLinkedList", Path(__file__).parents[1] / "Linked Lists" / "DoublyLinkedList.py")
+doubly_linked_list = module_from_spec(spec)
+spec.loader.exec_module(doubly_linked_list)
+DoublyLinkedList = doubly_linked_list.DoublyLinkedList
+
+
+def forward_values(test_dll):
+    values, curr_node = [], test_dll.head
+    while curr_node is not None:
+        values.append(curr_node.value)
+        curr_node = curr_node.next_node
+    return values
+
+
+def backward_values(test_dll):
+    values, curr_node = [], test_dll.tail
+    while curr_node is not None:
+        values.append(curr_node.value)
+        curr_node = curr_node.prev_node
+    return values[::-1]
+
+
+class LegacyDoublyLinkedListTest(unittest.TestCase):
+    def test_model(self):
+        for sample in range(100):
+            test_dll = DoublyLinkedList()
+            test_list = []
+            for step in range(60):
+                operation = randint(0, 4)
+                size = len(test_list)
+                if operation < 2:
+                    # insertions near either end and in the middle, with negative indices counting from the end
+                    index = randint(-(size + 1), size)
+                    test_dll.insert(index, step)
+                    test_list.insert(index + size + 1 if index < 0 else index, step)
+                elif operation == 2 and test_list:
+                    index = randint(-size, size - 1)
+                    self.assertEqual(test_list[index], test_dll.get(index))
+                elif operation == 3 and test_list:
+                    index = randint(-size, size - 1)
+                    test_dll.remove(index)
+                    del test_list[index]
+                else:
+                    test_dll.append(step)
+                    test_list.append(step)
+                self.assertEqual(len(test_list), test_dll.size)
+                self.assertEqual(test_list, forward_values(test_dll))
+                self.assertEqual(test_list, backward_values(test_dll))
+            self.assertEqual(test_list, [test_dll.get(i) for i in range(test_dll.size)])
+            self.assertEqual(test_list[::-1], [test_dll.get(i) for i in range(-1, -test_dll.size - 1, -1)])
+
+    def test_insert_negative_index(self):
+        test_dll = DoublyLinkedList()
+        for value in range(3):
+            test_dll.insert(-1, value)
+        self.assertEqual([0, 1, 2], forward_values(test_dll))
+        test_dll.insert(-2, "before last")
+        test_dll.insert(-5, "first")
+        self.assertEqual(["first", 0, 1, "before last", 2], forward_values(test_dll))
+        self.assertEqual(2, test_dll.tail.value)
+        self.assertEqual(5, test_dll.size)
+        with self.assertRaises(IndexError):
+            test_dll.insert(6, None)
+        with self.assertRaises(IndexError):
+            test_dll.insert(-7, None)
+
+    def test_remove_only_node(self):
+        test_dll = DoublyLinkedList()
+        test_dll.append(1)
+        test_dll.remove(0)
+        self.assertEqual(0, test_dll.size)
+        self.assertIsNone(test_dll.head)
+        self.assertIsNone(test_dll.tail)
+        with self.assertRaises(RuntimeError):
+            test_dll.remove(0)
+        with self.assertRaises(RuntimeError):
+            test_dll.get(0)
+
+        # the emptied list can be filled again
+        test_dll.prepend(2)
+        test_dll.insert(-1, 3)
+        self.assertEqual([2, 3], forward_values(test_dll))
+        self.assertEqual([2, 3], backward_values(test_dll))
+        with self.assertRaises(IndexError):
+            test_dll.get(2)
+        with self.assertRaises(IndexError):
+            test_dll.remove(-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+from library.node_pool import NodePool
+from library.singly_linked_list import SinglyLinkedList, SinglyLinkedListNode
+from library.doubly_linked_list import DoublyLinkedList, DoublyLinkedListNode
+from random import random, randint, randrange
+import unittest
+
+
+class NodePoolTest(unittest.TestCase):
+    def test_acquire_release(self):
+        pool = NodePool(DoublyLinkedListNode, capacity=2)
+        nodes = [pool.acquire(i, None, None) for i in range(3)]
+        self.assertEqual(pool.allocated, 3)
+        self.assertEqual(len(pool), 0)
+
+        # released nodes are cleared, and the pool keeps at most its capacity
+        for node in nodes:
+            node.nxt = node
+            pool.release(node)
+        self.assertEqual(len(pool), 2)
+        self.assertIsNone(nodes[0].val)
+        self.assertIsNone(nodes[0].nxt)
+
+        # acquired nodes are reused before new nodes are allocated
+        node = pool.acquire("a", None, nodes[2])
+        self.assertIn(node, nodes[:2])
+        self.assertEqual(node.val, "a")
+        self.assertIs(node.nxt, nodes[2])
+        self.assertEqual(pool.reused, 1)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            SinglyLinkedListNode(1, None).extra = 1
+        with self.assertRaises(AttributeError):
+            DoublyLinkedListNode(1, None, None).extra = 1
+
+    def test_shared_pool(self):
+        for list_class, node_class in [(SinglyLinkedList, SinglyLinkedListNode),
+                                       (DoublyLinkedList, DoublyLinkedListNode)]:
+            pool = NodePool(node_class, capacity=8)
+            test_lists = [[], []]
+            pooled_lists = [list_class(pool=pool), list_class(pool=pool)]
+            for step in range(500):
+                k = randint(0, 1)
+                operation = randint(0, 3)
+                if operation < 2:
+                    i = randint(0, len(test_lists[k]))
+                    v = random()
+                    test_lists[k].insert(i, v)
+                    pooled_lists[k].insert(i, v)
+                elif operation == 2 and test_lists[k]:
+                    i = randrange(len(test_lists[k]))
+                    self.assertEqual(test_lists[k].pop(i), pooled_lists[k].pop(i))
+                elif test_lists[k]:
+                    v = test_lists[k][randrange(len(test_lists[k]))]
+                    test_lists[k].remove(v)
+                    pooled_lists[k].remove(v)
+                for test_list, pooled_list in zip(test_lists, pooled_lists):
+                    self.assertSequenceEqual(test_list, pooled_list)
+                self.assertLessEqual(len(pool), 8)
+            self.assertGreater(pool.reused, 0)
+
+            # clearing a list gives its nodes back to the pool
+            pool.clear()
+            pooled_lists[0].clear()
+            self.assertEqual(len(pool), min(8, len(test_lists[0])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,13 @@ from random import random, randint, randrange
 import unittest
 
 
+def iterate_nodes(linked_list):
+    node = linked_list.head
+    while node is not None:
+        yield node
+        node = node.nxt
+
+
 class SinglyLinkedListTests(unittest.TestCase):
     def test_empty_init(self):
         test_sll = SinglyLinkedList([])
@@ -166,6 +173,98 @@ class SinglyLinkedListTests(unittest.TestCase):
                     base_list.extend(suffix_list)
                     self.assertSequenceEqual(test_sll, base_list)
 
+    def test_finger(self):
+        for sample in range(200):
+            test_list = [random() for _ in range(randint(0, 10))]
+            test_sll = SinglyLinkedList(test_list)
+            for step in range(30):
+                operation = randint(0, 5)
+                i = randint(-len(test_list), len(test_list))
+                if operation == 0:
+                    test_list.insert(i, step)
+                    test_sll.insert(i, step)
+                elif operation == 1:
+                    test_list.append(step)
+                    test_sll.append(step)
+                elif operation == 2 and test_list:
+                    i = randrange(-len(test_list), len(test_list))
+                    del test_list[i]
+                    del test_sll[i]
+                elif operation == 3 and test_list:
+                    i = randrange(len(test_list))
+                    self.assertEqual(test_list[i], test_sll[i])
+                    test_list[i] = step
+                    test_sll[i] = step
+                elif operation == 4:
+                    test_list.reverse()
+                    test_sll.reverse()
+                else:
+                    test_list.extend([step, -step])
+                    test_sll.extend([step, -step])
+
+                # the tail and the finger stay consistent with the list
+                self.assertSequenceEqual(test_list, test_sll)
+                self.assertEqual(test_list[-1] if test_list else None, test_sll.tail.val if test_sll.tail else None)
+                if test_sll.finger is not None:
+                    finger_index, finger_node = test_sll.finger
+                    self.assertEqual(test_list[finger_index], finger_node.val)
+
+        # sequential indexed access moves the finger forward one node at a time
+        test_sll = SinglyLinkedList(range(100))
+        for i in range(len(test_sll)):
+            self.assertEqual(i, test_sll[i])
+            self.assertEqual(i, test_sll.finger[0])
+
+    def test_sequence_methods(self):
+        for size in range(12):
+            for sample in range(10):
+                test_list = [randint(0, 4) for _ in range(size)]
+                test_sll = SinglyLinkedList(test_list)
+                self.assertSequenceEqual(test_list[::-1], list(reversed(test_sll)))
+                for value in range(6):
+                    self.assertEqual(value in test_list, value in test_sll)
+                    self.assertEqual(test_list.count(value), test_sll.count(value))
+                    for start, stop in [(0, None), (2, None), (-3, None), (1, -1), (5, 3)]:
+                        try:
+                            expected = test_list.index(value, start, size if stop is None else stop)
+                        except ValueError:
+                            with self.assertRaises(ValueError):
+                                test_sll.index(value, start, stop)
+                        else:
+                            self.assertEqual(expected, test_sll.index(value, start, stop))
+
+                # pop and remove values until the list is empty
+                while test_list:
+                    if random() < 0.5:
+                        i = randrange(-len(test_list), len(test_list)) if random() < 0.5 else -1
+                        self.assertEqual(test_list.pop(i), test_sll.pop(i))
+                    else:
+                        value = randint(0, 5)
+                        if value in test_list:
+                            test_list.remove(value)
+                            test_sll.remove(value)
+                        else:
+                            with self.assertRaises(ValueError):
+                                test_sll.remove(value)
+                    self.assertSequenceEqual(test_list, test_sll)
+                with self.assertRaises(IndexError):
+                    test_sll.pop()
+
+    def test_sort(self):
+        for size in range(0, 70, 3):
+            for key, reverse in [(None, False), (None, True), (lambda v: v[0], False), (lambda v: v[0], True)]:
+                # pairs of (key, position) check that the sort is stable
+                test_list = [(randint(0, 5), i) for i in range(size)]
+                test_sll = SinglyLinkedList(test_list)
+                nodes = {id(node) for node in iterate_nodes(test_sll)}
+                test_list.sort(key=key, reverse=reverse)
+                test_sll.sort(key=key, reverse=reverse)
+                self.assertSequenceEqual(test_list, test_sll)
+                self.assertEqual(nodes, {id(node) for node in iterate_nodes(test_sll)})
+                self.assertIs(test_sll.tail, None if size == 0 else list(iterate_nodes(test_sll))[-1])
+                test_sll.append((6, size))
+                self.assertEqual((6, size), test_sll[-1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,155 @@
+from library.skip_list import SkipList
+from bisect import bisect_left, insort
+from random import random, randint, randrange
+import unittest
+
+
+def check_spans(test_case, test_skiplist):
+    # on every level, the spans add up to the positions of the nodes, and the last pointer spans to the end
+    positions = {id(test_skiplist.head): -1}
+    node, position = test_skiplist.head.nxt[0], 0
+    while node is not None:
+        positions[id(node)] = position
+        node, position = node.nxt[0], position + 1
+    for level in range(test_skiplist.levels):
+        node = test_skiplist.head
+        while node is not None:
+            nxt = node.nxt[level]
+            end = test_skiplist.size if nxt is None else positions[id(nxt)]
+            test_case.assertEqual(end - positions[id(node)], node.span[level])
+            node = nxt
+
+
+class SkipListTest(unittest.TestCase):
+    def test_empty_init(self):
+        test_skiplist = SkipList()
+        self.assertEqual(len(test_skiplist), 0)
+        self.assertSequenceEqual(test_skiplist, [])
+
+    def test_collection_init(self):
+        for size in range(0, 100, 7):
+            test_list = [random() for _ in range(size)]
+            test_skiplist = SkipList(test_list)
+            self.assertEqual(len(test_list), len(test_skiplist))
+            self.assertSequenceEqual(test_list, test_skiplist)
+            check_spans(self, test_skiplist)
+            test_skiplist = SkipList(test_list, ordered=True)
+            self.assertSequenceEqual(sorted(test_list), test_skiplist)
+            check_spans(self, test_skiplist)
+
+    def test_getitem(self):
+        for size in range(0, 60, 3):
+            test_list = [random() for _ in range(size)]
+            test_skiplist = SkipList(test_list)
+            with self.assertRaises(IndexError):
+                v = test_skiplist[size]
+            with self.assertRaises(IndexError):
+                v = test_skiplist[-size - 1]
+            for i in range(-size, size):
+                self.assertEqual(test_list[i], test_skiplist[i])
+            for step in [-2, -1, 1, 3]:
+                self.assertSequenceEqual(test_list[2:-2:step], test_skiplist[2:-2:step])
+
+    def test_positional_model(self):
+        for sample in range(10):
+            test_list = []
+            test_skiplist = SkipList()
+            for s in range(300):
+                operation = randint(0, 3)
+                if operation < 2 or not test_list:
+                    i = randint(-len(test_list), len(test_list))
+                    v = random()
+                    test_list.insert(i, v)
+                    test_skiplist.insert(i, v)
+                elif operation == 2:
+                    i = randrange(-len(test_list), len(test_list))
+                    del test_list[i]
+                    del test_skiplist[i]
+                else:
+                    i = randrange(-len(test_list), len(test_list))
+                    v = random()
+                    test_list[i] = v
+                    test_skiplist[i] = v
+            self.assertSequenceEqual(test_list, test_skiplist)
+            check_spans(self, test_skiplist)
+            while test_list:
+                i = randrange(len(test_list))
+                self.assertEqual(test_list.pop(i), test_skiplist.pop(i))
+            check_spans(self, test_skiplist)
+            self.assertEqual(test_skiplist.levels, 1)
+
+    def test_ordered_model(self):
+        for sample in range(10):
+            test_list = []
+            test_skiplist = SkipList(ordered=True)
+            for s in range(400):
+                v = randint(0, 100)
+                if random() < 0.6:
+                    if v not in test_list:
+                        insort(test_list, v)
+                    test_skiplist.add(v)
+                else:
+                    if v in test_list:
+                        test_list.remove(v)
+                    test_skiplist.discard(v)
+                self.assertEqual(len(test_list), len(test_skiplist))
+            self.assertSequenceEqual(test_list, test_skiplist)
+            check_spans(self, test_skiplist)
+            for v in range(-1, 102):
+                self.assertEqual(v in test_list, v in test_skiplist)
+                self.assertEqual(bisect_left(test_list, v), test_skiplist.bisect_left(v))
+                self.assertEqual(test_list.count(v), test_skiplist.count(v))
+                if v in test_list:
+                    self.assertEqual(test_list.index(v), test_skiplist.index(v))
+                else:
+                    with self.assertRaises(ValueError):
+                        test_skiplist.index(v)
+            for i in range(len(test_list)):
+                self.assertEqual(test_list[i], test_skiplist[i])
+
+            # test range iteration
+            for minimum, maximum in [(None, None), (10, 50), (None, 30), (70, None), (50, 10)]:
+                expected = [v for v in test_list
+                            if (minimum is None or v >= minimum) and (maximum is None or v <= maximum)]
+                self.assertSequenceEqual(expected, list(test_skiplist.irange(minimum, maximum)))
+
+    def test_mode_errors(self):
+        test_skiplist = SkipList([3, 1, 2], ordered=True)
+        with self.assertRaises(TypeError):
+            test_skiplist.insert(0, 5)
+        with self.assertRaises(TypeError):
+            test_skiplist[0] = 5
+        del test_skiplist[0]
+        self.assertSequenceEqual([2, 3], test_skiplist)
+        test_skiplist = SkipList([3, 1, 2])
+        with self.assertRaises(TypeError):
+            test_skiplist.add(5)
+        with self.assertRaises(TypeError):
+            list(test_skiplist.irange(1, 2))
+
+    def test_index(self):
+        test_list = [randint(0, 9) for _ in range(50)]
+        test_skiplist = SkipList(test_list)
+        for value in range(11):
+            for start, stop in [(0, 50), (10, 40), (-20, -5)]:
+                if value in test_list[start:stop]:
+                    self.assertEqual(test_list.index(value, start, stop), test_skiplist.index(value, start, stop))
+                else:
+                    with self.assertRaises(ValueError):
+                        test_skiplist.index(value, start, stop)
+            self.assertEqual(value in test_list, value in test_skiplist)
+
+    def test_clear_copy(self):
+        test_list = [random() for _ in range(30)]
+        test_skiplist = SkipList(test_list)
+        test_copy = test_skiplist.copy()
+        test_skiplist.clear()
+        self.assertSequenceEqual([], test_skiplist)
+        self.assertSequenceEqual(test_list, test_copy)
+        test_skiplist.extend(test_list)
+        self.assertSequenceEqual(test_list, test_skiplist)
+        check_spans(self, test_skiplist)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+from library.unrolled_linked_list import UnrolledLinkedList
+from random import random, randint
+import unittest
+
+
+def node_sizes(test_ull):
+    sizes = []
+    node = test_ull.head
+    while node is not None:
+        sizes.append(node.size)
+        if node.nxt is not None:
+            assert node.nxt.prv is node
+        node = node.nxt
+    return sizes
+
+
+class UnrolledLinkedListTest(unittest.TestCase):
+    def test_empty_init(self):
+        test_ull = UnrolledLinkedList()
+        self.assertEqual(len(test_ull), 0)
+        self.assertSequenceEqual(test_ull, [])
+
+    def test_collection_init(self):
+        for size in range(0, 100, 7):
+            test_list = [random() for _ in range(size)]
+            test_ull = UnrolledLinkedList(test_list, node_capacity=8)
+            self.assertEqual(len(test_list), len(test_ull))
+            self.assertSequenceEqual(test_list, test_ull)
+            self.assertSequenceEqual(test_list[::-1], list(reversed(test_ull)))
+            self.assertEqual(size, sum(node_sizes(test_ull)))
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(node_capacity=2)
+
+    def test_getitem(self):
+        for size in range(0, 60, 3):
+            test_list = [random() for _ in range(size)]
+            test_ull = UnrolledLinkedList(test_list, node_capacity=8)
+            with self.assertRaises(IndexError):
+                v = test_ull[size]
+            with self.assertRaises(IndexError):
+                v = test_ull[-size - 1]
+            for i in range(-size, size):
+                self.assertEqual(test_list[i], test_ull[i])
+            for step in [-2, -1, 1, 3]:
+                self.assertSequenceEqual(test_list[2:-2:step], test_ull[2:-2:step])
+
+    def test_setitem(self):
+        for size in range(0, 40, 3):
+            test_list = [random() for _ in range(size)]
+            test_ull = UnrolledLinkedList(test_list, node_capacity=8)
+            for i in range(-size, size):
+                v = random()
+                test_list[i] = v
+                test_ull[i] = v
+            self.assertSequenceEqual(test_list, test_ull)
+            test_list[1:5] = [1, 2]
+            test_ull[1:5] = [1, 2]
+            self.assertSequenceEqual(test_list, test_ull)
+
+    def test_model(self):
+        for node_capacity in [4, 5, 8, 64]:
+            for sample in range(5):
+                test_list = []
+                test_ull = UnrolledLinkedList(node_capacity=node_capacity)
+                for s in range(300):
+                    i = randint(-s, s)
+                    v = random()
+                    test_list.insert(i, v)
+                    test_ull.insert(i, v)
+                    self.assertLessEqual(max(node_sizes(test_ull)), node_capacity)
+                self.assertSequenceEqual(test_list, test_ull)
+                while test_list:
+                    i = randint(-len(test_list), len(test_list) - 1)
+                    self.assertEqual(test_list[i], test_ull[i])
+                    del test_list[i]
+                    del test_ull[i]
+                    self.assertEqual(len(test_list), len(test_ull))
+
+                    # every node except the tail stays at least half full
+                    sizes = node_sizes(test_ull)
+                    self.assertNotIn(0, sizes)
+                    self.assertTrue(all(size >= node_capacity // 2 for size in sizes[:-1]))
+                self.assertSequenceEqual(test_list, test_ull)
+                self.assertIsNone(test_ull.head)
+                self.assertIsNone(test_ull.tail)
+
+    def test_append(self):
+        test_ull = UnrolledLinkedList(node_capacity=8)
+        for i in range(100):
+            test_ull.append(i)
+        self.assertSequenceEqual(list(range(100)), test_ull)
+        self.assertEqual([8] * 12 + [4], node_sizes(test_ull))
+
+    def test_delitem_slice(self):
+        for size in range(0, 30, 4):
+            for step in [-2, -1, 1, 3]:
+                test_list = [random() for _ in range(size)]
+                test_ull = UnrolledLinkedList(test_list, node_capacity=4)
+                del test_list[1::step]
+                del test_ull[1::step]
+                self.assertSequenceEqual(test_list, test_ull)
+
+    def test_index(self):
+        test_list = [randint(0, 9) for _ in range(50)]
+        test_ull = UnrolledLinkedList(test_list, node_capacity=4)
+        for value in range(11):
+            for start, stop in [(0, 50), (10, 40), (-20, -5)]:
+                if value in test_list[start:stop]:
+                    self.assertEqual(test_list.index(value, start, stop), test_ull.index(value, start, stop))
+                else:
+                    with self.assertRaises(ValueError):
+                        test_ull.index(value, start, stop)
+            self.assertEqual(test_list.count(value), test_ull.count(value))
+
+    def test_clear_copy(self):
+        test_list = [random() for _ in range(30)]
+        test_ull = UnrolledLinkedList(test_list, node_capacity=4)
+        test_copy = test_ull.copy()
+        test_ull.clear()
+        self.assertSequenceEqual([], test_ull)
+        self.assertSequenceEqual(test_list, test_copy)
+        test_ull.extend(test_list)
+        self.assertSequenceEqual(test_list, test_ull)
+
+
+if __name__ == '__main__':
+    unittest.main()